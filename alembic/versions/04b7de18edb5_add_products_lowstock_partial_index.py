@@ -0,0 +1,32 @@
+"""add products_lowstock partial index
+
+Revision ID: 04b7de18edb5
+Revises: dc54b0aec81f
+Create Date: 2026-10-15 13:41:02.318877
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '04b7de18edb5'
+down_revision: Union[str, None] = 'dc54b0aec81f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'products_lowstock',
+        'products',
+        ['tenant_id', 'stock'],
+        unique=False,
+        postgresql_where=sa.text('is_active AND NOT is_deleted AND stock <= min_stock')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('products_lowstock', table_name='products')
@@ -0,0 +1,32 @@
+"""add partial unique index on suppliers (tenant_id, code)
+
+Revision ID: 070899e77a2b
+Revises: 2252096dcbe8
+Create Date: 2026-10-15 16:41:12.084377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '070899e77a2b'
+down_revision: Union[str, None] = '2252096dcbe8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'suppliers_code_active',
+        'suppliers',
+        ['tenant_id', 'code'],
+        unique=True,
+        postgresql_where=sa.text('is_deleted = false')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('suppliers_code_active', table_name='suppliers')
@@ -0,0 +1,36 @@
+"""add lower() text_pattern_ops indexes for prefix searches
+
+Revision ID: 0a921275b688
+Revises: 6ff5e10983fb
+Create Date: 2026-10-15 15:08:33.127504
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a921275b688'
+down_revision: Union[str, None] = '6ff5e10983fb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LOWER_INDEXES = [
+    ('suppliers_name_lower', 'suppliers', 'name'),
+    ('suppliers_code_lower', 'suppliers', 'code'),
+    ('suppliers_email_lower', 'suppliers', 'email'),
+    ('users_email_lower', 'users', 'email'),
+]
+
+
+def upgrade() -> None:
+    for name, table, column in LOWER_INDEXES:
+        op.create_index(name, table, [sa.text(f'lower({column}) text_pattern_ops')], unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(LOWER_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,38 @@
+"""add keyset pagination indexes for suppliers and users
+
+Revision ID: 2131ce4ba07b
+Revises: edcb5587da8c
+Create Date: 2026-10-15 14:35:51.902146
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2131ce4ba07b'
+down_revision: Union[str, None] = 'edcb5587da8c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_suppliers_tenant_deleted_name_id',
+        'suppliers',
+        ['tenant_id', 'is_deleted', 'name', 'id'],
+        unique=False
+    )
+    op.create_index(
+        'idx_users_tenant_email_id',
+        'users',
+        ['tenant_id', 'email', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_users_tenant_email_id', table_name='users')
+    op.drop_index('idx_suppliers_tenant_deleted_name_id', table_name='suppliers')
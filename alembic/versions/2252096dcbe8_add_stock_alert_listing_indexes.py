@@ -0,0 +1,39 @@
+"""add stock alert listing indexes
+
+Revision ID: 2252096dcbe8
+Revises: 0a921275b688
+Create Date: 2026-10-15 15:26:48.660213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2252096dcbe8'
+down_revision: Union[str, None] = '0a921275b688'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'stock_alerts_active',
+        'stock_alerts',
+        ['tenant_id', 'status', sa.text('created_at DESC')],
+        unique=False
+    )
+    op.create_index(
+        'stock_alerts_unnotified',
+        'stock_alerts',
+        ['tenant_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where=sa.text("status = 'ACTIVE' AND is_notified = false")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('stock_alerts_unnotified', table_name='stock_alerts')
+    op.drop_index('stock_alerts_active', table_name='stock_alerts')
@@ -0,0 +1,44 @@
+"""add trigram indexes for supplier and user searches
+
+Revision ID: 6ff5e10983fb
+Revises: 2131ce4ba07b
+Create Date: 2026-10-15 14:52:07.441930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6ff5e10983fb'
+down_revision: Union[str, None] = '2131ce4ba07b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRGM_INDEXES = [
+    ('suppliers_name_trgm', 'suppliers', 'name'),
+    ('suppliers_code_trgm', 'suppliers', 'code'),
+    ('suppliers_email_trgm', 'suppliers', 'email'),
+    ('users_email_trgm', 'users', 'email'),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRGM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(TRGM_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,44 @@
+"""make products.name trigram index cover deleted products
+
+Revision ID: a0dd16c5b16a
+Revises: 070899e77a2b
+Create Date: 2026-10-16 09:12:37.418205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a0dd16c5b16a'
+down_revision: Union[str, None] = '070899e77a2b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Las búsquedas por nombre en ventas no filtran is_deleted: un índice parcial no aplica
+    op.drop_index('products_name_trgm', table_name='products')
+    op.create_index(
+        'products_name_trgm',
+        'products',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('products_name_trgm', table_name='products')
+    op.create_index(
+        'products_name_trgm',
+        'products',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+        postgresql_where=sa.text('is_deleted = false')
+    )
@@ -0,0 +1,30 @@
+"""make supplier code unique per tenant instead of globally
+
+Revision ID: a59f631d2af1
+Revises: a0dd16c5b16a
+Create Date: 2026-10-16 09:40:05.271934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a59f631d2af1'
+down_revision: Union[str, None] = 'a0dd16c5b16a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # La unicidad la garantiza suppliers_code_active (tenant_id, code) WHERE is_deleted = false;
+    # el índice único global hacía redundante a ese índice y chocaba entre tenants
+    op.drop_index('ix_suppliers_code', table_name='suppliers')
+    op.create_index('ix_suppliers_code', 'suppliers', ['code'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_suppliers_code', table_name='suppliers')
+    op.create_index('ix_suppliers_code', 'suppliers', ['code'], unique=True)
@@ -0,0 +1,42 @@
+"""add covering indexes for category/supplier distributions
+
+Revision ID: ae14e9ad3c41
+Revises: be1e36c87975
+Create Date: 2026-10-15 12:41:09.377520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ae14e9ad3c41'
+down_revision: Union[str, None] = 'be1e36c87975'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'products_tenant_cat_covering',
+        'products',
+        ['tenant_id', 'category_id'],
+        unique=False,
+        postgresql_include=['stock', 'price', 'category_name'],
+        postgresql_where=sa.text('is_deleted = false')
+    )
+    op.create_index(
+        'products_tenant_sup_covering',
+        'products',
+        ['tenant_id', 'supplier_id'],
+        unique=False,
+        postgresql_include=['stock', 'supplier_name'],
+        postgresql_where=sa.text('is_deleted = false')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('products_tenant_sup_covering', table_name='products')
+    op.drop_index('products_tenant_cat_covering', table_name='products')
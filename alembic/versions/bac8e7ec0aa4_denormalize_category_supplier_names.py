@@ -0,0 +1,94 @@
+"""denormalize category and supplier names on products
+
+Revision ID: bac8e7ec0aa4
+Revises: c6b889a3e43a
+Create Date: 2026-10-15 10:03:17.554921
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bac8e7ec0aa4'
+down_revision: Union[str, None] = 'c6b889a3e43a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('products', sa.Column('category_name', sa.String(length=100), nullable=True))
+    op.add_column('products', sa.Column('supplier_name', sa.String(length=200), nullable=True))
+
+    # Backfill
+    op.execute("""
+        UPDATE products p SET category_name = c.name
+        FROM categories c WHERE c.id = p.category_id
+    """)
+    op.execute("""
+        UPDATE products p SET supplier_name = s.name
+        FROM suppliers s WHERE s.id = p.supplier_id
+    """)
+
+    # Productos: copiar el nombre al asignar/cambiar categoría o proveedor
+    op.execute("""
+        CREATE OR REPLACE FUNCTION products_sync_denormalized_names() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' OR NEW.category_id IS DISTINCT FROM OLD.category_id THEN
+                NEW.category_name := (SELECT name FROM categories WHERE id = NEW.category_id);
+            END IF;
+            IF TG_OP = 'INSERT' OR NEW.supplier_id IS DISTINCT FROM OLD.supplier_id THEN
+                NEW.supplier_name := (SELECT name FROM suppliers WHERE id = NEW.supplier_id);
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_products_sync_names
+        BEFORE INSERT OR UPDATE OF category_id, supplier_id ON products
+        FOR EACH ROW EXECUTE FUNCTION products_sync_denormalized_names()
+    """)
+
+    # Categorías / proveedores: propagar renombres
+    op.execute("""
+        CREATE OR REPLACE FUNCTION categories_propagate_name() RETURNS trigger AS $$
+        BEGIN
+            UPDATE products SET category_name = NEW.name WHERE category_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_categories_propagate_name
+        AFTER UPDATE OF name ON categories
+        FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+        EXECUTE FUNCTION categories_propagate_name()
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION suppliers_propagate_name() RETURNS trigger AS $$
+        BEGIN
+            UPDATE products SET supplier_name = NEW.name WHERE supplier_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_suppliers_propagate_name
+        AFTER UPDATE OF name ON suppliers
+        FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+        EXECUTE FUNCTION suppliers_propagate_name()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_suppliers_propagate_name ON suppliers")
+    op.execute("DROP FUNCTION IF EXISTS suppliers_propagate_name()")
+    op.execute("DROP TRIGGER IF EXISTS trg_categories_propagate_name ON categories")
+    op.execute("DROP FUNCTION IF EXISTS categories_propagate_name()")
+    op.execute("DROP TRIGGER IF EXISTS trg_products_sync_names ON products")
+    op.execute("DROP FUNCTION IF EXISTS products_sync_denormalized_names()")
+    op.drop_column('products', 'supplier_name')
+    op.drop_column('products', 'category_name')
@@ -0,0 +1,42 @@
+"""add mv_sales_daily_by_tenant materialized view
+
+Revision ID: be1e36c87975
+Revises: bac8e7ec0aa4
+Create Date: 2026-10-15 11:26:52.904317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'be1e36c87975'
+down_revision: Union[str, None] = 'bac8e7ec0aa4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_sales_daily_by_tenant AS
+        SELECT
+            tenant_id,
+            date(created_at) AS day,
+            status,
+            payment_method,
+            count(*) AS cnt,
+            sum(total_amount) AS revenue
+        FROM sales
+        GROUP BY 1, 2, 3, 4
+    """)
+    # Requerido por REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute("""
+        CREATE UNIQUE INDEX ux_mv_sales_daily_by_tenant
+        ON mv_sales_daily_by_tenant (tenant_id, day, status, payment_method)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_sales_daily_by_tenant")
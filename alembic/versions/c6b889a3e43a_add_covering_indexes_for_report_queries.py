@@ -0,0 +1,42 @@
+"""add covering indexes for report queries
+
+Revision ID: c6b889a3e43a
+Revises: 59f7cb5839b5
+Create Date: 2026-10-15 09:12:41.208113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6b889a3e43a'
+down_revision: Union[str, None] = '59f7cb5839b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Movimientos: filtros por (tenant_id, created_at) ordenados por fecha desc
+    op.create_index(
+        'ix_mv_tenant_created',
+        'inventory_movements',
+        ['tenant_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['movement_type', 'product_id', 'quantity', 'unit_cost']
+    )
+    # Productos: parcial para get_low_stock_products / get_out_of_stock_products
+    op.create_index(
+        'ix_product_tenant_stock_low',
+        'products',
+        ['tenant_id', 'stock'],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false AND is_active = true')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_product_tenant_stock_low', table_name='products')
+    op.drop_index('ix_mv_tenant_created', table_name='inventory_movements')
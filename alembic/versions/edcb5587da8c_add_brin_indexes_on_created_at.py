@@ -0,0 +1,42 @@
+"""add brin indexes on tenant_id, created_at
+
+Revision ID: edcb5587da8c
+Revises: 04b7de18edb5
+Create Date: 2026-10-15 14:02:19.530412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'edcb5587da8c'
+down_revision: Union[str, None] = '04b7de18edb5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'sales_tenant_created_brin',
+        'sales',
+        ['tenant_id', 'created_at'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32}
+    )
+    op.create_index(
+        'inventory_movements_tenant_created_brin',
+        'inventory_movements',
+        ['tenant_id', 'created_at'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('inventory_movements_tenant_created_brin', table_name='inventory_movements')
+    op.drop_index('sales_tenant_created_brin', table_name='sales')
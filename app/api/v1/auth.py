@@ -21,8 +21,7 @@ async def register_tenant(
 ):
     # Verifica email único
     user_repo = UserRepository(db)
-    existing = await user_repo.get_by_email(user_data.email)
-    if existing:
+    if await user_repo.email_exists(user_data.email):
         raise HTTPException(status_code=400, detail="Email already registered")
     
     # Crea tenant + primer user (admin)
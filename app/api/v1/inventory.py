@@ -6,7 +6,9 @@ from ...models.user import User, UserRole
 from ...services.inventory_service import InventoryService
 from ...schemas.product import (
     AddStockRequest,
+    BulkAddStockRequest,
     RemoveStockRequest,
+    BulkRemoveStockRequest,
     AdjustStockRequest,
     InventoryMovementOut
 )
@@ -75,6 +77,22 @@ async def add_stock(
     return movement
 
 
+@router.post("/add-stock/bulk", response_model=List[InventoryMovementOut])
+async def add_stock_bulk(
+    request: BulkAddStockRequest,
+    current_user: User = Depends(require_permission("inventory:adjust")),
+    db: AsyncSession = Depends(get_db)
+):
+    """Agrega stock a varios productos en una sola transacción (Solo Admins/Managers)"""
+    service = InventoryService(db)
+    
+    return await service.add_stock_bulk(
+        updates=[item.model_dump() for item in request.items],
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id
+    )
+
+
 @router.post("/remove-stock", response_model=InventoryMovementOut)
 async def remove_stock(
     request: RemoveStockRequest,
@@ -101,6 +119,24 @@ async def remove_stock(
     return movement
 
 
+@router.post("/remove-stock/bulk", response_model=List[InventoryMovementOut])
+async def remove_stock_bulk(
+    request: BulkRemoveStockRequest,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(require_permission("inventory:adjust")),
+    db: AsyncSession = Depends(get_db)
+):
+    """Remueve stock de varios productos en una sola transacción (Solo Admins/Managers)"""
+    service = InventoryService(db)
+    
+    return await service.remove_stock_bulk(
+        updates=[item.model_dump() for item in request.items],
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        background_tasks=background_tasks
+    )
+
+
 @router.post("/adjust-stock", response_model=InventoryMovementOut)
 async def adjust_stock(
     request: AdjustStockRequest,
@@ -38,7 +38,7 @@ async def mark_notifications_read(
 ):
     """Marca una lista de alertas como notificadas"""
     repo = StockAlertRepository(db)
-    await repo.mark_as_notified(alert_ids)
+    await repo.mark_as_notified(alert_ids, current_user.tenant_id)
     await db.commit()
     return {"status": "success"}
 
@@ -174,7 +174,7 @@ async def get_product_label(
     if not product:
         raise ProductNotFoundException(product_id)
         
-    pdf_buffer = LabelGenerator.generate_pdf([product], labels_per_row=2, rows_per_page=4)
+    pdf_buffer = await LabelGenerator.generate_pdf_async([product], labels_per_row=2, rows_per_page=4)
     filename = f"etiqueta_{product.sku}.pdf"
     
     return StreamingResponse(
@@ -206,7 +206,7 @@ async def get_bulk_labels(
         if not products:
             raise HTTPException(status_code=404, detail="No se encontraron productos")
             
-        pdf_buffer = LabelGenerator.generate_pdf(products)
+        pdf_buffer = await LabelGenerator.generate_pdf_async(products)
         return StreamingResponse(
             pdf_buffer,
             media_type="application/pdf",
@@ -362,7 +362,7 @@ async def get_product_labels(
     # Create a list with the same product repeated 'quantity' times
     products_list = [product for _ in range(quantity)]
     
-    pdf_buffer = LabelGenerator.generate_pdf(products_list)
+    pdf_buffer = await LabelGenerator.generate_pdf_async(products_list)
     
     filename = f"Etiquetas_{product.sku}_{datetime.now().strftime('%Y%m%d')}.pdf"
     
@@ -397,7 +397,7 @@ async def get_bulk_labels(
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="No se encontraron productos")
         
-    pdf_buffer = LabelGenerator.generate_pdf(products)
+    pdf_buffer = await LabelGenerator.generate_pdf_async(products)
     
     filename = f"Etiquetas_Masivas_{datetime.now().strftime('%Y%m%d')}.pdf"
     
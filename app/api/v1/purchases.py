@@ -194,7 +194,7 @@ async def export_purchase_pdf(
     tenant = await t_repo.get_by_id(tenant_id)
     tenant_name = tenant.name if tenant else "Mi Negocio"
     
-    pdf_buffer = ReportGenerator.generate_purchase_order_pdf(purchase, tenant_name)
+    pdf_buffer = await ReportGenerator.generate_purchase_order_pdf_async(purchase, tenant_name)
     
     filename = f"Orden_Compra_{purchase_id}.pdf"
     
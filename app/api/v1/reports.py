@@ -220,7 +220,6 @@ async def export_suppliers_excel(
     from ...repositories.tenant_repo import TenantRepository
     repo = SupplierRepository(db)
     t_repo = TenantRepository(db)
-    suppliers, _ = await repo.get_filtered(tenant_id=tenant_id, search=search, is_active=is_active, start_date=start_date, end_date=end_date)
     tenant = await t_repo.get_by_id(tenant_id)
     
     wb = Workbook()
@@ -254,10 +253,13 @@ async def export_suppliers_excel(
         cell.alignment = center_alignment
         cell.border = thin_border
 
-    for idx, s in enumerate(suppliers, start=5):
+    # Los proveedores se leen por lotes desde un cursor del servidor
+    idx = 5
+    async for s in repo.iter_filtered(tenant_id=tenant_id, search=search, is_active=is_active, start_date=start_date, end_date=end_date):
         row = [s.id, s.code, s.name, s.email, s.phone, s.tax_id, "ACTIVO" if s.is_active else "INACTIVO", s.created_at.strftime('%d/%m/%Y %H:%M')]
         ws.append(row)
         for cell in ws[idx]: cell.border = thin_border
+        idx += 1
 
     for col in ws.columns: ws.column_dimensions[get_column_letter(col[0].column)].width = 18
 
@@ -457,13 +459,6 @@ async def export_sales_excel(
     repo = ReportRepository(db)
     t_repo = TenantRepository(db)
     
-    sales = await repo.get_filtered_sales(
-        tenant_id=tenant_id,
-        start_date=start_date,
-        end_date=end_date,
-        status=status,
-        payment_method=payment_method
-    )
     tenant = await t_repo.get_by_id(tenant_id)
     
     wb = Workbook()
@@ -497,19 +492,27 @@ async def export_sales_excel(
         cell.alignment = center_alignment
         cell.border = thin_border
 
-    for idx, s in enumerate(sales, start=5):
-        items_summary = ", ".join([f"{item.product.name} (x{item.quantity})" for item in s.items if item.product])
+    # Las ventas se leen por lotes con un cursor del servidor y se escriben a medida que llegan
+    sales = repo.iter_filtered_sales(
+        tenant_id=tenant_id,
+        start_date=start_date,
+        end_date=end_date,
+        status=status,
+        payment_method=payment_method
+    )
+    async for s in sales:
+        items_summary = ", ".join([f"{item['product_name']} (x{item['quantity']})" for item in s["items"]])
         row = [
-            s.id, 
-            s.created_at.strftime('%d/%m/%Y %H:%M'), 
-            s.payment_method.upper(), 
-            s.user.email.split('@')[0] if s.user else "N/A",
-            s.status.upper(),
+            s["id"], 
+            s["created_at"].strftime('%d/%m/%Y %H:%M'), 
+            s["payment_method"].upper(), 
+            s["seller"] or "N/A",
+            s["status"].upper(),
             items_summary,
-            float(s.total_amount)
+            float(s["total_amount"])
         ]
         ws.append(row)
-        for cell in ws[idx]: 
+        for cell in ws[ws.max_row]: 
             cell.border = thin_border
             if cell.column == 7: cell.number_format = '"$"#,##0.00'
 
@@ -542,27 +545,6 @@ async def export_sales_pdf(
     repo = ReportRepository(db)
     t_repo = TenantRepository(db)
     
-    # Nota: He actualizado el repo de reportes para soportar 'search' en la consulta si es necesario, 
-    # pero para el reporte PDF usaremos una lógica similar al excel.
-    # Primero obtenemos las ventas.
-    from ...repositories.sale_repo import SaleRepository
-    s_repo = SaleRepository(db)
-    
-    # Obtenemos todas las ventas filtradas (sin paginación para el reporte completo)
-    # Reutilizamos la lógica del repo de ventas pero sin offset/limit
-    sales, _ = await s_repo.get_sales_paginated(
-        tenant_id=tenant_id,
-        pagination=PaginationParams(page=1, page_size=500), # Un límite razonable para el PDF
-        start_date=start_date,
-        end_date=end_date,
-        status=status,
-        payment_method=payment_method,
-        search=search
-    )
-    
-    tenant = await t_repo.get_by_id(tenant_id)
-    tenant_name = tenant.name if tenant else "Inventory Administration"
-    
     filters = {
         "start_date": start_date,
         "end_date": end_date,
@@ -571,7 +553,25 @@ async def export_sales_pdf(
         "search": search
     }
     
-    pdf_buffer = ReportGenerator.generate_sales_summary_pdf(sales, tenant_name, filters)
+    tenant = await t_repo.get_by_id(tenant_id)
+    tenant_name = tenant.name if tenant else "Inventory Administration"
+    
+    # Marca de agua barata (MAX(updated_at), COUNT): si no cambió, se sirve el PDF cacheado
+    watermark = await repo.get_sales_watermark(tenant_id=tenant_id, **filters)
+    cache_key = (tenant_id, tenant_name, tuple(filters.items()), watermark)
+    
+    async def load_sales():
+        # Solo las columnas impresas, como tuplas; el total se calcula en SQL
+        return await repo.get_sales_summary_rows(
+            tenant_id=tenant_id,
+            **filters,
+            limit=500 # Un límite razonable para el PDF
+        )
+    
+    # Se imprime la última actualización de los datos (no "ahora"): el PDF puede venir del caché
+    pdf_buffer = await ReportGenerator.get_sales_summary_pdf_cached(
+        cache_key, load_sales, tenant_name, filters, data_as_of=watermark[0]
+    )
     
     filename = f"Reporte_Ventas_{datetime.now().strftime('%Y%m%d')}.pdf"
     
@@ -722,7 +722,7 @@ async def export_expenses_pdf(
         "search": search
     }
     
-    pdf_buffer = ReportGenerator.generate_expenses_pdf(expenses, tenant_name, filters)
+    pdf_buffer = await ReportGenerator.generate_expenses_pdf_async(expenses, tenant_name, filters)
     filename = f"Reporte_Gastos_{datetime.now().strftime('%Y%m%d')}.pdf"
     
     return StreamingResponse(
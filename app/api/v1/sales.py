@@ -1,15 +1,18 @@
-from fastapi import APIRouter, Depends, Query, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, Query, HTTPException, BackgroundTasks, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
+import hashlib
+import re
 
 from ...models import get_db
+from ...core.config import settings
 from ...dependencies import get_current_tenant, get_current_user, require_role, require_permission
 from ...schemas.sale import SaleCreate, SaleResponse, PaginatedSaleResponse
 from ...repositories.sale_repo import SaleRepository
 from ...repositories.tenant_repo import TenantRepository
 from ...models.user import User, UserRole
 from ...services.ticket_generator import TicketGenerator
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
 
 from datetime import datetime
 
@@ -87,9 +90,24 @@ async def get_sale(
         raise HTTPException(status_code=404, detail="Venta no encontrada")
     return sale
 
+_ETAG_RE = re.compile(r'(?:W/)?("[^"]*")')
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evalúa If-None-Match según RFC 9110: acepta '*', listas separadas por comas y
+    etiquetas débiles (W/"..."), que se comparan en forma débil contra el ETag
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in _ETAG_RE.findall(if_none_match)
+
 @router.get("/{sale_id}/ticket")
 async def get_sale_ticket(
     sale_id: int,
+    if_none_match: Optional[str] = Header(None),
     tenant_id: int = Depends(get_current_tenant),
     db: AsyncSession = Depends(get_db)
 ):
@@ -104,15 +122,49 @@ async def get_sale_ticket(
     tenant = await tenant_repo.get_by_id(tenant_id)
     tenant_name = tenant.name if tenant else "Mi Negocio"
     
-    pdf_buffer = TicketGenerator.generate_ticket(sale, tenant_name)
+    # Ambos motores pasan por el caché y el pool de procesos (fuera del event loop)
+    pdf_bytes = await TicketGenerator.generate_ticket_async(
+        sale, tenant_name, engine=settings.ticket_pdf_engine
+    )
+    
+    # El PDF es determinista: su hash sirve de ETag para que navegador o spool de
+    # impresión reutilicen su copia en una reimpresión (304 sin cuerpo)
+    etag = f'"{hashlib.blake2b(pdf_bytes, digest_size=16).hexdigest()}"'
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
     
     filename = f"Ticket_{sale_id}_{datetime.now().strftime('%Y%m%d')}.pdf"
     
-    return StreamingResponse(
-        pdf_buffer,
+    # El ticket ya está completo en memoria: se responde con los bytes, sin BytesIO intermedio
+    return Response(
+        content=pdf_bytes,
         media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+        headers={"Content-Disposition": f"attachment; filename={filename}", "ETag": etag}
+    )
+
+@router.get("/{sale_id}/ticket/escpos")
+async def get_sale_ticket_escpos(
+    sale_id: int,
+    tenant_id: int = Depends(get_current_tenant),
+    db: AsyncSession = Depends(get_db)
+):
+    """Genera el ticket de una venta en bytes ESC/POS para impresoras térmicas (sin PDF)"""
+    sale_repo = SaleRepository(db)
+    tenant_repo = TenantRepository(db)
+    
+    sale = await sale_repo.get_by_id(sale_id, tenant_id)
+    if not sale:
+        raise HTTPException(status_code=404, detail="Venta no encontrada")
+    
+    tenant = await tenant_repo.get_by_id(tenant_id)
+    tenant_name = tenant.name if tenant else "Mi Negocio"
+    
+    return Response(
+        content=TicketGenerator.generate_ticket_escpos(sale, tenant_name),
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f"attachment; filename=Ticket_{sale_id}.bin"}
     )
+
 @router.post("/{sale_id}/annul", response_model=SaleResponse)
 async def annul_sale(
     sale_id: int,
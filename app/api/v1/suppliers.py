@@ -1,5 +1,7 @@
+from functools import lru_cache
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, status, HTTPException
+from fastapi import APIRouter, Depends, Query, status, HTTPException, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...models import get_db
@@ -11,17 +13,34 @@ from ...schemas.supplier import (
     SupplierOut,
     SupplierSummary
 )
-from ...core.pagination import PaginationParams, PaginatedResponse, create_pagination_metadata
+from ...core.pagination import CursorPaginationParams, PaginatedResponse, create_pagination_metadata, next_cursor_for
 from ...core.exceptions import SupplierNotFoundException, DuplicateResourceException
 from ...core.logging_config import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Validador/serializador de listas compilado una sola vez para los listados masivos
+_supplier_summary_list = TypeAdapter(List[SupplierSummary])
+
+
+@lru_cache(maxsize=4096)
+def _supplier_summary(
+    id: int, name: str, code: str, email: Optional[str], phone: Optional[str], is_active: bool
+) -> SupplierSummary:
+    """
+    Resumen de proveedor memoizado por el contenido completo de la fila.
+    Cualquier cambio en la fila genera otra clave, así que nunca se sirve un valor obsoleto;
+    el schema es inmutable (frozen) y la instancia puede compartirse entre peticiones.
+    """
+    return SupplierSummary.model_construct(
+        id=id, name=name, code=code, email=email, phone=phone, is_active=is_active
+    )
+
 
 @router.get("/", response_model=PaginatedResponse[SupplierOut])
 async def list_suppliers(
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(),
     search: Optional[str] = Query(None, description="Buscar por nombre, código o email"),
     is_active: Optional[bool] = Query(None, description="Filtrar por estado activo/inactivo"),
     tenant_id: int = Depends(get_current_tenant),
@@ -39,11 +58,13 @@ async def list_suppliers(
     )
     
     return PaginatedResponse(
-        items=suppliers,
+        items=[SupplierOut.from_row(supplier) for supplier in suppliers],
         metadata=create_pagination_metadata(
             total_items=total,
             page=pagination.page,
-            page_size=pagination.page_size
+            page_size=pagination.page_size,
+            next_cursor=next_cursor_for(suppliers, pagination, "name", "id"),
+            cursor=pagination.cursor
         )
     )
 
@@ -58,8 +79,7 @@ async def create_supplier(
     repo = SupplierRepository(db)
     
     # Verificar si el código ya existe
-    existing = await repo.get_by_code(supplier.code, tenant_id)
-    if existing:
+    if await repo.code_exists(supplier.code, tenant_id):
         raise DuplicateResourceException("Proveedor", "code", supplier.code)
     
     # Crear proveedor
@@ -81,8 +101,13 @@ async def get_active_suppliers(
 ):
     """Obtiene solo los proveedores activos (para dropdowns)"""
     repo = SupplierRepository(db)
-    suppliers = await repo.get_active_suppliers(tenant_id)
-    return suppliers
+    rows = await repo.list_summary(tenant_id)
+    # Serializa la lista directamente a JSON en pydantic-core, sin la segunda pasada del response_model
+    summaries = [
+        _supplier_summary(row.id, row.name, row.code, row.email, row.phone, row.is_active)
+        for row in rows
+    ]
+    return Response(content=_supplier_summary_list.dump_json(summaries), media_type="application/json")
 
 
 @router.get("/search", response_model=List[SupplierOut])
@@ -100,7 +125,7 @@ async def search_suppliers(
     pagination = PaginationParams(page=1, size=limit)
     
     suppliers, _ = await repo.search(q, tenant_id, pagination)
-    return suppliers
+    return [SupplierOut.from_row(supplier) for supplier in suppliers]
 
 
 @router.get("/{supplier_id}", response_model=SupplierOut)
@@ -136,8 +161,7 @@ async def update_supplier(
     
     # Verificar código único si se actualiza
     if supplier_update.code and supplier_update.code != supplier.code:
-        existing = await repo.get_by_code(supplier_update.code, tenant_id)
-        if existing and existing.id != supplier_id:
+        if await repo.code_exists(supplier_update.code, tenant_id):
             raise DuplicateResourceException("Proveedor", "code", supplier_update.code)
     
     # Actualizar
@@ -13,7 +13,7 @@ from ...repositories.user_repo import UserRepository
 from ...schemas.user import UserCreate, UserUpdate, UserOut
 from ...core.security import get_password_hash
 from ...core.logging_config import get_logger
-from ...core.pagination import PaginationParams, PaginatedResponse, create_pagination_metadata
+from ...core.pagination import CursorPaginationParams, PaginatedResponse, create_pagination_metadata, next_cursor_for
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -88,7 +88,7 @@ async def upload_current_user_avatar(
 
 @router.get("/", response_model=PaginatedResponse[UserOut])
 async def list_users(
-    pagination: PaginationParams = Depends(),
+    pagination: CursorPaginationParams = Depends(),
     search: Optional[str] = Query(None, description="Buscar por email o nombre completo"),
     is_active: Optional[bool] = Query(None, description="Filtrar por estado activo"),
     start_date: Optional[datetime] = Query(None),
@@ -109,7 +109,11 @@ async def list_users(
         pagination=pagination
     )
     
-    metadata = create_pagination_metadata(pagination.page, pagination.page_size, total)
+    metadata = create_pagination_metadata(
+        pagination.page, pagination.page_size, total,
+        next_cursor=next_cursor_for(items, pagination, "email", "id"),
+        cursor=pagination.cursor
+    )
     return PaginatedResponse(items=items, metadata=metadata)
 
 @router.post("/", response_model=UserOut, status_code=status.HTTP_201_CREATED)
@@ -123,8 +127,7 @@ async def create_user(
     repo = UserRepository(db)
     
     # Verificar email único globalmente
-    existing = await repo.get_by_email(user_data.email)
-    if existing:
+    if await repo.email_exists(user_data.email):
         raise HTTPException(status_code=400, detail="Email already registered")
     
     user_dict = user_data.model_dump()
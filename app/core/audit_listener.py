@@ -142,7 +142,11 @@ def dispatch_audit_log(action: str, target, old_values=None, new_values=None):
 def setup_audit_listeners(Base):
     """
     Configura los event listeners en la clase Base.
+    Es idempotente: un segundo llamado (otro lifespan, tests) no duplica los audit logs.
     """
+    if getattr(Base, "_audit_listeners_installed", False):
+        return
+    Base._audit_listeners_installed = True
         
     @event.listens_for(Base, "after_insert", propagate=True)
     def receive_after_insert(mapper, connection, target):
@@ -1,8 +1,15 @@
 import json
+import copy
+import time
+import asyncio
+import inspect
 import hashlib
-from typing import Any, Optional, Callable
+from datetime import datetime
+from typing import Any, Optional, Callable, Dict, Tuple
 from functools import wraps
 import redis.asyncio as redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from .config import settings
 from .logging_config import get_logger
 
@@ -162,3 +169,129 @@ async def invalidate_cache(pattern: str):
     deleted = await cache_manager.delete_pattern(pattern)
     logger.info(f"Invalidadas {deleted} claves de caché con patrón: {pattern}")
     return deleted
+
+
+
+# ---------------------------------------------------------------------------
+# Caché en memoria (por proceso) para agregados de reportes
+# ---------------------------------------------------------------------------
+
+# Versión por tenant: se incrementa en cada escritura relevante (ver REPORT_SOURCE_TABLES)
+# para invalidar de inmediato las entradas cacheadas de ese tenant.
+_tenant_versions: Dict[int, int] = {}
+
+
+def get_tenant_version(tenant_id: int) -> int:
+    """Retorna la versión actual de datos del tenant"""
+    return _tenant_versions.get(tenant_id, 0)
+
+
+def bump_tenant_version(tenant_id: int) -> None:
+    """Invalida los agregados cacheados en memoria de un tenant"""
+    _tenant_versions[tenant_id] = _tenant_versions.get(tenant_id, 0) + 1
+
+
+# Tablas de las que salen los agregados cacheados (stock, valorización, movimientos, compras,
+# ventas, distribuciones). Cualquier escritura ORM sobre ellas invalida al tenant al confirmar,
+# sin depender de que cada camino de escritura llame a bump_tenant_version
+REPORT_SOURCE_TABLES = frozenset({
+    "products", "inventory_movements", "sales", "purchases", "categories", "suppliers", "tenants",
+})
+
+
+def mark_report_write(session, table: str, tenant_id: Optional[int]) -> None:
+    """
+    Anota un tenant cuyos agregados cambian al confirmar la transacción. Lo usan el flush del
+    ORM y las sentencias UPDATE/DELETE directas, que no pasan por los eventos de flush.
+    """
+    if table in REPORT_SOURCE_TABLES and tenant_id is not None:
+        session.info.setdefault("report_dirty_tenants", set()).add(tenant_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_report_writes(session, flush_context) -> None:
+    """Anota los tenants con escrituras ORM sobre REPORT_SOURCE_TABLES en esta transacción"""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        tenant_id = getattr(obj, "id" if table == "tenants" else "tenant_id", None)
+        mark_report_write(session, table, tenant_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_report_versions(session) -> None:
+    """Invalida los agregados de los tenants modificados una vez confirmados los datos"""
+    for tenant_id in session.info.pop("report_dirty_tenants", ()):
+        bump_tenant_version(tenant_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_report_writes(session) -> None:
+    session.info.pop("report_dirty_tenants", None)
+
+
+def _bucket(value: Any) -> Any:
+    """Redondea datetimes al minuto para obtener claves estables"""
+    if isinstance(value, datetime):
+        return value.replace(second=0, microsecond=0)
+    return value
+
+
+def async_ttl_cache(ttl: int = 60, maxsize: int = 1024):
+    """
+    Decorador de memoización con TTL para métodos async de repositorios de reportes.
+
+    La clave es (método, tenant_id, resto de argumentos con fechas redondeadas al
+    minuto, versión del tenant). Un lock por clave evita que varias peticiones
+    concurrentes recalculen el mismo agregado (dogpile).
+
+    Usage:
+        @async_ttl_cache(ttl=60)
+        async def get_dashboard_stats(self, tenant_id: int, ...):
+            ...
+    """
+    def decorator(func: Callable):
+        signature = inspect.signature(func)
+        entries: Dict[Tuple, Tuple[float, Any]] = {}
+        locks: Dict[Tuple, asyncio.Lock] = {}
+
+        def make_key(args, kwargs) -> Tuple:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = list(bound.arguments.items())[1:]  # omitir self
+            tenant_id = params[0][1]
+            normalized = tuple((name, _bucket(value)) for name, value in params)
+            return (func.__qualname__, normalized, get_tenant_version(tenant_id))
+
+        def evict(now: float) -> None:
+            for key in [k for k, (expires, _) in entries.items() if expires <= now]:
+                entries.pop(key, None)
+                locks.pop(key, None)
+            while len(entries) >= maxsize:
+                oldest = next(iter(entries))
+                entries.pop(oldest, None)
+                locks.pop(oldest, None)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+
+            hit = entries.get(key)
+            if hit and hit[0] > time.monotonic():
+                return copy.deepcopy(hit[1])
+
+            lock = locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                # Otra petición pudo haberlo calculado mientras esperábamos
+                hit = entries.get(key)
+                now = time.monotonic()
+                if hit and hit[0] > now:
+                    return copy.deepcopy(hit[1])
+
+                result = await func(*args, **kwargs)
+                evict(now)
+                entries[key] = (now + ttl, copy.deepcopy(result))
+                return result
+
+        wrapper.cache_clear = lambda: (entries.clear(), locks.clear())
+        return wrapper
+    return decorator
@@ -44,6 +44,12 @@ class Settings(BaseSettings):
     redis_url: str = "redis://localhost:6379/0"
     redis_cache_ttl: int = 300  # 5 minutos
     
+    # Reportes
+    sales_rollup_refresh_seconds: int = 300  # Refresco de mv_sales_daily_by_tenant
+    report_tenant_max_connections: int = 4  # Consultas de reporte simultáneas por tenant
+    ticket_pdf_engine: str = "reportlab"  # reportlab, fpdf2 (motor del ticket PDF de ventas)
+    ticket_pool_workers: int = 2  # Procesos para renderizar tickets, por worker web
+    
     # Rate Limiting
     rate_limit_enabled: bool = True
     rate_limit_per_minute: int = 60
@@ -85,6 +85,16 @@ class TenantMismatchException(InventoryBaseException):
         )
 
 
+class InvalidCursorException(InventoryBaseException):
+    """Cursor de paginación por keyset mal formado o de otro listado"""
+    
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor de paginación inválido"
+        )
+
+
 class ValidationException(InventoryBaseException):
     """Error de validación de datos"""
     
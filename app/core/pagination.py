@@ -1,8 +1,13 @@
-from typing import Generic, TypeVar, List, Optional
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Generic, TypeVar, List, Optional, Any
 from pydantic import BaseModel, Field
-from sqlalchemy import select, func
+from sqlalchemy import select, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from .config import settings
+from .exceptions import InvalidCursorException
 
 T = TypeVar("T")
 
@@ -28,14 +33,23 @@ class PaginationParams(BaseModel):
         return self.page_size
 
 
+class CursorPaginationParams(PaginationParams):
+    """Parámetros de paginación para listados que admiten paginación por keyset (seek_paginate)"""
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor devuelto en la página anterior (paginación por keyset, omite el conteo total)"
+    )
+
+
 class PageMetadata(BaseModel):
     """Metadata de paginación"""
     page: int
     page_size: int
-    total_items: int
-    total_pages: int
+    total_items: Optional[int]
+    total_pages: Optional[int]
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -44,6 +58,13 @@ class PaginatedResponse(BaseModel, Generic[T]):
     metadata: PageMetadata
 
 
+async def count_rows(db: AsyncSession, query) -> int:
+    """Cuenta las filas de una consulta con SELECT COUNT(*) sobre la misma (sin ORDER BY)"""
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    result = await db.execute(count_query)
+    return result.scalar() or 0
+
+
 async def paginate(
     db: AsyncSession,
     query,
@@ -63,10 +84,7 @@ async def paginate(
         Tupla con (items, total_count)
     """
     # Obtener total de items
-    count_query = select(func.count()).select_from(query.order_by(None).subquery())
-    
-    total_result = await db.execute(count_query)
-    total_count = total_result.scalar() or 0
+    total_count = await count_rows(db, query)
     
     # Aplicar paginación
     paginated_query = query.offset(pagination.offset).limit(pagination.limit)
@@ -76,10 +94,82 @@ async def paginate(
     return items, total_count
 
 
+def encode_cursor(*values: Any) -> str:
+    """Codifica los valores de la clave de orden de la última fila en un cursor opaco"""
+    return base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode()
+
+
+def _cursor_value(column, value: Any) -> Any:
+    """Convierte un valor del cursor al tipo Python de su columna (ValueError/TypeError si no encaja)"""
+    python_type = column.type.python_type
+    if isinstance(value, python_type):
+        return value
+    # encode_cursor serializa fechas y decimales como texto
+    if isinstance(value, str) and python_type is datetime:
+        return datetime.fromisoformat(value)
+    if isinstance(value, str) and python_type is Decimal:
+        return Decimal(value)
+    raise TypeError(value)
+
+
+def decode_cursor(cursor: str, *sort_columns) -> tuple:
+    """
+    Decodifica un cursor generado por encode_cursor para la clave de orden `sort_columns`.
+    Un cursor mal formado, con otra cantidad de valores o con tipos que no corresponden a
+    las columnas lanza InvalidCursorException (400) en lugar de llegar a la base de datos.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(sort_columns):
+            raise ValueError(cursor)
+        return tuple(_cursor_value(column, value) for column, value in zip(sort_columns, values))
+    except (ValueError, TypeError, NotImplementedError, InvalidOperation):
+        raise InvalidCursorException()
+
+
+def next_cursor_for(items: List, pagination: CursorPaginationParams, *attrs: str) -> Optional[str]:
+    """Cursor para la página siguiente a partir de la última fila (None si no hay más)"""
+    if not items or len(items) < pagination.page_size:
+        return None
+    last = items[-1]
+    return encode_cursor(*(getattr(last, attr) for attr in attrs))
+
+
+async def seek_paginate(
+    db: AsyncSession,
+    query,
+    pagination: CursorPaginationParams,
+    *sort_columns
+) -> tuple[List, None]:
+    """
+    Paginación por keyset: WHERE (col1, col2) > (cursor) ORDER BY col1, col2 LIMIT n
+    
+    El costo no depende de la profundidad de la página y no se ejecuta COUNT(*),
+    por eso el total se devuelve como None.
+    
+    Args:
+        db: Sesión de base de datos
+        query: Query de SQLAlchemy (sin ORDER BY)
+        pagination: Parámetros de paginación (con cursor)
+        sort_columns: Columnas de la clave de orden, la última debe ser única (ej. id)
+    
+    Returns:
+        Tupla con (items, None)
+    """
+    if pagination.cursor:
+        query = query.where(tuple_(*sort_columns) > tuple_(*decode_cursor(pagination.cursor, *sort_columns)))
+    
+    query = query.order_by(*sort_columns).limit(pagination.limit)
+    result = await db.execute(query)
+    return result.scalars().all(), None
+
+
 def create_pagination_metadata(
     page: int,
     page_size: int,
-    total_items: int
+    total_items: Optional[int],
+    next_cursor: Optional[str] = None,
+    cursor: Optional[str] = None
 ) -> PageMetadata:
     """
     Crea metadata de paginación
@@ -87,11 +177,24 @@ def create_pagination_metadata(
     Args:
         page: Número de página actual
         page_size: Tamaño de página
-        total_items: Total de items
+        total_items: Total de items (None en paginación por keyset)
+        next_cursor: Cursor para pedir la página siguiente
+        cursor: Cursor recibido en la petición (sin él es la primera página del keyset)
     
     Returns:
         PageMetadata con información de paginación
     """
+    if total_items is None:
+        return PageMetadata(
+            page=page,
+            page_size=page_size,
+            total_items=None,
+            total_pages=None,
+            has_next=next_cursor is not None,
+            has_previous=cursor is not None,
+            next_cursor=next_cursor
+        )
+    
     total_pages = (total_items + page_size - 1) // page_size if total_items > 0 else 0
     
     return PageMetadata(
@@ -100,5 +203,6 @@ def create_pagination_metadata(
         total_items=total_items,
         total_pages=total_pages,
         has_next=page < total_pages,
-        has_previous=page > 1
+        has_previous=page > 1,
+        next_cursor=next_cursor
     )
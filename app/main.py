@@ -1,8 +1,9 @@
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 import os
+import asyncio
 from contextlib import asynccontextmanager
 from .api.v1 import (
     auth, products, categories, suppliers, inventory,
@@ -18,6 +19,7 @@ from .core.cache import cache_manager
 from .core.exceptions import InventoryBaseException
 from .core.context_middleware import ContextMiddleware
 from .core.audit_listener import setup_audit_listeners
+from .services.ticket_generator import shutdown_ticket_pool
 from .models.base import Base
 import logging
 import sentry_sdk
@@ -39,6 +41,44 @@ if settings.sentry_dsn:
     logger.info("Sentry instrumentado correctamente")
 
 
+# Advisory lock (de sesión) que elige al único worker que refresca las vistas de reportes
+SALES_ROLLUP_LOCK_KEY = 7_204_113
+
+
+async def refresh_sales_rollups():
+    """
+    Refresca periódicamente las vistas materializadas de reportes. Todos los workers web
+    corren este bucle, pero solo refresca el que obtiene el advisory lock y lo conserva en
+    su conexión; si esa conexión se cae, el lock se libera y otro worker lo toma en el
+    siguiente ciclo.
+    """
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from .models.base import engine
+    from .repositories.report_repo import ReportRepository
+
+    lock = {"key": SALES_ROLLUP_LOCK_KEY}
+    while True:
+        await asyncio.sleep(settings.sales_rollup_refresh_seconds)
+        try:
+            async with engine.connect() as conn:
+                is_leader = await conn.scalar(text("SELECT pg_try_advisory_lock(:key)"), lock)
+                await conn.commit()
+                if not is_leader:
+                    continue
+                try:
+                    repo = ReportRepository(AsyncSession(bind=conn, expire_on_commit=False))
+                    while True:
+                        await repo.refresh_sales_daily_view()
+                        await asyncio.sleep(settings.sales_rollup_refresh_seconds)
+                finally:
+                    # La conexión vuelve al pool: el lock de sesión no debe quedar tomado
+                    await conn.execute(text("SELECT pg_advisory_unlock(:key)"), lock)
+                    await conn.commit()
+        except Exception as e:
+            logger.warning(f"No se pudo refrescar mv_sales_daily_by_tenant: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manejo de eventos de inicio y cierre"""
@@ -228,6 +268,15 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error creando tablas de traslados: {e}")
 
+        logger.info("Creando vista materializada de ventas si no existe...")
+        try:
+            from .models.sale import SALES_DAILY_VIEW_DDL
+            for statement in SALES_DAILY_VIEW_DDL:
+                await conn.execute(text(statement))
+            logger.info("Vista mv_sales_daily_by_tenant verificada")
+        except Exception as e:
+            logger.error(f"Error creando la vista de ventas: {e}")
+
         logger.info("Creando tablas de auditoría de inventario...")
         try:
             from .models.inventory_audit import InventoryAudit, InventoryAuditItem
@@ -381,12 +430,15 @@ async def lifespan(app: FastAPI):
         logger.info("Sincronización de usuarios completada")
 
     await cache_manager.connect()
+    rollup_task = asyncio.create_task(refresh_sales_rollups())
     logger.info("Aplicación iniciada correctamente")
     
     yield
     
     # Shutdown
     logger.info("Cerrando aplicación...")
+    rollup_task.cancel()
+    shutdown_ticket_pool()
     await cache_manager.disconnect()
     logger.info("Aplicación cerrada")
 
@@ -395,7 +447,10 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Sistema de inventario multi-tenant con FastAPI",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Serializa las respuestas en C con orjson (datetime nativo). orjson no soporta Decimal:
+    # funciona porque FastAPI pasa antes el contenido por pydantic/jsonable_encoder
+    default_response_class=ORJSONResponse
 )
 
 # Middlewares
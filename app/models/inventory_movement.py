@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Enum, Index, Text, Numeric
+from sqlalchemy import Column, Integer, String, ForeignKey, Enum, Index, Text, Numeric, text
 from sqlalchemy.orm import relationship
 from .base import TimestampMixin
 from .base import Base
@@ -55,6 +55,17 @@ class InventoryMovement(Base, TimestampMixin):
         Index('idx_movements_tenant_type', 'tenant_id', 'movement_type'),
         Index('idx_movements_tenant_date', 'tenant_id', 'created_at'),
         Index('idx_movements_product_date', 'product_id', 'created_at'),
+        # Índice cubriente para dashboards/tendencias (index-only scan por rango de fechas)
+        Index(
+            'ix_mv_tenant_created', 'tenant_id', text('created_at DESC'), text('id DESC'),
+            postgresql_include=['movement_type', 'product_id', 'quantity', 'unit_cost']
+        ),
+        # BRIN para rangos amplios por fecha (tabla de solo inserción, ordenada por created_at)
+        Index(
+            'inventory_movements_tenant_created_brin', 'tenant_id', 'created_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        ),
     )
     
     @property
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Index, Numeric, Text, Boolean
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Index, Numeric, Text, Boolean, text, event, DDL
 from sqlalchemy.orm import relationship
 from .base import Base, TimestampMixin, SoftDeleteMixin
 
@@ -11,6 +11,10 @@ class Product(Base, TimestampMixin, SoftDeleteMixin):
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=True, index=True)
     supplier_id = Column(Integer, ForeignKey("suppliers.id"), nullable=True, index=True)
     
+    # Desnormalizados (mantenidos por triggers) para evitar joins en los reportes
+    category_name = Column(String(100), nullable=True)
+    supplier_name = Column(String(200), nullable=True)
+    
     # Información básica
     name = Column(String(200), nullable=False, index=True)
     sku = Column(String(50), unique=True, index=True, nullable=False)
@@ -47,6 +51,34 @@ class Product(Base, TimestampMixin, SoftDeleteMixin):
         Index('idx_products_tenant_category', 'tenant_id', 'category_id'),
         Index('idx_products_tenant_active', 'tenant_id', 'is_active'),
         Index('idx_products_tenant_stock', 'tenant_id', 'stock'),
+        # Índice parcial para listados de stock bajo / sin stock (ORDER BY stock ASC)
+        Index(
+            'ix_product_tenant_stock_low', 'tenant_id', 'stock',
+            postgresql_where=text('is_deleted = false AND is_active = true')
+        ),
+        # Solo productos bajo su mínimo: el top-N de stock bajo es una lectura directa del índice
+        Index(
+            'products_lowstock', 'tenant_id', 'stock',
+            postgresql_where=text('is_active AND NOT is_deleted AND stock <= min_stock')
+        ),
+        # Índices parciales cubrientes para las distribuciones por categoría/proveedor
+        Index(
+            'products_tenant_cat_covering', 'tenant_id', 'category_id',
+            postgresql_include=['stock', 'price', 'category_name'],
+            postgresql_where=text('is_deleted = false')
+        ),
+        Index(
+            'products_tenant_sup_covering', 'tenant_id', 'supplier_id',
+            postgresql_include=['stock', 'supplier_name'],
+            postgresql_where=text('is_deleted = false')
+        ),
+        # Trigramas para búsquedas ILIKE '%texto%' por nombre (pg_trgm, ver models/base.py).
+        # Sin predicado: la búsqueda de ventas también encuentra productos eliminados
+        Index(
+            'products_name_trgm', 'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'}
+        ),
     )
     
     @property
@@ -67,4 +99,62 @@ class Product(Base, TimestampMixin, SoftDeleteMixin):
         return (self.stock / self.min_stock) * 100
     
     def __repr__(self):
-        return f"<Product(id={self.id}, sku='{self.sku}', name='{self.name}', stock={self.stock})>"
\ No newline at end of file
+        return f"<Product(id={self.id}, sku='{self.sku}', name='{self.name}', stock={self.stock})>"
+
+
+# Triggers que mantienen category_name / supplier_name (los mismos de la migración
+# bac8e7ec0aa4). Se registran también aquí para que metadata.create_all (seeds, tests)
+# cree la tabla con ellos; categories y suppliers ya existen cuando se crea products.
+_NAME_SYNC_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION products_sync_denormalized_names() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' OR NEW.category_id IS DISTINCT FROM OLD.category_id THEN
+            NEW.category_name := (SELECT name FROM categories WHERE id = NEW.category_id);
+        END IF;
+        IF TG_OP = 'INSERT' OR NEW.supplier_id IS DISTINCT FROM OLD.supplier_id THEN
+            NEW.supplier_name := (SELECT name FROM suppliers WHERE id = NEW.supplier_id);
+        END IF;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER trg_products_sync_names
+    BEFORE INSERT OR UPDATE OF category_id, supplier_id ON products
+    FOR EACH ROW EXECUTE FUNCTION products_sync_denormalized_names()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION categories_propagate_name() RETURNS trigger AS $$
+    BEGIN
+        UPDATE products SET category_name = NEW.name WHERE category_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER trg_categories_propagate_name
+    AFTER UPDATE OF name ON categories
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION categories_propagate_name()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION suppliers_propagate_name() RETURNS trigger AS $$
+    BEGIN
+        UPDATE products SET supplier_name = NEW.name WHERE supplier_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER trg_suppliers_propagate_name
+    AFTER UPDATE OF name ON suppliers
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION suppliers_propagate_name()
+    """,
+)
+
+for _statement in _NAME_SYNC_DDL:
+    event.listen(
+        Product.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql")
+    )
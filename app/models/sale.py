@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Numeric, Text, Index
+from sqlalchemy import Column, Integer, String, ForeignKey, Numeric, Text, Index, Date, table, column, event, DDL
 from sqlalchemy.orm import relationship
 from .base import TimestampMixin, Base
 import enum
@@ -41,6 +41,15 @@ class Sale(Base, TimestampMixin):
     cash_session = relationship("CashSession", back_populates="sales")
     items = relationship("SaleItem", back_populates="sale", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # BRIN para rangos por fecha: la tabla crece en orden de created_at
+        Index(
+            'sales_tenant_created_brin', 'tenant_id', 'created_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        ),
+    )
+
     def __repr__(self):
         return f"<Sale(id={self.id}, total={self.total_amount})>"
 
@@ -64,3 +73,45 @@ class SaleItem(Base):
 
     def __repr__(self):
         return f"<SaleItem(id={self.id}, product_id={self.product_id}, qty={self.quantity})>"
+
+
+# Vista materializada con el roll-up diario de ventas (ver migración correspondiente).
+# Se declara como tabla ligera para que no forme parte de Base.metadata.
+sales_daily_view = table(
+    "mv_sales_daily_by_tenant",
+    column("tenant_id", Integer),
+    column("day", Date),
+    column("status", String),
+    column("payment_method", String),
+    column("cnt", Integer),
+    column("revenue", Numeric(12, 2)),
+)
+
+# DDL de la vista (la misma de la migración be1e36c87975). Va atada a la tabla sales para que
+# metadata.create_all la cree y drop_all la elimine antes de sales, que es de la que depende
+SALES_DAILY_VIEW_DDL = (
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_sales_daily_by_tenant AS
+    SELECT
+        tenant_id,
+        date(created_at) AS day,
+        status,
+        payment_method,
+        count(*) AS cnt,
+        sum(total_amount) AS revenue
+    FROM sales
+    GROUP BY 1, 2, 3, 4
+    """,
+    # Requerido por REFRESH MATERIALIZED VIEW CONCURRENTLY
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_sales_daily_by_tenant
+    ON mv_sales_daily_by_tenant (tenant_id, day, status, payment_method)
+    """,
+)
+
+for _statement in SALES_DAILY_VIEW_DDL:
+    event.listen(Sale.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+event.listen(
+    Sale.__table__, "before_drop",
+    DDL("DROP MATERIALIZED VIEW IF EXISTS mv_sales_daily_by_tenant").execute_if(dialect="postgresql")
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Enum, Index, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, Enum, Index, Boolean, text
 from sqlalchemy.orm import relationship
 from .base import TimestampMixin
 from .base import Base
@@ -52,6 +52,12 @@ class StockAlert(Base, TimestampMixin):
         Index('idx_alerts_tenant_type', 'tenant_id', 'alert_type'),
         Index('idx_alerts_product_status', 'product_id', 'status'),
         Index('idx_alerts_tenant_active', 'tenant_id', 'status', 'is_notified'),
+        # Listados de alertas ordenados por fecha (sin nodo de ordenamiento)
+        Index('stock_alerts_active', 'tenant_id', 'status', text('created_at DESC')),
+        Index(
+            'stock_alerts_unnotified', 'tenant_id', text('created_at DESC'),
+            postgresql_where=text("status = 'ACTIVE' AND is_notified = false")
+        ),
     )
     
     def resolve(self):
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Index, Text, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, Text, Boolean, text
 from sqlalchemy.orm import relationship
 from .base import TimestampMixin, SoftDeleteMixin
 from .base import Base
@@ -13,7 +13,7 @@ class Supplier(Base, TimestampMixin, SoftDeleteMixin):
     
     # Información básica
     name = Column(String(200), nullable=False, index=True)
-    code = Column(String(50), unique=True, index=True, nullable=False)
+    code = Column(String(50), index=True, nullable=False)  # Único por tenant: ver suppliers_code_active
     tax_id = Column(String(50), nullable=True)  # RUC, NIT, etc.
     
     # Contacto
@@ -48,6 +48,22 @@ class Supplier(Base, TimestampMixin, SoftDeleteMixin):
     __table_args__ = (
         Index('idx_suppliers_tenant_active', 'tenant_id', 'is_active'),
         Index('idx_suppliers_tenant_name', 'tenant_id', 'name'),
+        # Paginación por keyset del listado: ORDER BY name, id
+        Index('idx_suppliers_tenant_deleted_name_id', 'tenant_id', 'is_deleted', 'name', 'id'),
+        # Código único por tenant entre proveedores no eliminados (coincide con get_by_code)
+        Index(
+            'suppliers_code_active', 'tenant_id', 'code',
+            unique=True,
+            postgresql_where=text('is_deleted = false')
+        ),
+        # Trigramas para búsquedas ILIKE '%texto%' (pg_trgm: la crea el before_create de models/base.py)
+        Index('suppliers_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('suppliers_code_trgm', 'code', postgresql_using='gin', postgresql_ops={'code': 'gin_trgm_ops'}),
+        Index('suppliers_email_trgm', 'email', postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}),
+        # Búsquedas por prefijo: lower(col) LIKE 'texto%'
+        Index('suppliers_name_lower', text('lower(name) text_pattern_ops')),
+        Index('suppliers_code_lower', text('lower(code) text_pattern_ops')),
+        Index('suppliers_email_lower', text('lower(email) text_pattern_ops')),
     )
     
     def __repr__(self):
@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Index, text, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from .base import Base, TimestampMixin
 
@@ -28,4 +28,14 @@ class User(Base, TimestampMixin):
     
     tenant = relationship("Tenant", back_populates="users")
     role_obj = relationship("Role", back_populates="users")
-    branch = relationship("Branch", back_populates="users")
\ No newline at end of file
+    branch = relationship("Branch", back_populates="users")
+    
+    # Índices
+    __table_args__ = (
+        # Paginación por keyset del listado de usuarios: ORDER BY email, id
+        Index('idx_users_tenant_email_id', 'tenant_id', 'email', 'id'),
+        # Trigramas para la búsqueda ILIKE '%texto%' por email (pg_trgm: ver models/base.py)
+        Index('users_email_trgm', 'email', postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}),
+        # Búsquedas por prefijo: lower(email) LIKE 'texto%'
+        Index('users_email_lower', text('lower(email) text_pattern_ops')),
+    )
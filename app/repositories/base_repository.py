@@ -1,11 +1,28 @@
 from typing import Generic, TypeVar, Type, Optional, List, Any, Dict
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import select, update, delete, func, or_, bindparam, String
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..core.pagination import PaginationParams, paginate
+from ..core.cache import mark_report_write
 
 ModelType = TypeVar("ModelType")
 
 
+def text_search(term: str, *columns):
+    """
+    Condición de búsqueda de texto sobre una o más columnas (unidas con OR).
+    
+    Un término anclado a la izquierda (ej. "acme%") es una búsqueda por prefijo y se
+    resuelve con lower(col) LIKE 'acme%', que usa los índices funcionales
+    lower(col) text_pattern_ops. El resto se busca por contenido con ILIKE '%term%'.
+    El patrón se arma una sola vez y se envía como un único parámetro.
+    """
+    if term.endswith("%") and not term.startswith("%"):
+        pattern = bindparam("search_pattern", term.lower(), type_=String, unique=True)
+        return or_(*(func.lower(column).like(pattern) for column in columns))
+    pattern = bindparam("search_pattern", f"%{term}%", type_=String, unique=True)
+    return or_(*(column.ilike(pattern) for column in columns))
+
+
 class BaseRepository(Generic[ModelType]):
     """Repositorio base genérico con operaciones CRUD comunes"""
     
@@ -158,6 +175,7 @@ class BaseRepository(Generic[ModelType]):
         
         await self.db.execute(query)
         await self.db.flush()
+        mark_report_write(self.db, self.model.__tablename__, getattr(old_obj, "tenant_id", tenant_id))
         
         if user_id and tenant_id:
             await self._record_audit(
@@ -188,6 +206,7 @@ class BaseRepository(Generic[ModelType]):
             await self.db.flush()
             if result.rowcount == 0:
                 return False
+            mark_report_write(self.db, self.model.__tablename__, getattr(obj, "tenant_id", tenant_id))
 
         if user_id and tenant_id:
             await self._record_audit(
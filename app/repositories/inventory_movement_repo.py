@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +14,29 @@ class InventoryMovementRepository(BaseRepository[InventoryMovement]):
     def __init__(self, db: AsyncSession):
         super().__init__(InventoryMovement, db)
     
+    async def add_movement(self, data: Dict[str, Any]) -> InventoryMovement:
+        """
+        Agrega un movimiento con add + flush (sin el refresh de create(): todos los
+        valores por defecto se calculan en Python). Pasa por la unidad de trabajo del
+        ORM para que el listener after_insert registre la auditoría.
+        """
+        movement = InventoryMovement(**data)
+        self.db.add(movement)
+        await self.db.flush()
+        return movement
+    
+    async def add_movements(self, rows: List[Dict[str, Any]]) -> List[InventoryMovement]:
+        """
+        Agrega varios movimientos (mismo orden que rows) en un solo flush.
+        El ORM los agrupa en un INSERT ... RETURNING por lote y dispara after_insert por fila.
+        """
+        if not rows:
+            return []
+        movements = [InventoryMovement(**row) for row in rows]
+        self.db.add_all(movements)
+        await self.db.flush()
+        return movements
+    
     async def get_by_product(
         self,
         product_id: int,
@@ -1,13 +1,96 @@
-from sqlalchemy import select, func, and_, desc, case
+import asyncio
+import weakref
+from sqlalchemy import select, func, and_, desc, case, text, union_all, literal_column, JSON
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
+from decimal import Decimal
 from ..models import Product, InventoryMovement, MovementType, Category, Sale, SaleItem, User
-from typing import Dict, List, Any, Optional
+from ..models.sale import sales_daily_view
+from ..core.logging_config import get_logger
+from ..core.cache import async_ttl_cache
+from ..core.config import settings
+from typing import Dict, List, Any, Optional, AsyncIterator, Tuple
+
+logger = get_logger(__name__)
+
+
+def _date_range(column, start_date: Optional[datetime], end_date: Optional[datetime], default_days: Optional[int] = None) -> list:
+    """
+    Condiciones de rango de fechas con forma fija (siempre dos parámetros).
+    Así el SQL compilado es el mismo con o sin filtros y se reutiliza desde
+    el caché de sentencias de SQLAlchemy en lugar de recompilarse.
+    """
+    if start_date is None and end_date is None and default_days:
+        start_date = datetime.utcnow() - timedelta(days=default_days)
+    return [column >= (start_date or datetime.min), column <= (end_date or datetime.max)]
+
+
+def _sale_export_filters(
+    tenant_id: int,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    status: Optional[str],
+    payment_method: Optional[str],
+    search: Optional[str]
+) -> list:
+    """Filtros comunes de las exportaciones de ventas (Excel y PDF)"""
+    filters = [Sale.tenant_id == tenant_id, *_date_range(Sale.created_at, start_date, end_date)]
+    if status: filters.append(Sale.status == status)
+    if payment_method: filters.append(Sale.payment_method == payment_method)
+    if search:
+        if search.isdigit():
+            filters.append(Sale.id == int(search))
+        else:
+            p_search = select(SaleItem.sale_id).join(Product).where(
+                and_(Product.tenant_id == tenant_id, Product.name.ilike(f"%{search}%"))
+            )
+            filters.append(Sale.id.in_(p_search))
+    return filters
+
+
+# Solo viven mientras alguna consulta los usa (referencia débil): no crecen con cada tenant
+# que pasó por el proceso. La clave incluye el event loop porque un Semaphore queda ligado
+# al loop donde se usa por primera vez (tests, workers con su propio loop)
+_tenant_semaphores: "weakref.WeakValueDictionary[Tuple[int, int], asyncio.Semaphore]" = weakref.WeakValueDictionary()
+
+
+def _tenant_semaphore(tenant_id: int) -> asyncio.Semaphore:
+    """Semáforo (compartido por el loop) que limita las consultas paralelas de un tenant"""
+    key = (id(asyncio.get_running_loop()), tenant_id)
+    semaphore = _tenant_semaphores.get(key)
+    if semaphore is None:
+        semaphore = _tenant_semaphores[key] = asyncio.Semaphore(settings.report_tenant_max_connections)
+    return semaphore
+
 
 class ReportRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def _fetch_all_concurrently(self, tenant_id: int, *queries) -> List[List[Any]]:
+        """
+        Ejecuta consultas de solo lectura en paralelo.
+        Una AsyncSession no puede multiplexar sentencias, así que cada consulta
+        usa su propia sesión (y conexión del pool) sobre el mismo engine.
+        Cada tenant tiene un tope de conexiones simultáneas para no acaparar el pool.
+        """
+        semaphore = _tenant_semaphore(tenant_id)
+
+        async def _run(query):
+            async with semaphore:
+                async with AsyncSession(self.db.bind, expire_on_commit=False) as session:
+                    result = await session.execute(query)
+                    return result.all()
+
+        results = await asyncio.gather(*(_run(q) for q in queries), return_exceptions=True)
+        for idx, res in enumerate(results):
+            if isinstance(res, BaseException):
+                logger.error(f"Error en consulta concurrente #{idx} del reporte: {res}")
+                raise res
+        return results
+
+    @async_ttl_cache(ttl=60)
     async def get_dashboard_stats(self, tenant_id: int, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> Dict[str, Any]:
         """Obtiene estadísticas globales para el dashboard"""
         
@@ -23,25 +106,21 @@ class ReportRepository:
         p_stats = products_result.one_or_none()
         
         # 2. Movimientos en el rango (entradas/salidas)
-        movements_conditions = [InventoryMovement.tenant_id == tenant_id]
-        if start_date:
-            movements_conditions.append(InventoryMovement.created_at >= start_date)
-        if end_date:
-            movements_conditions.append(InventoryMovement.created_at <= end_date)
-        else:
-            if not start_date:
-                movements_conditions.append(InventoryMovement.created_at >= datetime.utcnow() - timedelta(days=30))
+        movements_conditions = [
+            InventoryMovement.tenant_id == tenant_id,
+            *_date_range(InventoryMovement.created_at, start_date, end_date, default_days=30)
+        ]
 
         movements_query = select(
-            func.count(InventoryMovement.id).label("count"),
-            InventoryMovement.movement_type
-        ).where(and_(*movements_conditions)).group_by(InventoryMovement.movement_type)
+            func.sum(case((InventoryMovement.movement_type.in_([MovementType.ENTRY, MovementType.INITIAL]), 1), else_=0)).label("entries"),
+            func.sum(case((InventoryMovement.movement_type == MovementType.EXIT, 1), else_=0)).label("exits")
+        ).where(and_(*movements_conditions))
         
         movements_result = await self.db.execute(movements_query)
-        m_rows = movements_result.all()
+        m_stats = movements_result.one()
         
-        entries = sum(row.count for row in m_rows if row.movement_type in [MovementType.ENTRY, MovementType.INITIAL])
-        exits = sum(row.count for row in m_rows if row.movement_type == MovementType.EXIT)
+        entries = m_stats.entries or 0
+        exits = m_stats.exits or 0
 
         # 3. Meta de ventas del Tenant
         from ..models.tenant import Tenant
@@ -62,98 +141,80 @@ class ReportRepository:
     async def get_movement_trends(self, tenant_id: int, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Obtiene tendencias de movimientos en un rango de fechas"""
         
-        conditions = [InventoryMovement.tenant_id == tenant_id]
-        if start_date:
-            conditions.append(InventoryMovement.created_at >= start_date)
-        if end_date:
-            conditions.append(InventoryMovement.created_at <= end_date)
-        else:
-            if not start_date:
-                conditions.append(InventoryMovement.created_at >= datetime.utcnow() - timedelta(days=7))
+        conditions = [
+            InventoryMovement.tenant_id == tenant_id,
+            *_date_range(InventoryMovement.created_at, start_date, end_date, default_days=7)
+        ]
         
+        # Pivot en SQL: una fila por día con entradas y salidas ya separadas
+        day = func.date(InventoryMovement.created_at).label("day")
         query = select(
-            func.date(InventoryMovement.created_at).label("day"),
-            func.count(InventoryMovement.id).label("count"),
-            InventoryMovement.movement_type
-        ).where(and_(*conditions)).group_by(
-            func.date(InventoryMovement.created_at),
-            InventoryMovement.movement_type
-        ).order_by("day")
+            day,
+            func.count().filter(
+                InventoryMovement.movement_type.in_([MovementType.ENTRY, MovementType.INITIAL])
+            ).label("entries"),
+            func.count().filter(InventoryMovement.movement_type == MovementType.EXIT).label("exits")
+        ).where(and_(*conditions)).group_by(day).order_by(day)
         
         result = await self.db.execute(query)
-        rows = result.all()
-        
-        trends_map = {}
-        for row in rows:
-            day_str = str(row.day)
-            if day_str not in trends_map:
-                trends_map[day_str] = {"date": day_str, "entries": 0, "exits": 0}
-            
-            if row.movement_type in [MovementType.ENTRY, MovementType.INITIAL]:
-                trends_map[day_str]["entries"] += row.count
-            elif row.movement_type == MovementType.EXIT:
-                trends_map[day_str]["exits"] += row.count
-                
-        return sorted(list(trends_map.values()), key=lambda x: x["date"])
+        return [{"date": str(r.day), "entries": r.entries, "exits": r.exits} for r in result.all()]
 
+    @async_ttl_cache(ttl=60)
     async def get_category_distribution(self, tenant_id: int) -> List[Dict[str, Any]]:
         """Obtiene la distribución del valor del inventario por categoría"""
         query = select(
-            Category.name,
+            Product.category_name.label("name"),
             func.sum(Product.stock * Product.price).label("value")
-        ).join(Product, Product.category_id == Category.id
         ).where(and_(
             Product.tenant_id == tenant_id,
-            Product.is_deleted == False
-        )).group_by(Category.name)
+            Product.is_deleted == False,
+            Product.category_id.isnot(None)
+        )).group_by(Product.category_name)
         
         result = await self.db.execute(query)
         rows = result.all()
         
-        return [{"name": row.name, "value": float(row.value or 0)} for row in rows]
+        return [{"name": row.name or "—", "value": float(row.value or 0)} for row in rows]
 
+    @async_ttl_cache(ttl=60)
     async def get_supplier_distribution(self, tenant_id: int) -> List[Dict[str, Any]]:
         """Obtiene la distribución de unidades por proveedor"""
-        from ..models import Supplier
         query = select(
-            Supplier.name,
+            Product.supplier_name.label("name"),
             func.sum(Product.stock).label("units")
-        ).join(Product, Product.supplier_id == Supplier.id
         ).where(and_(
             Product.tenant_id == tenant_id,
-            Product.is_deleted == False
-        )).group_by(Supplier.name)
+            Product.is_deleted == False,
+            Product.supplier_id.isnot(None)
+        )).group_by(Product.supplier_name)
         
         result = await self.db.execute(query)
         rows = result.all()
-        return [{"name": row.name, "value": int(row.units or 0)} for row in rows]
+        return [{"name": row.name or "—", "value": int(row.units or 0)} for row in rows]
 
     async def get_user_activity(self, tenant_id: int, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Obtiene actividad de movimientos por usuario"""
-        from ..models import User
-        conditions = [InventoryMovement.tenant_id == tenant_id]
-        if start_date:
-            conditions.append(InventoryMovement.created_at >= start_date)
-        if end_date:
-            conditions.append(InventoryMovement.created_at <= end_date)
+        conditions = [
+            InventoryMovement.tenant_id == tenant_id,
+            *_date_range(InventoryMovement.created_at, start_date, end_date)
+        ]
 
         query = select(
-            User.email,
+            func.split_part(User.email, '@', 1).label("name"),
             func.count(InventoryMovement.id).label("count")
         ).join(InventoryMovement, InventoryMovement.user_id == User.id
         ).where(and_(*conditions)).group_by(User.email).order_by(desc("count"))
         
         result = await self.db.execute(query)
         rows = result.all()
-        return [{"name": row.email.split('@')[0], "value": row.count} for row in rows]
+        return [{"name": row.name, "value": row.count} for row in rows]
 
     async def get_top_moving_products(self, tenant_id: int, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None, limit: int = 10) -> List[Dict[str, Any]]:
         """Productos con más movimientos registrados"""
-        conditions = [InventoryMovement.tenant_id == tenant_id]
-        if start_date:
-            conditions.append(InventoryMovement.created_at >= start_date)
-        if end_date:
-            conditions.append(InventoryMovement.created_at <= end_date)
+        conditions = [
+            InventoryMovement.tenant_id == tenant_id,
+            *_date_range(InventoryMovement.created_at, start_date, end_date)
+        ]
 
         query = select(
             Product.name,
@@ -168,25 +229,26 @@ class ReportRepository:
     async def get_recent_movements(self, tenant_id: int, limit: int = 5) -> List[Dict[str, Any]]:
         """Obtiene los movimientos más recientes con info de producto"""
         query = select(
-            InventoryMovement,
+            InventoryMovement.id,
+            InventoryMovement.movement_type,
+            InventoryMovement.quantity,
+            InventoryMovement.created_at,
             Product.name.label("product_name")
         ).join(Product, InventoryMovement.product_id == Product.id
         ).where(InventoryMovement.tenant_id == tenant_id
-        ).order_by(desc(InventoryMovement.created_at)
+        ).order_by(desc(InventoryMovement.created_at), desc(InventoryMovement.id)
         ).limit(limit)
         
         result = await self.db.execute(query)
-        movements = []
-        for row in result:
-            m = row.InventoryMovement
-            movements.append({
-                "id": m.id,
+        return [
+            {
+                "id": row.id,
                 "product_name": row.product_name,
-                "type": m.movement_type,
-                "quantity": m.quantity,
-                "created_at": m.created_at.isoformat()
-            })
-        return movements
+                "type": row.movement_type,
+                "quantity": row.quantity,
+                "created_at": row.created_at.isoformat()
+            } for row in result.all()
+        ]
 
     async def get_low_stock_products(self, tenant_id: int, limit: int = 5) -> List[Dict[str, Any]]:
         """Obtiene productos que están bajo su stock mínimo"""
@@ -211,13 +273,14 @@ class ReportRepository:
                 "min_stock": p.min_stock
             } for p in products
         ]
+    @async_ttl_cache(ttl=60)
     async def get_sales_stats(self, tenant_id: int, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> Dict[str, Any]:
         """Estadísticas de ventas para el dashboard"""
-        conditions = [Sale.tenant_id == tenant_id, Sale.status == "completed"]
-        if start_date: conditions.append(Sale.created_at >= start_date)
-        if end_date: conditions.append(Sale.created_at <= end_date)
-        else:
-            if not start_date: conditions.append(Sale.created_at >= datetime.utcnow() - timedelta(days=30))
+        conditions = [
+            Sale.tenant_id == tenant_id,
+            Sale.status == "completed",
+            *_date_range(Sale.created_at, start_date, end_date, default_days=30)
+        ]
 
         query = select(
             func.count(Sale.id).label("total_sales"),
@@ -233,30 +296,35 @@ class ReportRepository:
         }
 
     async def get_sales_trends(self, tenant_id: int, days: int = 7) -> List[Dict[str, Any]]:
-        """Tendencia de ventas diaria"""
-        start_date = datetime.utcnow() - timedelta(days=days)
+        """Tendencia de ventas diaria (desde el roll-up mv_sales_daily_by_tenant)"""
+        start_day = (datetime.utcnow() - timedelta(days=days)).date()
+        mv = sales_daily_view
         query = select(
-            func.date(Sale.created_at).label("day"),
-            func.sum(Sale.total_amount).label("revenue"),
-            func.count(Sale.id).label("count")
+            mv.c.day,
+            func.sum(mv.c.revenue).label("revenue"),
+            func.sum(mv.c.cnt).label("count")
         ).where(and_(
-            Sale.tenant_id == tenant_id,
-            Sale.status == "completed",
-            Sale.created_at >= start_date
-        )).group_by(func.date(Sale.created_at)).order_by("day")
+            mv.c.tenant_id == tenant_id,
+            mv.c.status == "completed",
+            mv.c.day >= start_day
+        )).group_by(mv.c.day).order_by(mv.c.day)
         
         result = await self.db.execute(query)
         rows = result.all()
-        return [{"date": str(row.day), "revenue": float(row.revenue or 0), "count": row.count} for row in rows]
+        return [{"date": str(row.day), "revenue": float(row.revenue or 0), "count": int(row.count or 0)} for row in rows]
+
+    async def refresh_sales_daily_view(self) -> None:
+        """Refresca el roll-up diario de ventas sin bloquear las lecturas"""
+        await self.db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_sales_daily_by_tenant"))
+        await self.db.commit()
 
     async def get_purchase_stats(self, tenant_id: int, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> Dict[str, Any]:
         """Estadísticas de compras para el dashboard"""
         from ..models import Purchase
-        conditions = [Purchase.tenant_id == tenant_id]
-        if start_date: conditions.append(Purchase.created_at >= start_date)
-        if end_date: conditions.append(Purchase.created_at <= end_date)
-        else:
-            if not start_date: conditions.append(Purchase.created_at >= datetime.utcnow() - timedelta(days=30))
+        conditions = [
+            Purchase.tenant_id == tenant_id,
+            *_date_range(Purchase.created_at, start_date, end_date, default_days=30)
+        ]
 
         query = select(
             func.count(Purchase.id).label("total_purchases"),
@@ -304,31 +372,121 @@ class ReportRepository:
         rows = result.all()
         return [{"name": row.name, "value": int(row.total_sold or 0)} for row in rows]
 
-    async def get_filtered_sales(
-        self, 
+    async def iter_filtered_sales(
+        self,
         tenant_id: int,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         status: Optional[str] = None,
-        payment_method: Optional[str] = None
-    ) -> List[Sale]:
-        """Obtiene ventas filtradas para reportes"""
-        from sqlalchemy.orm import selectinload
-        
-        query = select(Sale).options(
-            selectinload(Sale.items).selectinload(SaleItem.product),
-            selectinload(Sale.user)
-        ).where(Sale.tenant_id == tenant_id)
+        payment_method: Optional[str] = None,
+        search: Optional[str] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Itera las ventas filtradas para exportaciones usando un cursor del servidor.
+        Solo proyecta las columnas usadas, con los items de cada venta ya agregados como
+        JSON (json_agg) en la misma consulta, sin hidratar Sale/SaleItem/Product/User.
+        Las filas llegan en lotes de `batch_size`, así la memoria no crece con el reporte.
+        """
+        filters = _sale_export_filters(tenant_id, start_date, end_date, status, payment_method, search)
+
+        items_json = select(
+            func.json_agg(
+                aggregate_order_by(
+                    func.json_build_object(
+                        literal_column("'product_name'"), Product.name,
+                        literal_column("'quantity'"), SaleItem.quantity
+                    ),
+                    SaleItem.id
+                ),
+                type_=JSON
+            )
+        ).select_from(SaleItem).join(Product, Product.id == SaleItem.product_id
+        ).where(SaleItem.sale_id == Sale.id).correlate(Sale).scalar_subquery()
 
-        if start_date: query = query.where(Sale.created_at >= start_date)
-        if end_date: query = query.where(Sale.created_at <= end_date)
-        if status: query = query.where(Sale.status == status)
-        if payment_method: query = query.where(Sale.payment_method == payment_method)
+        sales_q = select(
+            Sale.id,
+            Sale.created_at,
+            Sale.total_amount,
+            Sale.status,
+            Sale.payment_method,
+            func.split_part(User.email, '@', 1).label("seller"),
+            items_json.label("items")
+        ).outerjoin(User, User.id == Sale.user_id
+        ).where(and_(*filters)).order_by(desc(Sale.created_at)).execution_options(yield_per=batch_size)
+
+        stream = await self.db.stream(sales_q)
+        async for partition in stream.partitions():
+            for row in partition:
+                yield {
+                    "id": row.id,
+                    "created_at": row.created_at,
+                    "total_amount": row.total_amount,
+                    "status": row.status,
+                    "payment_method": row.payment_method,
+                    "seller": row.seller,
+                    "items": row.items or []
+                }
 
-        query = query.order_by(desc(Sale.created_at))
-        
-        result = await self.db.execute(query)
-        return result.unique().scalars().all()
+    async def get_sales_summary_rows(
+        self,
+        tenant_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        status: Optional[str] = None,
+        payment_method: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[Tuple[Any, ...]], Decimal]:
+        """
+        Filas del resumen de ventas en PDF: solo las seis columnas que se imprimen,
+        como tuplas (id, created_at, seller, payment_method, status, total_amount).
+        El total de las filas devueltas se suma en SQL (ventana sobre el subconjunto limitado).
+        """
+        filters = _sale_export_filters(tenant_id, start_date, end_date, status, payment_method, search)
+
+        limited = select(
+            Sale.id,
+            Sale.created_at,
+            func.split_part(User.email, '@', 1).label("seller"),
+            Sale.payment_method,
+            Sale.status,
+            Sale.total_amount
+        ).outerjoin(User, User.id == Sale.user_id
+        ).where(and_(*filters)).order_by(desc(Sale.created_at))
+        if limit:
+            limited = limited.limit(limit)
+        limited = limited.subquery()
+
+        result = await self.db.execute(
+            select(
+                limited,
+                func.sum(limited.c.total_amount).over().label("grand_total")
+            ).order_by(desc(limited.c.created_at))
+        )
+        rows = result.all()
+        total = rows[0].grand_total if rows else Decimal(0)
+        return [tuple(row[:6]) for row in rows], total
+
+    async def get_sales_watermark(
+        self,
+        tenant_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        status: Optional[str] = None,
+        payment_method: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> Tuple[Optional[datetime], int]:
+        """
+        Marca de agua de las ventas filtradas: (MAX(updated_at), COUNT(*)).
+        Cambia en cuanto se crea o modifica una venta que entra en el filtro.
+        """
+        filters = _sale_export_filters(tenant_id, start_date, end_date, status, payment_method, search)
+        result = await self.db.execute(
+            select(func.max(Sale.updated_at), func.count(Sale.id)).where(and_(*filters))
+        )
+        last_update, count = result.one()
+        return last_update, count
 
     async def get_sales_history_stats(
         self,
@@ -343,10 +501,8 @@ class ReportRepository:
         """Metricas y tendencias del historial de ventas con filtros"""
         
         # 1. Build common filters
-        filters = [Sale.tenant_id == tenant_id]
+        filters = [Sale.tenant_id == tenant_id, *_date_range(Sale.created_at, start_date, end_date)]
         if seller_id: filters.append(Sale.user_id == seller_id)
-        if start_date: filters.append(Sale.created_at >= start_date)
-        if end_date: filters.append(Sale.created_at <= end_date)
         if status: filters.append(Sale.status == status)
         if payment_method: filters.append(Sale.payment_method == payment_method)
         
@@ -359,20 +515,28 @@ class ReportRepository:
                 )
                 filters.append(Sale.id.in_(p_search))
 
-        # 2. Metricas Generales (Directo de Sales)
-        sales_q = select(
-            func.count(Sale.id).label("total_count"),
-            func.sum(func.coalesce(Sale.total_amount, 0)).label("total_revenue"),
-            func.avg(func.coalesce(Sale.total_amount, 0)).label("avg_sale")
-        ).where(and_(*filters))
-
-        # 3. Metricas de Items (Join con SaleItem y Product)
-        items_q = select(
-            func.sum(func.coalesce(SaleItem.quantity, 0)).label("total_items"),
-            func.sum(func.coalesce(SaleItem.quantity, 0) * func.coalesce(Product.cost, 0)).label("total_cogs")
-        ).join(Sale, Sale.id == SaleItem.sale_id
+        # 2. Metricas Generales + Items en una sola sentencia:
+        # las ventas filtradas se calculan una vez (CTE) y se reutilizan para los items
+        filtered_sales = select(Sale.id, Sale.total_amount).where(and_(*filters)).cte("filtered_sales")
+        filtered_ids = select(filtered_sales.c.id)
+
+        items_total_sq = select(
+            func.sum(func.coalesce(SaleItem.quantity, 0))
+        ).where(SaleItem.sale_id.in_(filtered_ids)).scalar_subquery()
+
+        items_cogs_sq = select(
+            func.sum(func.coalesce(SaleItem.quantity, 0) * func.coalesce(Product.cost, 0))
+        ).select_from(SaleItem
         ).join(Product, SaleItem.product_id == Product.id, isouter=True
-        ).where(and_(*filters))
+        ).where(SaleItem.sale_id.in_(filtered_ids)).scalar_subquery()
+
+        summary_q = select(
+            func.count(filtered_sales.c.id).label("total_count"),
+            func.sum(func.coalesce(filtered_sales.c.total_amount, 0)).label("total_revenue"),
+            func.avg(func.coalesce(filtered_sales.c.total_amount, 0)).label("avg_sale"),
+            items_total_sq.label("total_items"),
+            items_cogs_sq.label("total_cogs")
+        ).select_from(filtered_sales)
 
         # 4. Tendencia
         trend_q = select(
@@ -381,70 +545,83 @@ class ReportRepository:
             func.sum(func.coalesce(Sale.total_amount, 0)).label("revenue")
         ).where(and_(*filters)).group_by(func.date(Sale.created_at)).order_by("day")
 
-        # 5. Metodos de pago
+        # 5-7. Métodos de pago, producto estrella y distribución por categoría en un solo
+        # round-trip: UNION ALL con una columna discriminadora `kind`
         payment_q = select(
-            Sale.payment_method,
+            literal_column("'pay'").label("kind"),
+            Sale.payment_method.label("name"),
             func.sum(func.coalesce(Sale.total_amount, 0)).label("value")
         ).where(and_(*filters)).group_by(Sale.payment_method)
 
-        # 6. Producto Estrella
         top_q = select(
-            Product.name,
-            func.sum(SaleItem.quantity).label("occurrences")
+            literal_column("'top'").label("kind"),
+            Product.name.label("name"),
+            func.sum(SaleItem.quantity).label("value")
         ).join(SaleItem, Product.id == SaleItem.product_id
         ).join(Sale, Sale.id == SaleItem.sale_id
-        ).where(and_(*filters)).group_by(Product.name).order_by(desc("occurrences")).limit(1)
+        ).where(and_(*filters)).group_by(Product.name).order_by(desc("value")).limit(1)
 
-        # 7. Distribución por Categoría
         category_q = select(
-            Category.name,
-            func.sum(func.coalesce(SaleItem.subtotal, 0)).label("value")
+            literal_column("'cat'").label("kind"),
+            Category.name.label("name"),
+            func.sum(SaleItem.subtotal).label("value")
         ).select_from(SaleItem
         ).join(Sale, Sale.id == SaleItem.sale_id
         ).join(Product, Product.id == SaleItem.product_id
         ).join(Category, Category.id == Product.category_id
         ).where(and_(*filters)).group_by(Category.name)
 
-
-        # Ejecutar todas
-        sales_res = await self.db.execute(sales_q)
-        items_res = await self.db.execute(items_q)
-        trend_res = await self.db.execute(trend_q)
-        payment_res = await self.db.execute(payment_q)
-        top_res = await self.db.execute(top_q)
-        category_res = await self.db.execute(category_q)
-
-        s_stats = sales_res.one()
-        i_stats = items_res.one()
-        top_row = top_res.one_or_none()
-
-        revenue = float(s_stats.total_revenue or 0)
-        cogs = float(i_stats.total_cogs or 0)
-        profit = revenue - cogs
+        breakdown_q = union_all(payment_q, top_q.subquery().select(), category_q)
 
         # Vendedores list
-        sellers_q = select(User.id, User.email).join(Sale, User.id == Sale.user_id).where(Sale.tenant_id == tenant_id).distinct()
-        sellers_res = await self.db.execute(sellers_q)
-        sellers_list = [{"id": r.id, "email": r.email.split('@')[0]} for r in sellers_res.all()]
+        sellers_q = select(User.id, func.split_part(User.email, '@', 1).label("name")).join(Sale, User.id == Sale.user_id).where(Sale.tenant_id == tenant_id).distinct()
 
         # Stock bajo
         low_q = select(Product.id, Product.name, Product.stock, Product.min_stock).where(
-            and_(Product.tenant_id == tenant_id, Product.is_active == True, Product.stock <= Product.min_stock)
+            and_(
+                Product.tenant_id == tenant_id,
+                Product.is_deleted == False,
+                Product.is_active == True,
+                Product.stock <= Product.min_stock
+            )
         ).order_by(Product.stock.asc()).limit(5)
-        low_res = await self.db.execute(low_q)
-        low_list = [{"id": r.id, "name": r.name, "stock": r.stock, "min_stock": r.min_stock} for r in low_res.all()]
+
+        # Ejecutar todas en paralelo (latencia ~ max(consulta) en lugar de la suma)
+        (
+            summary_rows, trend_rows, breakdown_rows, sellers_rows, low_rows
+        ) = await self._fetch_all_concurrently(
+            tenant_id, summary_q, trend_q, breakdown_q, sellers_q, low_q
+        )
+
+        s_stats = summary_rows[0]
+
+        payment_rows, category_rows, top_row = [], [], None
+        for row in breakdown_rows:
+            if row.kind == "pay":
+                payment_rows.append(row)
+            elif row.kind == "cat":
+                category_rows.append(row)
+            else:
+                top_row = row
+
+        revenue = float(s_stats.total_revenue or 0)
+        cogs = float(s_stats.total_cogs or 0)
+        profit = revenue - cogs
+
+        sellers_list = [{"id": r.id, "email": r.name} for r in sellers_rows]
+        low_list = [{"id": r.id, "name": r.name, "stock": r.stock, "min_stock": r.min_stock} for r in low_rows]
 
         return {
             "total_count": s_stats.total_count or 0,
             "total_revenue": revenue,
-            "total_items": int(i_stats.total_items or 0),
+            "total_items": int(s_stats.total_items or 0),
             "avg_sale": float(s_stats.avg_sale or 0),
             "estimated_profit": profit,
             "profit_margin": (profit / revenue * 100) if revenue > 0 else 0,
             "top_product": top_row.name if top_row else "N/A",
-            "trends": [{"date": str(row.day), "revenue": float(row.revenue or 0), "count": row.count} for row in trend_res.all()],
-            "payment_distribution": [{"name": row.payment_method, "value": float(row.value or 0)} for row in payment_res.all()],
-            "category_distribution": [{"name": row.name, "value": float(row.value or 0)} for row in category_res.all()],
+            "trends": [{"date": str(row.day), "revenue": float(row.revenue or 0), "count": row.count} for row in trend_rows],
+            "payment_distribution": [{"name": row.name, "value": float(row.value or 0)} for row in payment_rows],
+            "category_distribution": [{"name": row.name, "value": float(row.value or 0)} for row in category_rows],
             "sellers": sellers_list,
             "low_stock_items": low_list
         }
@@ -456,9 +633,11 @@ class ReportRepository:
         end_date: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
         """Reporte detallado de rentabilidad por producto"""
-        conditions = [Sale.tenant_id == tenant_id, Sale.status == "completed"]
-        if start_date: conditions.append(Sale.created_at >= start_date)
-        if end_date: conditions.append(Sale.created_at <= end_date)
+        conditions = [
+            Sale.tenant_id == tenant_id,
+            Sale.status == "completed",
+            *_date_range(Sale.created_at, start_date, end_date)
+        ]
 
         query = select(
             Product.id,
@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, insert, literal
 from sqlalchemy.orm import selectinload
 from typing import List, Optional
 from .base_repository import BaseRepository
@@ -25,15 +25,15 @@ class RoleRepository(BaseRepository[Role]):
 
     async def create_role(self, tenant_id: int, role_data: dict, permission_ids: List[int]) -> Role:
         role = Role(tenant_id=tenant_id, name=role_data["name"], description=role_data.get("description"))
-        if permission_ids:
-            perms = await self.db.execute(select(Permission).where(Permission.id.in_(permission_ids)))
-            role.permissions = perms.scalars().all()
-        
         self.db.add(role)
+        await self.db.flush()
+
+        if permission_ids:
+            await self._insert_permissions(role, permission_ids)
         return role
 
     async def update_role(self, role_id: int, tenant_id: int, role_data: dict, permission_ids: Optional[List[int]] = None) -> Optional[Role]:
-        role = await self.get_role_with_permissions(role_id, tenant_id)
+        role = await self.get_by_id(role_id, tenant_id)
         if not role:
             return None
         
@@ -41,7 +41,19 @@ class RoleRepository(BaseRepository[Role]):
             setattr(role, key, value)
             
         if permission_ids is not None:
-            perms = await self.db.execute(select(Permission).where(Permission.id.in_(permission_ids)))
-            role.permissions = perms.scalars().all()
+            await self.db.execute(delete(role_permissions).where(role_permissions.c.role_id == role.id))
+            await self._insert_permissions(role, permission_ids)
             
         return role
+
+    async def _insert_permissions(self, role: Role, permission_ids: List[int]) -> None:
+        """Asigna permisos escribiendo directo en la tabla de asociación (ignora IDs inexistentes)"""
+        if permission_ids:
+            await self.db.execute(
+                insert(role_permissions).from_select(
+                    ["role_id", "permission_id"],
+                    select(literal(role.id), Permission.id).where(Permission.id.in_(permission_ids))
+                )
+            )
+        # La colección en memoria ya no refleja la tabla; se recarga en la próxima consulta
+        self.db.expire(role, ["permissions"])
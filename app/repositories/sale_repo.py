@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import BackgroundTasks
 from sqlalchemy import select, func, and_
 from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from .base_repository import BaseRepository
 from ..models.sale import Sale, SaleItem
 from ..models.product import Product
@@ -15,8 +16,10 @@ from ..core.pagination import PaginationParams
 from .credit_repo import CreditRepository
 from ..models.loyalty import LoyaltyConfig, LoyaltyTransaction
 from ..models.customer import Customer
+from ..models.user import User
 from ..models.sale import PaymentMethod
 from ..services.stock_alert_service import StockAlertService
+from ..core.cache import bump_tenant_version
 
 class SaleRepository(BaseRepository[Sale]):
     def __init__(self, db: AsyncSession):
@@ -56,12 +59,33 @@ class SaleRepository(BaseRepository[Sale]):
         self.db.add(new_sale)
         await self.db.flush() # Para obtener el ID
 
-        for item_data in sale_data.items:
-            # 2. Verificar producto y stock
-            result = await self.db.execute(
-                select(Product).where(Product.id == item_data.product_id, Product.tenant_id == tenant_id)
+        # 2. Cargar productos y lotes de la venta en una sola consulta cada uno,
+        # bloqueando las filas en orden de ID para evitar deadlocks entre ventas concurrentes
+        product_ids = sorted({item.product_id for item in sale_data.items})
+        result = await self.db.execute(
+            select(Product)
+            .where(Product.id.in_(product_ids), Product.tenant_id == tenant_id)
+            .order_by(Product.id)
+            .with_for_update()
+        )
+        products_by_id = {p.id: p for p in result.scalars().all()}
+
+        batch_ids = sorted({item.batch_id for item in sale_data.items if item.batch_id})
+        batches_by_id = {}
+        if batch_ids:
+            result_batch = await self.db.execute(
+                select(ProductBatch)
+                .where(ProductBatch.id.in_(batch_ids), ProductBatch.tenant_id == tenant_id)
+                .order_by(ProductBatch.id)
+                .with_for_update()
             )
-            product = result.scalar_one_or_none()
+            batches_by_id = {b.id: b for b in result_batch.scalars().all()}
+
+        movements = []
+        touched_products = {}
+        for item_data in sale_data.items:
+            # Verificar producto y stock
+            product = products_by_id.get(item_data.product_id)
             
             if not product:
                 raise ProductNotFoundException(item_data.product_id)
@@ -77,6 +101,7 @@ class SaleRepository(BaseRepository[Sale]):
             sale_item = SaleItem(
                 sale_id=new_sale.id,
                 product_id=product.id,
+                product=product,
                 batch_id=item_data.batch_id,
                 quantity=item_data.quantity,
                 unit_price=item_data.unit_price,
@@ -86,10 +111,7 @@ class SaleRepository(BaseRepository[Sale]):
             
             # 4.1 Descontar de Lote si se especificó
             if item_data.batch_id:
-                result_batch = await self.db.execute(
-                    select(ProductBatch).where(ProductBatch.id == item_data.batch_id, ProductBatch.tenant_id == tenant_id)
-                )
-                batch = result_batch.scalar_one_or_none()
+                batch = batches_by_id.get(item_data.batch_id)
                 if not batch:
                     raise Exception(f"Lote ID {item_data.batch_id} no encontrado")
                 if batch.current_quantity < item_data.quantity:
@@ -100,9 +122,10 @@ class SaleRepository(BaseRepository[Sale]):
             # 5. Actualizar stock del producto
             stock_before = product.stock
             product.stock -= item_data.quantity
+            touched_products[product.id] = product
             
             # 6. Registrar movimiento de inventario
-            movement = InventoryMovement(
+            movements.append(InventoryMovement(
                 tenant_id=tenant_id,
                 product_id=product.id,
                 batch_id=item_data.batch_id,
@@ -114,10 +137,12 @@ class SaleRepository(BaseRepository[Sale]):
                 unit_cost=product.cost,
                 reference=f"VENTA #{new_sale.id}",
                 notes=f"Venta realizada por el POS"
-            )
-            self.db.add(movement)
-            
-            # Verificar alertas de stock
+            ))
+
+        self.db.add_all(movements)
+
+        # Verificar alertas de stock (una vez por producto afectado)
+        for product in touched_products.values():
             await self.alert_service.check_and_trigger_alerts(product, tenant_id, background_tasks)
 
         # 7. Gestionar Redención de Puntos (Antes de calcular total final)
@@ -222,9 +247,17 @@ class SaleRepository(BaseRepository[Sale]):
                         self.db.add(loyalty_trans)
         
         await self.db.commit()
+        bump_tenant_version(tenant_id)
         
-        # Retornar la venta con todas sus relaciones cargadas usando el nuevo get_by_id
-        return await self.get_by_id(new_sale.id, tenant_id)
+        # Armar la respuesta con los objetos ya cargados en la sesión (sin volver a consultar la venta).
+        # Usuario y cliente normalmente ya están en el identity map de la petición.
+        set_committed_value(new_sale, "items", sale_items)
+        set_committed_value(new_sale, "user", await self.db.get(User, user_id) if user_id else None)
+        set_committed_value(
+            new_sale, "customer",
+            await self.db.get(Customer, sale_data.customer_id) if sale_data.customer_id else None
+        )
+        return new_sale
 
     async def annul_sale(self, sale_id: int, tenant_id: int, user_id: int, background_tasks: Optional[BackgroundTasks] = None) -> Sale:
         """Enula una venta, revierte el stock y registra los ajustes"""
@@ -331,6 +364,7 @@ class SaleRepository(BaseRepository[Sale]):
                 self.db.add(reversion_red)
         
         await self.db.commit()
+        bump_tenant_version(tenant_id)
         await self.db.refresh(sale)
         return sale
 
@@ -379,7 +413,19 @@ class SaleRepository(BaseRepository[Sale]):
             query = query.where(Sale.payment_method == payment_method)
 
         query = query.order_by(Sale.created_at.desc())
-        
-        # Usar la utilidad paginate del sistema
-        from ..core.pagination import paginate
-        return await paginate(self.db, query, pagination, Sale)
+
+        # El total viaja en cada fila (count(*) OVER()) para evitar una segunda consulta de conteo
+        paged_query = query.add_columns(func.count().over().label("total_count")) \
+            .offset(pagination.offset).limit(pagination.limit)
+        rows = (await self.db.execute(paged_query)).all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0].total_count
+
+        if pagination.offset == 0:
+            return [], 0
+
+        # Página fuera de rango: no hay filas de las que leer el total
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        total = (await self.db.execute(count_query)).scalar() or 0
+        return [], total
@@ -1,7 +1,7 @@
-from typing import List
-from sqlalchemy import select, and_
+from typing import Dict, List, Optional, Sequence
+from sqlalchemy import select, and_, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
 from .base_repository import BaseRepository
 from ..models import StockAlert, AlertType, AlertStatus
 
@@ -12,7 +12,7 @@ class StockAlertRepository(BaseRepository[StockAlert]):
     def __init__(self, db: AsyncSession):
         super().__init__(StockAlert, db)
     
-    async def get_active_alerts(self, tenant_id: int) -> List[StockAlert]:
+    async def get_active_alerts(self, tenant_id: int) -> Sequence[StockAlert]:
         """Obtiene alertas activas"""
         query = select(StockAlert).where(
             and_(
@@ -20,25 +20,48 @@ class StockAlertRepository(BaseRepository[StockAlert]):
                 StockAlert.status == AlertStatus.ACTIVE
             )
         ).options(
-            selectinload(StockAlert.product)
+            selectinload(StockAlert.product),
+            raiseload("*")
         ).order_by(StockAlert.created_at.desc())
         
         result = await self.db.execute(query)
         return result.scalars().all()
     
-    async def get_by_product(self, product_id: int, tenant_id: int) -> List[StockAlert]:
+    async def get_by_product(self, product_id: int, tenant_id: int) -> Sequence[StockAlert]:
         """Obtiene alertas de un producto"""
-        query = select(StockAlert).where(
+        query = lambda_stmt(lambda: select(StockAlert).where(
             and_(
                 StockAlert.tenant_id == tenant_id,
                 StockAlert.product_id == product_id
             )
-        ).order_by(StockAlert.created_at.desc())
+        ).order_by(StockAlert.created_at.desc()))
         
         result = await self.db.execute(query)
         return result.scalars().all()
     
-    async def get_unnotified_alerts(self, tenant_id: int) -> List[StockAlert]:
+    async def get_by_products(self, product_ids: List[int], tenant_id: int) -> Dict[int, List[StockAlert]]:
+        """
+        Obtiene las alertas de varios productos en una sola consulta (WHERE product_id IN ...).
+        Devuelve un dict product_id -> alertas (más recientes primero); los productos sin
+        alertas quedan con lista vacía. Usar en lugar de get_by_product dentro de un bucle.
+        """
+        alerts_by_product: Dict[int, List[StockAlert]] = {pid: [] for pid in product_ids}
+        if not product_ids:
+            return alerts_by_product
+        
+        query = select(StockAlert).where(
+            and_(
+                StockAlert.tenant_id == tenant_id,
+                StockAlert.product_id.in_(product_ids)
+            )
+        ).order_by(StockAlert.created_at.desc())
+        
+        result = await self.db.execute(query)
+        for alert in result.scalars().all():
+            alerts_by_product[alert.product_id].append(alert)
+        return alerts_by_product
+    
+    async def get_unnotified_alerts(self, tenant_id: int) -> Sequence[StockAlert]:
         """Obtiene alertas activas no notificadas"""
         query = select(StockAlert).where(
             and_(
@@ -47,16 +70,30 @@ class StockAlertRepository(BaseRepository[StockAlert]):
                 StockAlert.is_notified == False
             )
         ).options(
-            selectinload(StockAlert.product)
-        )
+            selectinload(StockAlert.product),
+            raiseload("*")
+        ).order_by(StockAlert.created_at.desc())
         
         result = await self.db.execute(query)
         return result.scalars().all()
     
-    async def mark_as_notified(self, alert_ids: List[int]) -> None:
-        """Marca alertas como notificadas"""
-        for alert_id in alert_ids:
-            alert = await self.get_by_id(alert_id)
-            if alert:
-                alert.is_notified = True
+    async def mark_as_notified(self, alert_ids: List[int], tenant_id: Optional[int] = None) -> None:
+        """
+        Marca alertas como notificadas. Carga las pendientes con un solo SELECT ... WHERE id IN
+        y las actualiza por el ORM: el flush agrupa los UPDATE y el listener after_update
+        registra la auditoría de cada alerta.
+        """
+        if not alert_ids:
+            return
+        
+        query = select(StockAlert).where(
+            StockAlert.id.in_(alert_ids),
+            StockAlert.is_notified == False
+        )
+        if tenant_id is not None:
+            query = query.where(StockAlert.tenant_id == tenant_id)
+        
+        result = await self.db.execute(query)
+        for alert in result.scalars().all():
+            alert.is_notified = True
         await self.db.flush()
@@ -1,10 +1,10 @@
-from typing import List, Optional
+from typing import List, Optional, Any, AsyncIterator, Sequence
 from datetime import datetime
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, lambda_stmt, exists
 from sqlalchemy.ext.asyncio import AsyncSession
-from .base_repository import BaseRepository
+from .base_repository import BaseRepository, text_search
 from ..models import Supplier
-from ..core.pagination import PaginationParams
+from ..core.pagination import PaginationParams, paginate, seek_paginate, count_rows
 
 
 class SupplierRepository(BaseRepository[Supplier]):
@@ -15,64 +15,75 @@ class SupplierRepository(BaseRepository[Supplier]):
     
     async def get_by_code(self, code: str, tenant_id: int) -> Optional[Supplier]:
         """Obtiene un proveedor por código"""
-        query = select(Supplier).where(
+        query = lambda_stmt(lambda: select(Supplier).where(
             and_(
                 Supplier.code == code,
                 Supplier.tenant_id == tenant_id,
                 Supplier.is_deleted == False
             )
-        )
+        ))
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
+    async def code_exists(self, code: str, tenant_id: int) -> bool:
+        """Indica si ya existe un proveedor activo con ese código (SELECT EXISTS, sin cargar la fila)"""
+        query = select(exists().where(
+            and_(
+                Supplier.code == code,
+                Supplier.tenant_id == tenant_id,
+                Supplier.is_deleted == False
+            )
+        ))
+        result = await self.db.execute(query)
+        return bool(result.scalar())
+    
     async def search(
         self,
         search_term: str,
         tenant_id: int,
-        pagination: Optional[PaginationParams] = None
-    ) -> tuple[List[Supplier], int]:
+        pagination: Optional[PaginationParams] = None,
+        include_total: bool = False
+    ) -> tuple[Sequence[Supplier], Optional[int]]:
         """Busca proveedores por nombre, código o email"""
+        if not search_term:
+            return [], 0
+        
         query = select(Supplier).where(
             and_(
                 Supplier.tenant_id == tenant_id,
                 Supplier.is_deleted == False,
-                or_(
-                    Supplier.name.ilike(f"%{search_term}%"),
-                    Supplier.code.ilike(f"%{search_term}%"),
-                    Supplier.email.ilike(f"%{search_term}%") if search_term else False
-                )
+                text_search(search_term, Supplier.name, Supplier.code, Supplier.email)
             )
         )
         
+        if getattr(pagination, "cursor", None):
+            return await seek_paginate(self.db, query, pagination, Supplier.name, Supplier.id)
+        
+        query = query.order_by(Supplier.name.asc(), Supplier.id.asc())
         if pagination:
-            from ..core.pagination import paginate
             return await paginate(self.db, query, pagination, Supplier)
         
+        # Sin paginación el total solo se calcula si se pide (COUNT(*) aparte)
+        total = await count_rows(self.db, query) if include_total else None
         result = await self.db.execute(query)
-        items = result.scalars().all()
-        return items, len(items)
+        return result.scalars().all(), total
     
-    async def get_filtered(
+    def _filtered_query(
         self,
         tenant_id: int,
         search: Optional[str] = None,
         is_active: Optional[bool] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        pagination: Optional[PaginationParams] = None
-    ) -> tuple[List[Supplier], int]:
-        """Obtiene proveedores aplicando búsqueda y filtros de estado de forma combinada"""
+        end_date: Optional[datetime] = None
+    ):
+        """Consulta base (sin orden ni paginación) compartida por get_filtered e iter_filtered"""
         conditions = [
             Supplier.tenant_id == tenant_id,
             Supplier.is_deleted == False
         ]
         
         if search:
-            conditions.append(or_(
-                Supplier.name.ilike(f"%{search}%"),
-                Supplier.code.ilike(f"%{search}%"),
-                Supplier.email.ilike(f"%{search}%")
-            ))
+            conditions.append(text_search(search, Supplier.name, Supplier.code, Supplier.email))
             
         if is_active is not None:
             conditions.append(Supplier.is_active == is_active)
@@ -83,17 +94,57 @@ class SupplierRepository(BaseRepository[Supplier]):
         if end_date:
             conditions.append(Supplier.created_at <= end_date)
             
-        query = select(Supplier).where(and_(*conditions)).order_by(Supplier.name.asc())
+        return select(Supplier).where(and_(*conditions))
+    
+    async def get_filtered(
+        self,
+        tenant_id: int,
+        search: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        pagination: Optional[PaginationParams] = None,
+        include_total: bool = False
+    ) -> tuple[Sequence[Supplier], Optional[int]]:
+        """Obtiene proveedores aplicando búsqueda y filtros de estado de forma combinada"""
+        query = self._filtered_query(tenant_id, search, is_active, start_date, end_date)
         
+        # Con cursor: paginación por keyset sobre (name, id), sin OFFSET ni COUNT
+        if getattr(pagination, "cursor", None):
+            return await seek_paginate(self.db, query, pagination, Supplier.name, Supplier.id)
+        
+        query = query.order_by(Supplier.name.asc(), Supplier.id.asc())
         if pagination:
-            from ..core.pagination import paginate
             return await paginate(self.db, query, pagination, Supplier)
         
+        # Sin paginación el total solo se calcula si se pide (COUNT(*) aparte)
+        total = await count_rows(self.db, query) if include_total else None
         result = await self.db.execute(query)
-        items = result.scalars().all()
-        return items, len(items)
+        return result.scalars().all(), total
+
+    async def iter_filtered(
+        self,
+        tenant_id: int,
+        search: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[Supplier]:
+        """
+        Itera los proveedores filtrados con un cursor del servidor (para exportaciones).
+        Las filas llegan en lotes de `batch_size`, la memoria no crece con el total.
+        Mismo esquema que ReportRepository.iter_filtered_sales en la exportación de ventas.
+        """
+        query = self._filtered_query(tenant_id, search, is_active, start_date, end_date)
+        query = query.order_by(Supplier.name.asc(), Supplier.id.asc()).execution_options(yield_per=batch_size)
+        
+        stream = await self.db.stream_scalars(query)
+        async for partition in stream.partitions():
+            for supplier in partition:
+                yield supplier
 
-    async def get_active_suppliers(self, tenant_id: int) -> List[Supplier]:
+    async def get_active_suppliers(self, tenant_id: int) -> Sequence[Supplier]:
         """Obtiene proveedores activos"""
         query = select(Supplier).where(
             and_(
@@ -105,3 +156,27 @@ class SupplierRepository(BaseRepository[Supplier]):
         
         result = await self.db.execute(query)
         return result.scalars().all()
+
+    async def list_summary(self, tenant_id: int, active_only: bool = True) -> List[Any]:
+        """
+        Listado resumido de proveedores (id, nombre, código, contacto y estado).
+        Proyecta solo esas columnas y devuelve filas livianas, sin hidratar entidades Supplier.
+        """
+        conditions = [
+            Supplier.tenant_id == tenant_id,
+            Supplier.is_deleted == False
+        ]
+        if active_only:
+            conditions.append(Supplier.is_active == True)
+        
+        query = select(
+            Supplier.id,
+            Supplier.name,
+            Supplier.code,
+            Supplier.email,
+            Supplier.phone,
+            Supplier.is_active
+        ).where(and_(*conditions)).order_by(Supplier.name)
+        
+        result = await self.db.execute(query)
+        return result.all()
@@ -1,11 +1,11 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from datetime import datetime
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, lambda_stmt, exists
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from .base_repository import BaseRepository
+from sqlalchemy.orm import selectinload, joinedload, raiseload
+from .base_repository import BaseRepository, text_search
 from ..models import User, Role
-from ..core.pagination import PaginationParams
+from ..core.pagination import PaginationParams, paginate, seek_paginate, count_rows
 
 class UserRepository(BaseRepository[User]):
     """Repositorio para usuarios"""
@@ -15,7 +15,8 @@ class UserRepository(BaseRepository[User]):
     
     async def get_by_id(self, id: int, tenant_id: Optional[int] = None) -> Optional[User]:
         query = select(User).where(User.id == id).options(
-            selectinload(User.role_obj).selectinload(Role.permissions)
+            selectinload(User.role_obj).selectinload(Role.permissions),
+            raiseload("*")
         )
         if tenant_id is not None:
             query = query.where(User.tenant_id == tenant_id)
@@ -24,11 +25,20 @@ class UserRepository(BaseRepository[User]):
 
     async def get_by_email(self, email: str) -> User | None:
         """Obtiene un usuario por email con su rol y permisos"""
-        query = select(User).where(User.email == email).options(
-            selectinload(User.role_obj).selectinload(Role.permissions)
-        )
+        # Un solo usuario: joinedload trae usuario, rol y permisos en una sentencia
+        # (los listados mantienen selectinload, donde el fan-out es mayor).
+        # lambda_stmt: la sentencia se compila una vez y se reutiliza, solo cambia el email
+        query = lambda_stmt(lambda: select(User).where(User.email == email).options(
+            joinedload(User.role_obj).joinedload(Role.permissions),
+            raiseload("*")
+        ))
         result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
+
+    async def email_exists(self, email: str) -> bool:
+        """Indica si el email ya está registrado (SELECT EXISTS, sin cargar usuario ni rol)"""
+        result = await self.db.execute(select(exists().where(User.email == email)))
+        return bool(result.scalar())
 
     async def get_filtered(
         self,
@@ -37,18 +47,16 @@ class UserRepository(BaseRepository[User]):
         is_active: Optional[bool] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        pagination: Optional[PaginationParams] = None
-    ) -> tuple[List[User], int]:
+        pagination: Optional[PaginationParams] = None,
+        include_total: bool = False
+    ) -> tuple[Sequence[User], Optional[int]]:
         """Obtiene usuarios aplicando filtros de búsqueda, estado y fecha"""
         conditions = [
             User.tenant_id == tenant_id,
         ]
         
         if search:
-            conditions.append(or_(
-                User.email.ilike(f"%{search}%"),
-                User.full_name.ilike(f"%{search}%") if hasattr(User, 'full_name') else False
-            ))
+            conditions.append(text_search(search, User.email))
             
         if is_active is not None:
             conditions.append(User.is_active == is_active)
@@ -60,13 +68,19 @@ class UserRepository(BaseRepository[User]):
             conditions.append(User.created_at <= end_date)
             
         query = select(User).where(and_(*conditions)).options(
-            selectinload(User.role_obj).selectinload(Role.permissions)
-        ).order_by(User.email.asc())
+            selectinload(User.role_obj).selectinload(Role.permissions),
+            raiseload("*")
+        )
+        
+        # Con cursor: paginación por keyset sobre (email, id), sin OFFSET ni COUNT
+        if getattr(pagination, "cursor", None):
+            return await seek_paginate(self.db, query, pagination, User.email, User.id)
         
+        query = query.order_by(User.email.asc(), User.id.asc())
         if pagination:
-            from ..core.pagination import paginate
             return await paginate(self.db, query, pagination, User)
             
+        # Sin paginación el total solo se calcula si se pide (COUNT(*) aparte)
+        total = await count_rows(self.db, query) if include_total else None
         result = await self.db.execute(query)
-        items = result.scalars().all()
-        return items, len(items)
+        return result.scalars().all(), total
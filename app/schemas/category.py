@@ -1,23 +1,20 @@
-from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator
+from typing import Optional, List, Annotated
+from pydantic import BaseModel, Field, StringConstraints
 from datetime import datetime
 
 
+# Nombre recortado y no vacío; la validación corre en pydantic-core, sin validadores Python
+NameStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=100)]
+
+
 class CategoryBase(BaseModel):
     """Schema base para categorías"""
-    name: str = Field(..., min_length=1, max_length=100, description="Nombre de la categoría")
+    name: NameStr = Field(..., description="Nombre de la categoría")
     code: Optional[str] = Field(None, max_length=50, description="Código único de la categoría")
     description: Optional[str] = Field(None, max_length=500, description="Descripción de la categoría")
     parent_id: Optional[int] = Field(None, description="ID de la categoría padre")
     display_order: int = Field(default=0, description="Orden de visualización")
     is_active: bool = Field(default=True, description="Indica si la categoría está activa")
-    
-    @field_validator('name')
-    @classmethod
-    def name_must_not_be_empty(cls, v: str) -> str:
-        if not v or not v.strip():
-            raise ValueError('El nombre no puede estar vacío')
-        return v.strip()
 
 
 class CategoryCreate(CategoryBase):
@@ -27,19 +24,12 @@ class CategoryCreate(CategoryBase):
 
 class CategoryUpdate(BaseModel):
     """Schema para actualizar una categoría"""
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    name: Optional[NameStr] = None
     code: Optional[str] = Field(None, max_length=50)
     description: Optional[str] = Field(None, max_length=500)
     parent_id: Optional[int] = None
     display_order: Optional[int] = None
     is_active: Optional[bool] = None
-    
-    @field_validator('name')
-    @classmethod
-    def name_must_not_be_empty(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and (not v or not v.strip()):
-            raise ValueError('El nombre no puede estar vacío')
-        return v.strip() if v else None
 
 
 class CategoryOut(CategoryBase):
@@ -55,7 +45,7 @@ class CategoryOut(CategoryBase):
 
 class CategoryWithChildren(CategoryOut):
     """Schema para categoría con sus hijos"""
-    children: List['CategoryOut'] = []
+    children: List[CategoryOut] = []
     
     model_config = {"from_attributes": True}
 
@@ -74,6 +64,5 @@ class CategoryTree(BaseModel):
     model_config = {"from_attributes": True}
 
 
-# Necesario para referencias recursivas
-CategoryWithChildren.model_rebuild()
+# Necesario para la referencia recursiva de CategoryTree
 CategoryTree.model_rebuild()
@@ -3,6 +3,8 @@ from decimal import Decimal
 from pydantic import BaseModel, Field, EmailStr, field_validator
 from datetime import datetime
 
+from .types import Phone
+
 
 class CustomerBase(BaseModel):
     """Schema base para clientes"""
@@ -12,7 +14,7 @@ class CustomerBase(BaseModel):
     
     # Contacto
     email: Optional[EmailStr] = Field(None, description="Email del cliente")
-    phone: Optional[str] = Field(None, max_length=20, description="Teléfono")
+    phone: Optional[Phone] = Field(None, description="Teléfono")
     
     # Dirección
     address: Optional[str] = Field(None, description="Dirección completa")
@@ -47,7 +49,7 @@ class CustomerUpdate(BaseModel):
     document_number: Optional[str] = Field(None, max_length=50)
     
     email: Optional[EmailStr] = None
-    phone: Optional[str] = Field(None, max_length=20)
+    phone: Optional[Phone] = None
     
     address: Optional[str] = None
     city: Optional[str] = Field(None, max_length=100)
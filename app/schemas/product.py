@@ -1,18 +1,28 @@
-from typing import Optional, List
+from typing import Optional, List, Annotated
 from pydantic import BaseModel, Field, ConfigDict
 from decimal import Decimal
 from datetime import datetime
+from .category import CategoryOut
+from .supplier import SupplierOut
+from .branch import ProductBranchResponse
+from .product_batch import ProductBatchOut
+from .types import Barcode
+
+
+# Montos acotados a la precisión de las columnas Numeric(10, 2)
+Price = Annotated[Decimal, Field(gt=0, max_digits=10, decimal_places=2)]
+Cost = Annotated[Decimal, Field(ge=0, max_digits=10, decimal_places=2)]
 
 
 # Base Schemas
 class ProductBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=200)
     sku: str = Field(..., min_length=1, max_length=50)
-    barcode: Optional[str] = Field(None, max_length=100)
+    barcode: Optional[Barcode] = None
     description: Optional[str] = None
-    price: Decimal = Field(..., gt=0)
+    price: Price
     batch_id: Optional[int] = Field(None, gt=0)
-    cost: Optional[Decimal] = Field(None, ge=0)
+    cost: Optional[Cost] = None
     stock: int = Field(default=0, ge=0)
     min_stock: int = Field(default=10, ge=0)
     max_stock: Optional[int] = Field(None, ge=0)
@@ -32,10 +42,10 @@ class ProductUpdate(BaseModel):
     """Schema para actualizar un producto"""
     name: Optional[str] = Field(None, min_length=1, max_length=200)
     sku: Optional[str] = Field(None, min_length=1, max_length=50)
-    barcode: Optional[str] = Field(None, max_length=100)
+    barcode: Optional[Barcode] = None
     description: Optional[str] = None
-    price: Optional[Decimal] = Field(None, gt=0)
-    cost: Optional[Decimal] = Field(None, ge=0)
+    price: Optional[Price] = None
+    cost: Optional[Cost] = None
     min_stock: Optional[int] = Field(None, ge=0)
     max_stock: Optional[int] = Field(None, ge=0)
     weight: Optional[float] = Field(None, ge=0)
@@ -57,95 +67,10 @@ class ProductOut(ProductBase):
 
 class ProductWithRelations(ProductOut):
     """Producto con relaciones cargadas"""
-    category: Optional["CategoryOut"] = None
-    supplier: Optional["SupplierOut"] = None
-    branch_stocks: List["ProductBranchResponse"] = []
-    batches: List["ProductBatchOut"] = []
-    
-    model_config = ConfigDict(from_attributes=True)
-
-
-# Category Schemas
-class CategoryBase(BaseModel):
-    name: str = Field(..., min_length=1, max_length=100)
-    code: Optional[str] = Field(None, max_length=50)
-    description: Optional[str] = Field(None, max_length=500)
-    parent_id: Optional[int] = None
-    display_order: int = 0
-
-
-class CategoryCreate(CategoryBase):
-    """Schema para crear una categoría"""
-    pass
-
-
-class CategoryUpdate(BaseModel):
-    """Schema para actualizar una categoría"""
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
-    code: Optional[str] = Field(None, max_length=50)
-    description: Optional[str] = Field(None, max_length=500)
-    parent_id: Optional[int] = None
-    display_order: Optional[int] = None
-
-
-class CategoryOut(CategoryBase):
-    """Schema de salida para categoría"""
-    id: int
-    tenant_id: int
-    created_at: datetime
-    
-    model_config = ConfigDict(from_attributes=True)
-
-
-# Supplier Schemas
-class SupplierBase(BaseModel):
-    name: str = Field(..., min_length=1, max_length=200)
-    code: str = Field(..., min_length=1, max_length=50)
-    tax_id: Optional[str] = Field(None, max_length=50)
-    contact_name: Optional[str] = Field(None, max_length=100)
-    email: Optional[str] = Field(None, max_length=100)
-    phone: Optional[str] = Field(None, max_length=20)
-    mobile: Optional[str] = Field(None, max_length=20)
-    address: Optional[str] = None
-    city: Optional[str] = Field(None, max_length=100)
-    state: Optional[str] = Field(None, max_length=100)
-    country: Optional[str] = Field(None, max_length=100)
-    postal_code: Optional[str] = Field(None, max_length=20)
-    payment_terms: Optional[str] = Field(None, max_length=100)
-    credit_limit: Optional[int] = Field(None, ge=0)
-    is_active: bool = True
-    notes: Optional[str] = None
-
-
-class SupplierCreate(SupplierBase):
-    """Schema para crear un proveedor"""
-    pass
-
-
-class SupplierUpdate(BaseModel):
-    """Schema para actualizar un proveedor"""
-    name: Optional[str] = Field(None, min_length=1, max_length=200)
-    tax_id: Optional[str] = Field(None, max_length=50)
-    contact_name: Optional[str] = Field(None, max_length=100)
-    email: Optional[str] = Field(None, max_length=100)
-    phone: Optional[str] = Field(None, max_length=20)
-    mobile: Optional[str] = Field(None, max_length=20)
-    address: Optional[str] = None
-    city: Optional[str] = Field(None, max_length=100)
-    state: Optional[str] = Field(None, max_length=100)
-    country: Optional[str] = Field(None, max_length=100)
-    postal_code: Optional[str] = Field(None, max_length=20)
-    payment_terms: Optional[str] = Field(None, max_length=100)
-    credit_limit: Optional[int] = Field(None, ge=0)
-    is_active: Optional[bool] = None
-    notes: Optional[str] = None
-
-
-class SupplierOut(SupplierBase):
-    """Schema de salida para proveedor"""
-    id: int
-    tenant_id: int
-    created_at: datetime
+    category: Optional[CategoryOut] = None
+    supplier: Optional[SupplierOut] = None
+    branch_stocks: List[ProductBranchResponse] = []
+    batches: List[ProductBatchOut] = []
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -155,7 +80,7 @@ class InventoryMovementBase(BaseModel):
     product_id: int
     branch_id: int
     quantity: int
-    unit_cost: Optional[Decimal] = None
+    unit_cost: Optional[Cost] = None
     reference: Optional[str] = Field(None, max_length=100)
     notes: Optional[str] = None
 
@@ -165,7 +90,7 @@ class AddStockRequest(BaseModel):
     product_id: int
     branch_id: int
     quantity: int = Field(..., gt=0)
-    unit_cost: Optional[Decimal] = Field(None, ge=0)
+    unit_cost: Optional[Cost] = None
     reference: Optional[str] = Field(None, max_length=100)
     notes: Optional[str] = None
     aisle: Optional[str] = Field(None, max_length=50)
@@ -173,6 +98,11 @@ class AddStockRequest(BaseModel):
     bin: Optional[str] = Field(None, max_length=50)
 
 
+class BulkAddStockRequest(BaseModel):
+    """Request para agregar stock a varios productos en una sola operación"""
+    items: List[AddStockRequest] = Field(..., min_length=1, max_length=500)
+
+
 class RemoveStockRequest(BaseModel):
     """Request para remover stock"""
     product_id: int
@@ -185,6 +115,11 @@ class RemoveStockRequest(BaseModel):
     bin: Optional[str] = Field(None, max_length=50)
 
 
+class BulkRemoveStockRequest(BaseModel):
+    """Request para remover stock de varios productos en una sola operación"""
+    items: List[RemoveStockRequest] = Field(..., min_length=1, max_length=500)
+
+
 class AdjustStockRequest(BaseModel):
     """Request para ajustar stock"""
     product_id: int
@@ -240,9 +175,3 @@ class BulkImportResponse(BaseModel):
     created: int
     skipped: int
     errors: List[str] = []
-
-
-# Para evitar errores de forward reference
-from .branch import ProductBranchResponse
-from .product_batch import ProductBatchOut
-ProductWithRelations.model_rebuild()
\ No newline at end of file
@@ -1,38 +1,42 @@
-from typing import Optional
-from pydantic import BaseModel, Field, EmailStr, field_validator
+from typing import Optional, Annotated
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, StringConstraints
 from datetime import datetime
 
+from .types import TaxId, PostalCode, Phone, make_partial
 
-class SupplierBase(BaseModel):
-    """Schema base para proveedores"""
-    name: str = Field(..., min_length=1, max_length=200, description="Nombre del proveedor")
-    code: str = Field(..., min_length=1, max_length=50, description="Código único del proveedor")
-    tax_id: Optional[str] = Field(None, max_length=50, description="RUC, NIT, Tax ID, etc.")
-    
-    # Contacto
+
+# Nombre y código recortados y no vacíos; la validación corre en pydantic-core, sin validadores Python
+NameStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=200)]
+CodeStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=50)]
+
+
+class _ContactMixin(BaseModel):
+    """Campos de contacto compartidos por los schemas de proveedor"""
     contact_name: Optional[str] = Field(None, max_length=100, description="Nombre de contacto")
     email: Optional[EmailStr] = Field(None, description="Email del proveedor")
-    phone: Optional[str] = Field(None, max_length=20, description="Teléfono")
-    mobile: Optional[str] = Field(None, max_length=20, description="Móvil")
-    
-    # Dirección
+    phone: Optional[Phone] = Field(None, description="Teléfono")
+    mobile: Optional[Phone] = Field(None, description="Móvil")
+    website: Optional[str] = Field(None, max_length=200, description="Sitio web")
+
+
+class _AddressMixin(BaseModel):
+    """Campos de dirección compartidos por los schemas de proveedor"""
     address: Optional[str] = Field(None, description="Dirección completa")
     city: Optional[str] = Field(None, max_length=100, description="Ciudad")
     state: Optional[str] = Field(None, max_length=100, description="Estado/Provincia")
     country: Optional[str] = Field(None, max_length=100, description="País")
-    postal_code: Optional[str] = Field(None, max_length=20, description="Código postal")
+    postal_code: Optional[PostalCode] = Field(None, description="Código postal")
+
+
+class SupplierBase(_ContactMixin, _AddressMixin):
+    """Schema base para proveedores"""
+    name: NameStr = Field(..., description="Nombre del proveedor")
+    code: CodeStr = Field(..., description="Código único del proveedor")
+    tax_id: Optional[TaxId] = Field(None, description="RUC, NIT, Tax ID, etc.")
     
     # Información adicional
-    website: Optional[str] = Field(None, max_length=200, description="Sitio web")
     notes: Optional[str] = Field(None, description="Notas adicionales")
     is_active: bool = Field(default=True, description="Proveedor activo")
-    
-    @field_validator('name', 'code')
-    @classmethod
-    def must_not_be_empty(cls, v: str) -> str:
-        if not v or not v.strip():
-            raise ValueError('El campo no puede estar vacío')
-        return v.strip()
 
 
 class SupplierCreate(SupplierBase):
@@ -40,44 +44,28 @@ class SupplierCreate(SupplierBase):
     pass
 
 
-class SupplierUpdate(BaseModel):
-    """Schema para actualizar un proveedor"""
-    name: Optional[str] = Field(None, min_length=1, max_length=200)
-    code: Optional[str] = Field(None, min_length=1, max_length=50)
-    tax_id: Optional[str] = Field(None, max_length=50)
-    
-    contact_name: Optional[str] = Field(None, max_length=100)
-    email: Optional[EmailStr] = None
-    phone: Optional[str] = Field(None, max_length=20)
-    mobile: Optional[str] = Field(None, max_length=20)
-    
-    address: Optional[str] = None
-    city: Optional[str] = Field(None, max_length=100)
-    state: Optional[str] = Field(None, max_length=100)
-    country: Optional[str] = Field(None, max_length=100)
-    postal_code: Optional[str] = Field(None, max_length=20)
-    
-    website: Optional[str] = Field(None, max_length=200)
-    notes: Optional[str] = None
-    is_active: Optional[bool] = None
-    
-    @field_validator('name', 'code')
-    @classmethod
-    def must_not_be_empty(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and (not v or not v.strip()):
-            raise ValueError('El campo no puede estar vacío')
-        return v.strip() if v else None
+SupplierUpdate = make_partial("SupplierUpdate", SupplierBase, doc="Schema para actualizar un proveedor")
 
 
 class SupplierOut(SupplierBase):
     """Schema para respuesta de proveedor"""
+    # El email ya se validó al escribir; no se re-valida al leer desde la BD
+    email: Optional[str] = None
     id: int
     tenant_id: int
     created_at: datetime
     updated_at: datetime
     is_deleted: bool = False
+
+    @classmethod
+    def from_row(cls, row) -> "SupplierOut":
+        """
+        Construye la respuesta leyendo solo las columnas declaradas, sin validación ni
+        reflexión de from_attributes (los datos vienen de la BD y ya son confiables).
+        """
+        return cls.model_construct(**{name: getattr(row, name) for name in cls.model_fields})
     
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore", validate_assignment=False)
 
 
 class SupplierSummary(BaseModel):
@@ -89,4 +77,4 @@ class SupplierSummary(BaseModel):
     phone: Optional[str] = None
     is_active: bool
     
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore", validate_assignment=False)
@@ -2,9 +2,9 @@ from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from datetime import datetime
 
-class TenantBase(BaseModel):
-    name: str
-    subdomain: Optional[str] = None
+from .types import make_partial
+
+class _TenantContactMixin(BaseModel):
     tax_id: Optional[str] = None
     email: Optional[str] = None
     phone: Optional[str] = None
@@ -14,24 +14,17 @@ class TenantBase(BaseModel):
     state: Optional[str] = None
     country: Optional[str] = None
     logo_url: Optional[str] = None
+
+class TenantBase(_TenantContactMixin):
+    name: str
+    subdomain: Optional[str] = None
     monthly_sales_goal: float = 0.0
 
-class TenantUpdate(BaseModel):
-    name: Optional[str] = None
-    tax_id: Optional[str] = None
-    email: Optional[str] = None
-    phone: Optional[str] = None
-    website: Optional[str] = None
-    address: Optional[str] = None
-    city: Optional[str] = None
-    state: Optional[str] = None
-    country: Optional[str] = None
-    logo_url: Optional[str] = None
-    monthly_sales_goal: Optional[float] = None
+TenantUpdate = make_partial("TenantUpdate", TenantBase, exclude=("subdomain",))
 
 class TenantOut(TenantBase):
     id: int
     plan: str
     created_at: datetime
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore", validate_assignment=False)
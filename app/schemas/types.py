@@ -0,0 +1,28 @@
+from copy import copy
+from typing import Annotated, Iterable, Optional, Type
+from pydantic import BaseModel, StringConstraints, create_model
+
+
+# Tipos de texto compartidos entre schemas: las restricciones (y futuros patrones)
+# se declaran una sola vez aquí en lugar de repetirse en cada campo
+TaxId = Annotated[str, StringConstraints(max_length=50)]
+PostalCode = Annotated[str, StringConstraints(max_length=20)]
+Phone = Annotated[str, StringConstraints(max_length=20)]
+Barcode = Annotated[str, StringConstraints(max_length=100)]
+
+
+def make_partial(name: str, base: Type[BaseModel], exclude: Iterable[str] = (), doc: Optional[str] = None) -> Type[BaseModel]:
+    """Genera a partir de ``base`` un schema de actualización con todos los campos opcionales
+
+    Se conservan las restricciones y descripciones de cada campo; sólo cambia el default a None.
+    """
+    excluded = set(exclude)
+    fields = {}
+    for field_name, field in base.model_fields.items():
+        if field_name in excluded:
+            continue
+        optional_field = copy(field)
+        optional_field.default = None
+        optional_field.default_factory = None
+        fields[field_name] = (Optional[field.annotation], optional_field)
+    return create_model(name, __doc__=doc, __module__=base.__module__, **fields)
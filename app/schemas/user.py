@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import Optional
 from datetime import datetime
 
@@ -28,19 +28,24 @@ class UserUpdate(BaseModel):
     role_id: Optional[int] = None
 
 class UserOut(BaseModel):
+    """Schema canónico de respuesta de usuario (reutilizado anidado en ventas y compras)"""
     id: int
-    email: EmailStr
+    email: str
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     phone: Optional[str] = None
     avatar_url: Optional[str] = None
     is_admin: bool
-    role: UserRole
+    # Valor ya validado en la BD: se lee como str sin coerción al enum por fila
+    role: str
     role_id: Optional[int] = None
     role_obj: Optional[RoleOut] = None
     is_active: bool
     tenant_id: int
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
\ No newline at end of file
+
+    @property
+    def role_enum(self) -> UserRole:
+        return UserRole(self.role)
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore", validate_assignment=False)
@@ -1 +1,24 @@
 # Seed data package
+import sys
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Tuple
+
+
+def _intern_value(key: str, value: Any, intern_keys: Tuple[str, ...]) -> Any:
+    if key in intern_keys and isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def freeze(rows: Iterable[dict], intern_keys: Tuple[str, ...] = ()) -> Tuple[Mapping[str, Any], ...]:
+    """Congela las filas de seeds como tupla de mappings de solo lectura con claves internadas
+
+    Los valores de ``intern_keys`` (vocabularios pequeños y repetidos) también se internan.
+    """
+    return tuple(
+        MappingProxyType({
+            sys.intern(key): _intern_value(key, value, intern_keys)
+            for key, value in row.items()
+        })
+        for row in rows
+    )
@@ -2,7 +2,11 @@
 Datos de categorías para seeds
 """
 
-CATEGORIES = [
+from collections import deque
+
+from app.seeds.data import freeze
+
+_CATEGORIES = [
     # Electrónica - Raíz
     {
         "name": "Electrónica",
@@ -123,3 +127,31 @@ CATEGORIES = [
         "display_order": 2
     }
 ]
+
+CATEGORIES = freeze(_CATEGORIES)
+
+CATEGORIES_BY_CODE = {cat["code"]: cat for cat in CATEGORIES}
+
+
+def _topo_sort(categories):
+    """Ordena las categorías (Kahn) para que cada padre aparezca antes que sus hijos"""
+    children = {}
+    queue = deque()
+    for cat in categories:
+        if cat["parent_code"] is None:
+            queue.append(cat)
+        else:
+            children.setdefault(cat["parent_code"], []).append(cat)
+
+    ordered = []
+    while queue:
+        cat = queue.popleft()
+        ordered.append(cat)
+        queue.extend(children.pop(cat["code"], ()))
+
+    if children:
+        raise ValueError(f"Categorías con padre inexistente: {sorted(children)}")
+    return tuple(ordered)
+
+
+CATEGORIES_ORDERED = _topo_sort(CATEGORIES)
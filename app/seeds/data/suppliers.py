@@ -2,7 +2,9 @@
 Datos de proveedores para seeds
 """
 
-SUPPLIERS = [
+from app.seeds.data import freeze
+
+_SUPPLIERS = [
     {
         "name": "Tech Distributors Inc.",
         "code": "TECH-001",
@@ -83,3 +85,5 @@ SUPPLIERS = [
         "is_active": True
     }
 ]
+
+SUPPLIERS = freeze(_SUPPLIERS, intern_keys=("country", "state", "city", "postal_code"))
@@ -1,26 +1,37 @@
 """
 Script para poblar la base de datos con datos de ejemplo
 Uso: python -m app.seeds.seed_data [--clean]
+
+Los datos de app/seeds/data son de confianza: se vuelcan directamente en los
+modelos ORM sin pasar por los schemas Pydantic, por lo que deben mantenerse
+ya normalizados (name/code sin espacios sobrantes).
 """
 
 import asyncio
 import sys
+from datetime import datetime
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from sqlalchemy import text
+from typing import List
+from pydantic import TypeAdapter
+from sqlalchemy import text, select, insert, or_, literal
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, selectinload
+from sqlalchemy.pool import NullPool
 from app.core.config import settings
 from app.core.security import get_password_hash
-from app.models import Base, Tenant, User, Category, Supplier, Product
+from app.models import Base, Tenant, User, Category, Supplier, Product, LoyaltyConfig
 from app.models.role import Role, Permission
 from app.models.user import UserRole
-from app.seeds.data.categories import CATEGORIES
-from app.seeds.data.suppliers import SUPPLIERS
-from app.seeds.data.products import PRODUCTS
+from app.schemas.category import CategoryCreate
+from app.schemas.supplier import SupplierCreate
+
+# Validadores de lista construidos una sola vez: cada lista se valida en una sola llamada
+_CATEGORY_ADAPTER = TypeAdapter(List[CategoryCreate])
+_SUPPLIER_ADAPTER = TypeAdapter(List[SupplierCreate])
 
 
 async def clean_database(engine, session: AsyncSession):
@@ -36,18 +47,38 @@ async def clean_database(engine, session: AsyncSession):
     print(" Base de datos recreada exitosamente")
 
 
+DEMO_PASSWORD = "demo123"
+DEMO_HASH_CACHE = Path(__file__).resolve().parents[2] / ".seed_cache" / "demo_hash.txt"
+
+
+def get_demo_password_hash() -> str:
+    """
+    Hash del password demo. En desarrollo se reutiliza el guardado en .seed_cache para no
+    pagar el KDF en cada re-seed (--clean); en otros entornos siempre se calcula.
+    """
+    if settings.environment != "development":
+        return get_password_hash(DEMO_PASSWORD)
+
+    if DEMO_HASH_CACHE.exists():
+        return DEMO_HASH_CACHE.read_text().strip()
+
+    hashed_password = get_password_hash(DEMO_PASSWORD)
+    DEMO_HASH_CACHE.parent.mkdir(exist_ok=True)
+    DEMO_HASH_CACHE.write_text(hashed_password)
+    return hashed_password
+
+
 async def create_tenant_and_user(session: AsyncSession):
     """Crea el tenant y usuario demo si no existen"""
     print("\n Verificando tenant y usuario...")
     
     # Verificar si el usuario ya existe
-    from sqlalchemy import select
-    result = await session.execute(select(User).where(User.email == "admin@demo.com"))
-    existing_user = result.scalar_one_or_none()
+    result = await session.execute(select(User.tenant_id).where(User.email == "admin@demo.com"))
+    existing_tenant_id = result.scalar_one_or_none()
     
-    if existing_user:
-        print(f" Usuario demo ya existe: {existing_user.email}")
-        return existing_user.tenant_id
+    if existing_tenant_id is not None:
+        print(" Usuario demo ya existe: admin@demo.com")
+        return existing_tenant_id
 
     # Crear tenant
     tenant = Tenant(
@@ -58,7 +89,7 @@ async def create_tenant_and_user(session: AsyncSession):
     await session.flush()
     
     # Crear usuario admin
-    hashed_password = get_password_hash("demo123")
+    hashed_password = get_demo_password_hash()
     user = User(
         tenant_id=tenant.id,
         email="admin@demo.com",
@@ -69,115 +100,110 @@ async def create_tenant_and_user(session: AsyncSession):
     await session.commit()
     
     print(f"OK Tenant creado: {tenant.name} (ID: {tenant.id})")
-    print(f"OK Usuario creado: {user.email} / password: demo123")
+    print(f"OK Usuario creado: {user.email} / password: {DEMO_PASSWORD}")
     
     return tenant.id
 
 
+def validate_seed_data():
+    """Valida en lote los datos de seeds contra los schemas de creación"""
+    from app.seeds.data.categories import CATEGORIES
+    from app.seeds.data.suppliers import SUPPLIERS
+
+    _CATEGORY_ADAPTER.validate_python(CATEGORIES)
+    _SUPPLIER_ADAPTER.validate_python(SUPPLIERS)
+    print("OK Datos de seeds validados")
+
+
 async def create_categories(session: AsyncSession, tenant_id: int):
     """Crea las categoras jerrquicas"""
+    from app.seeds.data.categories import CATEGORIES_ORDERED
+
     print("\n[INFO] Creando categoras...")
     
-    category_map = {}  # code -> Category object
-    
-    # Primera pasada: crear categoras raz
-    for cat_data in CATEGORIES:
-        if cat_data["parent_code"] is None:
-            # Verificar si ya existe
-            from sqlalchemy import select
-            res = await session.execute(select(Category).where(Category.code == cat_data["code"]))
-            category = res.scalar_one_or_none()
-            if category:
-                category_map[cat_data["code"]] = category
-                print(f"  - {cat_data['name']} (ya existe)")
-                continue
-
-            category = Category(
-                tenant_id=tenant_id,
-                name=cat_data["name"],
-                code=cat_data["code"],
-                description=cat_data.get("description"),
-                display_order=cat_data.get("display_order", 0)
-            )
-            session.add(category)
-            await session.flush()
-            category_map[cat_data["code"]] = category
-            print(f"   {category.name} ({category.code})")
+    # code -> id; las existentes se cargan con una sola consulta
+    codes = [cat["code"] for cat in CATEGORIES_ORDERED]
+    res = await session.execute(select(Category.code, Category.id).where(Category.code.in_(codes)))
+    category_map = dict(res.all())
+    existing = len(category_map)
     
-    # Segunda pasada: crear categoras con padre
-    for cat_data in CATEGORIES:
-        if cat_data["parent_code"] is not None:
-            # Verificar si ya existe
-            from sqlalchemy import select
-            res = await session.execute(select(Category).where(Category.code == cat_data["code"]))
-            category = res.scalar_one_or_none()
-            if category:
-                category_map[cat_data["code"]] = category
-                print(f"    - {cat_data['name']} (ya existe)")
-                continue
-
-            parent = category_map.get(cat_data["parent_code"])
-            if parent:
-                category = Category(
-                    tenant_id=tenant_id,
-                    name=cat_data["name"],
-                    code=cat_data["code"],
-                    description=cat_data.get("description"),
-                    parent_id=parent.id,
-                    display_order=cat_data.get("display_order", 0)
-                )
-                session.add(category)
-                await session.flush()
-                category_map[cat_data["code"]] = category
-                print(f"    OK {category.name} ({category.code}) -> {parent.name}")
+    # Un INSERT ... RETURNING por nivel del árbol: cada nivel ya conoce el id de su padre
+    pending = [cat for cat in CATEGORIES_ORDERED if cat["code"] not in category_map]
+    while pending:
+        level = [
+            cat for cat in pending
+            if cat["parent_code"] is None or cat["parent_code"] in category_map
+        ]
+        if not level:
+            break
+        rows = [
+            {
+                "tenant_id": tenant_id,
+                "name": cat["name"],
+                "code": cat["code"],
+                "description": cat.get("description"),
+                "parent_id": category_map.get(cat["parent_code"]),
+                "display_order": cat.get("display_order", 0),
+            }
+            for cat in level
+        ]
+        res = await session.execute(insert(Category).returning(Category.code, Category.id), rows)
+        category_map.update(res.all())
+        pending = [cat for cat in pending if cat["code"] not in category_map]
     
     await session.commit()
-    print(f"OK {len(category_map)} categorias creadas")
+    print(f"OK {len(category_map) - existing} categorias creadas ({existing} ya existian)")
     
     return category_map
 
 
 async def create_suppliers(session: AsyncSession, tenant_id: int):
     """Crea los proveedores"""
+    from app.seeds.data.suppliers import SUPPLIERS
+
     print("\nCreando proveedores...")
     
-    supplier_map = {}  # code -> Supplier object
-    
-    for sup_data in SUPPLIERS:
-        # Verificar si ya existe
-        from sqlalchemy import select
-        res = await session.execute(select(Supplier).where(Supplier.code == sup_data["code"]))
-        supplier = res.scalar_one_or_none()
-        if supplier:
-            supplier_map[sup_data["code"]] = supplier
-            print(f"  - {sup_data['name']} (ya existe)")
-            continue
-
-        supplier = Supplier(
-            tenant_id=tenant_id,
-            name=sup_data["name"],
-            code=sup_data["code"],
-            tax_id=sup_data.get("tax_id"),
-            contact_name=sup_data.get("contact_name"),
-            email=sup_data.get("email"),
-            phone=sup_data.get("phone"),
-            mobile=sup_data.get("mobile"),
-            address=sup_data.get("address"),
-            city=sup_data.get("city"),
-            state=sup_data.get("state"),
-            country=sup_data.get("country"),
-            postal_code=sup_data.get("postal_code"),
-            website=sup_data.get("website"),
-            notes=sup_data.get("notes"),
-            is_active=sup_data.get("is_active", True)
+    # code -> id; los existentes se cargan con una sola consulta. El código es único por
+    # tenant entre proveedores no eliminados (suppliers_code_active)
+    codes = [sup["code"] for sup in SUPPLIERS]
+    res = await session.execute(
+        select(Supplier.code, Supplier.id).where(
+            Supplier.tenant_id == tenant_id,
+            Supplier.is_deleted == False,
+            Supplier.code.in_(codes)
         )
-        session.add(supplier)
-        await session.flush()
-        supplier_map[sup_data["code"]] = supplier
-        print(f"   {supplier.name} ({supplier.code})")
+    )
+    supplier_map = dict(res.all())
+    existing = len(supplier_map)
+    
+    rows = [
+        {
+            "tenant_id": tenant_id,
+            "name": sup_data["name"],
+            "code": sup_data["code"],
+            "tax_id": sup_data.get("tax_id"),
+            "contact_name": sup_data.get("contact_name"),
+            "email": sup_data.get("email"),
+            "phone": sup_data.get("phone"),
+            "mobile": sup_data.get("mobile"),
+            "address": sup_data.get("address"),
+            "city": sup_data.get("city"),
+            "state": sup_data.get("state"),
+            "country": sup_data.get("country"),
+            "postal_code": sup_data.get("postal_code"),
+            "website": sup_data.get("website"),
+            "notes": sup_data.get("notes"),
+            "is_active": sup_data.get("is_active", True),
+        }
+        for sup_data in SUPPLIERS
+        if sup_data["code"] not in supplier_map
+    ]
+    if rows:
+        res = await session.execute(insert(Supplier).returning(Supplier.code, Supplier.id), rows)
+        supplier_map.update(res.all())
     
     await session.commit()
-    print(f" {len(supplier_map)} proveedores creados")
+    print(f" {len(rows)} proveedores creados ({existing} ya existian)")
     
     return supplier_map
 
@@ -273,18 +299,19 @@ async def create_roles_and_permissions(session: AsyncSession, tenant_id: int):
         {"name": "Ver Lista Picking", "codename": "sales:picking", "module": "sales"},
     ]
     
-    # Crear todos los permisos
-    from sqlalchemy import select
-    all_perms = {}
-    for p_data in permissions_data:
-        res = await session.execute(select(Permission).where(Permission.codename == p_data["codename"]))
-        perm = res.scalar_one_or_none()
-        if not perm:
-            perm = Permission(**p_data)
-            session.add(perm)
-            await session.flush()
-            print(f"  OK Permiso: {perm.codename}")
-        all_perms[p_data["codename"]] = perm
+    # Crear todos los permisos: existentes en una sola consulta, nuevos en un solo flush
+    codenames = [p_data["codename"] for p_data in permissions_data]
+    res = await session.execute(select(Permission).where(Permission.codename.in_(codenames)))
+    all_perms = {perm.codename: perm for perm in res.scalars().all()}
+    new_perms = [
+        Permission(**p_data) for p_data in permissions_data
+        if p_data["codename"] not in all_perms
+    ]
+    if new_perms:
+        session.add_all(new_perms)
+        await session.flush()
+        all_perms.update((perm.codename, perm) for perm in new_perms)
+        print(f"  OK {len(new_perms)} permisos creados")
     
     # 2. Definir Roles y sus permisos
     roles_config = {
@@ -327,7 +354,6 @@ async def create_roles_and_permissions(session: AsyncSession, tenant_id: int):
     }
     
     # Crear Roles y asignar permisos
-    from sqlalchemy.orm import selectinload
     created_roles = {}
     for role_name, config in roles_config.items():
         res = await session.execute(
@@ -357,64 +383,114 @@ async def create_roles_and_permissions(session: AsyncSession, tenant_id: int):
     print("OK Roles y permisos sincronizados")
     return created_roles
 
+async def copy_rows(session: AsyncSession, table, rows: List[dict]) -> bool:
+    """
+    Carga filas con el protocolo COPY de PostgreSQL (asyncpg copy_records_to_table),
+    dentro de la transacción de la sesión. COPY no aplica los defaults de Python de los
+    modelos, por eso se completan aquí. Devuelve False si el driver no es asyncpg.
+    """
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+    if not hasattr(driver, "copy_records_to_table"):
+        return False
+
+    now = datetime.utcnow()
+    defaults = {"created_at": now, "updated_at": now, "is_deleted": False}
+    columns = list(rows[0])
+    extra = [name for name in defaults if name in table.c and name not in columns]
+    records = [
+        tuple(row[name] for name in columns) + tuple(defaults[name] for name in extra)
+        for row in rows
+    ]
+    await driver.copy_records_to_table(
+        table.name, records=records, columns=columns + extra, schema_name=table.schema or "public"
+    )
+    return True
+
+
 async def create_products(
     session: AsyncSession,
     tenant_id: int,
     category_map: dict,
     supplier_map: dict
 ):
-    """Crea los productos"""
+    """Crea los productos (category_map/supplier_map: code -> id)"""
+    from app.seeds.data.products import PRODUCTS, PRODUCTS_BY_CATEGORY, PRODUCTS_BY_SUPPLIER
+
     print("\n[INFO] Creando productos...")
     
-    product_count = 0
+    # SKU y barcode son únicos: ambos se precargan en una sola consulta
+    skus = [prod.sku for prod in PRODUCTS]
+    barcodes = [prod.barcode for prod in PRODUCTS]
+    res = await session.execute(
+        select(Product.sku, Product.barcode).where(
+            or_(Product.sku.in_(skus), Product.barcode.in_(barcodes))
+        )
+    )
+    existing = res.all()
+    existing_skus = {sku for sku, _ in existing}
+    existing_barcodes = {barcode for _, barcode in existing}
+    
+    # Los proveedores ausentes descartan a todos sus productos de una vez
+    skipped = set()
+    for supplier_code, indices in PRODUCTS_BY_SUPPLIER.items():
+        if not supplier_map.get(supplier_code):
+            print(f"    Saltando {len(indices)} productos: proveedor {supplier_code} no encontrado")
+            skipped.update(indices)
     
-    for prod_data in PRODUCTS:
-        # Verificar si ya existe
-        from sqlalchemy import select
-        res = await session.execute(select(Product).where(Product.barcode == prod_data["barcode"]))
-        product = res.scalar_one_or_none()
-        if product:
-            print(f"  - {prod_data['name']} (ya existe)")
-            continue
-
-        category = category_map.get(prod_data["category_code"])
-        supplier = supplier_map.get(prod_data["supplier_code"])
-        
-        if not category or not supplier:
-            print(f"    Saltando {prod_data['name']}: categora o proveedor no encontrado")
+    # Se recorre por categoría: el id se resuelve una vez por grupo
+    rows = []
+    for category_code, indices in PRODUCTS_BY_CATEGORY.items():
+        category_id = category_map.get(category_code)
+        if not category_id:
+            print(f"    Saltando {len(indices)} productos: categoria {category_code} no encontrada")
             continue
         
-        product = Product(
-            tenant_id=tenant_id,
-            name=prod_data["name"],
-            sku=prod_data["sku"],
-            description=prod_data.get("description"),
-            category_id=category.id,
-            supplier_id=supplier.id,
-            price=prod_data["price"],
-            cost=prod_data.get("cost"),
-            stock=prod_data.get("stock", 0),
-            min_stock=prod_data.get("min_stock", 0),
-            max_stock=prod_data.get("max_stock"),
-            barcode=prod_data.get("barcode"),
-            is_active=prod_data.get("is_active", True)
-        )
-        session.add(product)
-        product_count += 1
-        print(f"   {product.name} (Stock: {product.stock})")
+        for i in indices:
+            prod_data = PRODUCTS[i]
+            if i in skipped or prod_data.sku in existing_skus or prod_data.barcode in existing_barcodes:
+                continue
+            
+            rows.append({
+                "tenant_id": tenant_id,
+                "name": prod_data.name,
+                "sku": prod_data.sku,
+                "description": prod_data.description,
+                "category_id": category_id,
+                "supplier_id": supplier_map[prod_data.supplier_code],
+                "price": prod_data.price,
+                "cost": prod_data.cost,
+                "stock": prod_data.stock,
+                "min_stock": prod_data.min_stock,
+                "max_stock": prod_data.max_stock,
+                "barcode": prod_data.barcode,
+                "is_active": prod_data.is_active,
+            })
+    
+    # COPY con asyncpg; si el driver no lo soporta, inserción en lote (executemany)
+    if rows and not await copy_rows(session, Product.__table__, rows):
+        await session.execute(insert(Product), rows)
     
     await session.commit()
-    print(f" {product_count} productos creados")
+    print(f" {len(rows)} productos creados ({len(existing)} ya existian)")
 
 
-async def run_seeds(clean: bool = False):
+async def run_seeds(clean: bool = False, validate: bool = False):
     """Ejecuta el proceso de seeds"""
     print("[INFO] Iniciando seeds de datos...\n")
+
+    if validate:
+        validate_seed_data()
     
     # Crear engine y session
-    engine = create_async_engine(settings.database_url, echo=False)
+    # Script de una sola ejecución: NullPool abre una conexión por sesión (incluidas las
+    # paralelas de categorías/proveedores) sin límite de pool ni reutilización
+    engine = create_async_engine(settings.database_url, echo=False, poolclass=NullPool)
+    # autoflush=False: las sondas SELECT de los seeds no dependen de objetos pendientes,
+    # asi que no hace falta recorrer el identity map antes de cada consulta
     async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
+        engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
     )
     
     async with async_session() as session:
@@ -427,10 +503,11 @@ async def run_seeds(clean: bool = False):
             tenant_id = await create_tenant_and_user(session)
             
             # Configuracion de Lealtad inicial
-            from app.models.loyalty import LoyaltyConfig
-            from sqlalchemy import select
-            res = await session.execute(select(LoyaltyConfig).where(LoyaltyConfig.tenant_id == tenant_id))
-            if not res.scalar_one_or_none():
+            # Sonda de existencia: SELECT 1 ... LIMIT 1, sin hidratar la entidad
+            res = await session.execute(
+                select(literal(1)).where(LoyaltyConfig.tenant_id == tenant_id).limit(1)
+            )
+            if res.scalar() is None:
                 loyalty_config = LoyaltyConfig(
                     tenant_id=tenant_id,
                     points_per_amount=100.00, # 1 punto por cada $100
@@ -445,15 +522,19 @@ async def run_seeds(clean: bool = False):
             roles = await create_roles_and_permissions(session, tenant_id)
             
             # Asignar rol ADMIN al usuario demo
-            from sqlalchemy import select
             res = await session.execute(select(User).where(User.email == "admin@demo.com"))
             user = res.scalar_one()
             user.role_id = roles["ADMIN"].id
             user.role = UserRole.ADMIN
             await session.commit()
             
-            category_map = await create_categories(session, tenant_id)
-            supplier_map = await create_suppliers(session, tenant_id)
+            # Categorías y proveedores no dependen entre sí: se crean en paralelo, cada uno
+            # con su propia sesión (y conexión); los mapas code -> id no comparten objetos ORM
+            async with async_session() as category_session, async_session() as supplier_session:
+                category_map, supplier_map = await asyncio.gather(
+                    create_categories(category_session, tenant_id),
+                    create_suppliers(supplier_session, tenant_id)
+                )
             await create_products(session, tenant_id, category_map, supplier_map)
             
             print("\n" + "="*60)
@@ -484,11 +565,16 @@ def main():
         action="store_true",
         help="Limpiar base de datos antes de crear datos"
     )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Validar los datos de seeds contra los schemas antes de insertarlos"
+    )
     
     args = parser.parse_args()
     
     # Ejecutar seeds
-    asyncio.run(run_seeds(clean=args.clean))
+    asyncio.run(run_seeds(clean=args.clean, validate=args.validate))
 
 
 if __name__ == "__main__":
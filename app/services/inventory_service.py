@@ -124,7 +124,7 @@ class InventoryService(BaseService):
             "notes": notes
         }
         
-        movement = await self.movement_repo.create(movement_data)
+        movement = await self.movement_repo.add_movement(movement_data)
         
         # Verificar y resolver alertas de stock bajo si aplica
         await self.alert_service.resolve_alerts_if_needed(product, tenant_id)
@@ -135,6 +135,177 @@ class InventoryService(BaseService):
         
         return movement
     
+    async def add_stock_bulk(
+        self,
+        updates: List[Dict[str, Any]],
+        tenant_id: int,
+        user_id: Optional[int] = None
+    ) -> List[InventoryMovement]:
+        """
+        Agrega stock a varios productos en una sola transacción
+        
+        A diferencia de llamar add_stock en bucle, carga productos, asignaciones por sucursal
+        y alertas con una consulta cada una, e inserta todos los movimientos en lote.
+        
+        Args:
+            updates: Lista de dicts con product_id, branch_id y quantity, y opcionalmente
+                unit_cost, reference, notes, aisle, shelf y bin (mismos campos que add_stock)
+            tenant_id: ID del tenant
+            user_id: ID del usuario que realiza la operación
+        
+        Returns:
+            Lista de InventoryMovement creados, en el mismo orden que updates
+        
+        Raises:
+            ProductNotFoundException: Si algún producto no existe
+            InvalidStockOperationException: Si alguna cantidad es inválida
+        """
+        if not updates:
+            return []
+        
+        products, movements = await self._apply_bulk(updates, tenant_id, user_id, MovementType.ENTRY)
+        
+        await self.alert_service.resolve_alerts_bulk(list(products.values()), tenant_id)
+        
+        await self.commit()
+        
+        logger.info(f"Stock agregado en lote: {len(movements)} movimientos, {len(products)} productos")
+        
+        return movements
+    
+    async def remove_stock_bulk(
+        self,
+        updates: List[Dict[str, Any]],
+        tenant_id: int,
+        user_id: Optional[int] = None,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> List[InventoryMovement]:
+        """
+        Remueve stock de varios productos en una sola transacción
+        
+        Args:
+            updates: Lista de dicts con product_id, branch_id y quantity, y opcionalmente
+                reference, notes, aisle, shelf y bin (mismos campos que remove_stock)
+            tenant_id: ID del tenant
+            user_id: ID del usuario que realiza la operación
+        
+        Returns:
+            Lista de InventoryMovement creados, en el mismo orden que updates
+        
+        Raises:
+            ProductNotFoundException: Si algún producto no existe
+            InsufficientStockException: Si alguna sucursal no tiene suficiente stock
+            InvalidStockOperationException: Si alguna cantidad es inválida
+        """
+        if not updates:
+            return []
+        
+        products, movements = await self._apply_bulk(updates, tenant_id, user_id, MovementType.EXIT)
+        
+        await self.alert_service.trigger_alerts_bulk(list(products.values()), tenant_id, background_tasks)
+        
+        await self.commit()
+        
+        logger.info(f"Stock removido en lote: {len(movements)} movimientos, {len(products)} productos")
+        
+        return movements
+    
+    async def _get_products_for_update(self, ids: List[int], tenant_id: int) -> Dict[int, Product]:
+        """Carga y bloquea (SELECT ... FOR UPDATE) los productos indicados en una sola consulta"""
+        from sqlalchemy import select
+        result = await self.db.execute(
+            select(Product)
+            .where(Product.tenant_id == tenant_id, Product.id.in_(ids))
+            .order_by(Product.id)
+            .with_for_update()
+        )
+        products = {product.id: product for product in result.scalars().all()}
+        missing = set(ids) - products.keys()
+        if missing:
+            raise ProductNotFoundException(min(missing))
+        return products
+    
+    async def _apply_bulk(
+        self,
+        updates: List[Dict[str, Any]],
+        tenant_id: int,
+        user_id: Optional[int],
+        movement_type: MovementType
+    ):
+        """
+        Aplica en memoria las entradas/salidas de stock y crea los movimientos en un solo INSERT.
+        Devuelve (productos por id, movimientos en el orden de updates).
+        """
+        if any(update["quantity"] <= 0 for update in updates):
+            raise InvalidStockOperationException("La cantidad debe ser mayor a 0")
+        
+        from sqlalchemy import select, tuple_
+        from ..models.product_branch import ProductBranch
+        
+        # 1. Productos (bloqueados) y asignaciones por sucursal, una consulta cada uno
+        products = await self._get_products_for_update(
+            sorted({update["product_id"] for update in updates}), tenant_id
+        )
+        pairs = list({(update["product_id"], update["branch_id"]) for update in updates})
+        result = await self.db.execute(
+            select(ProductBranch).where(
+                tuple_(ProductBranch.product_id, ProductBranch.branch_id).in_(pairs)
+            )
+        )
+        branches = {(pb.product_id, pb.branch_id): pb for pb in result.scalars().all()}
+        
+        # 2. Aplicar los cambios en memoria y preparar los movimientos
+        sign = -1 if movement_type == MovementType.EXIT else 1
+        new_stock = {product_id: product.stock for product_id, product in products.items()}
+        movement_rows = []
+        for update in updates:
+            product = products[update["product_id"]]
+            key = (update["product_id"], update["branch_id"])
+            product_branch = branches.get(key)
+            if not product_branch:
+                product_branch = ProductBranch(
+                    product_id=key[0],
+                    branch_id=key[1],
+                    stock=0,
+                    min_stock=product.min_stock,
+                    max_stock=product.max_stock
+                )
+                self.db.add(product_branch)
+                branches[key] = product_branch
+            for location in ("aisle", "shelf", "bin"):
+                if update.get(location) is not None:
+                    setattr(product_branch, location, update[location])
+            
+            quantity = update["quantity"]
+            if sign < 0 and product_branch.stock < quantity:
+                raise InsufficientStockException(product.name, quantity, product_branch.stock)
+            
+            stock_before = product_branch.stock
+            product_branch.stock += sign * quantity
+            new_stock[product.id] += sign * quantity
+            
+            movement_rows.append({
+                "tenant_id": tenant_id,
+                "product_id": key[0],
+                "branch_id": key[1],
+                "user_id": user_id,
+                "movement_type": movement_type,
+                "quantity": sign * quantity,
+                "stock_before": stock_before,
+                "stock_after": product_branch.stock,
+                "unit_cost": update.get("unit_cost"),
+                "reference": update.get("reference"),
+                "notes": update.get("notes")
+            })
+        
+        # 3. Stock total por el ORM: el flush agrupa los UPDATE en un executemany y
+        #    el listener after_update audita cada producto
+        for product_id, stock in new_stock.items():
+            products[product_id].stock = stock
+        
+        # 4. Movimientos en un solo flush (INSERT ... RETURNING por lote, con auditoría)
+        return products, await self.movement_repo.add_movements(movement_rows)
+    
     async def remove_stock(
         self,
         product_id: int,
@@ -235,7 +406,7 @@ class InventoryService(BaseService):
             "notes": notes
         }
         
-        movement = await self.movement_repo.create(movement_data)
+        movement = await self.movement_repo.add_movement(movement_data)
         
         # Verificar y crear alertas si es necesario
         await self._check_and_create_alerts(product, tenant_id, background_tasks)
@@ -324,7 +495,7 @@ class InventoryService(BaseService):
             "notes": f"Ajuste de inventario: {reason}" if reason else "Ajuste de inventario"
         }
         
-        movement = await self.movement_repo.create(movement_data)
+        movement = await self.movement_repo.add_movement(movement_data)
         
         # Verificar alertas
         if difference < 0:
@@ -1,13 +1,25 @@
+import asyncio
 import io
+from concurrent.futures import ThreadPoolExecutor
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
 from reportlab.graphics.barcode import qr
-from reportlab.graphics.shapes import Drawing
-from reportlab.graphics import renderPDF
 from reportlab.lib.colors import black
 
+# Worker threads that encode QR codes ahead of the drawing loop
+QR_WORKERS = 4
+
+
 class LabelGenerator:
+    @staticmethod
+    async def generate_pdf_async(products, labels_per_row=3, rows_per_page=8):
+        """
+        Runs generate_pdf in a worker thread so ReportLab's CPU-bound rendering
+        does not block the event loop.
+        """
+        return await asyncio.to_thread(LabelGenerator.generate_pdf, products, labels_per_row, rows_per_page)
+
     @staticmethod
     def generate_pdf(products, labels_per_row=3, rows_per_page=8):
         """
@@ -27,64 +39,92 @@ class LabelGenerator:
         label_width = (page_width - 2 * margin_x - (labels_per_row - 1) * gap_x) / labels_per_row
         label_height = (page_height - 2 * margin_y - (rows_per_page - 1) * gap_y) / rows_per_page
 
-        x_pos = margin_x
-        y_pos = page_height - margin_y - label_height
+        # Precompute label positions for one page (row-major order)
+        xs = [margin_x + i * (label_width + gap_x) for i in range(labels_per_row)]
+        ys = [page_height - margin_y - label_height - j * (label_height + gap_y) for j in range(rows_per_page)]
+        positions = [(x, y) for y in ys for x in xs]
+        per_page = len(positions)
+
+        # One encoding per distinct code, submitted up front: workers encode the upcoming
+        # labels while the main thread draws, and repeated labels share the same future
+        with ThreadPoolExecutor(max_workers=QR_WORKERS) as pool:
+            qr_futures = {}
+            for product in products:
+                qr_data = LabelGenerator._qr_data(product)
+                if qr_data not in qr_futures:
+                    qr_futures[qr_data] = pool.submit(LabelGenerator._encode_qr, qr_data)
+
+            for start in range(0, len(products), per_page):
+                # New page only between chunks
+                if start:
+                    c.showPage()
+                placed = list(zip(positions, products[start:start + per_page]))
+                LabelGenerator._draw_page(c, placed, label_width, label_height, qr_futures)
+
+        c.save()
+        buffer.seek(0)
+        return buffer
 
-        count = 0
-        for product in products:
-            # Draw label border (delicate light gray)
-            c.setStrokeColorRGB(0.9, 0.9, 0.9)
-            c.setLineWidth(0.1)
+    @staticmethod
+    def _draw_page(c, placed, label_width, label_height, qr_futures):
+        """
+        Draws one page of labels, given as ((x_pos, y_pos), product) pairs with each
+        bottom-left corner at (x_pos, y_pos). Elements are drawn in passes (borders,
+        names, SKUs, prices, QR codes) so each font/color is set once per page
+        instead of once per label.
+        """
+        # Label borders (delicate light gray)
+        c.setStrokeColorRGB(0.9, 0.9, 0.9)
+        c.setLineWidth(0.1)
+        for (x_pos, y_pos), _ in placed:
             c.roundRect(x_pos, y_pos, label_width, label_height, 2*mm)
 
-            # Product Name
-            c.setFillColor(black)
-            c.setFont("Helvetica-Bold", 9)
+        # Product names
+        c.setFillColor(black)
+        c.setFont("Helvetica-Bold", 9)
+        for (x_pos, y_pos), product in placed:
             name_text = product.name[:35] + ("..." if len(product.name) > 35 else "")
             c.drawString(x_pos + 3*mm, y_pos + label_height - 5*mm, name_text)
 
-            # SKU
-            c.setFont("Helvetica", 7)
-            c.setFillColorRGB(0.4, 0.4, 0.4)
+        # SKUs
+        c.setFont("Helvetica", 7)
+        c.setFillColorRGB(0.4, 0.4, 0.4)
+        for (x_pos, y_pos), product in placed:
             c.drawString(x_pos + 3*mm, y_pos + label_height - 9*mm, f"SKU: {product.sku}")
 
-            # Price
-            c.setFont("Helvetica-Bold", 12)
-            c.setFillColor(black)
-            price_str = f"${float(product.price):,.2f}"
-            c.drawString(x_pos + 3*mm, y_pos + 5*mm, price_str)
-
-            # QR Code
-            qr_data = product.barcode if product.barcode else product.sku
-            qr_code = qr.QrCodeWidget(qr_data)
-            qr_code.barFillColor = black
-            
-            bounds = qr_code.getBounds()
-            qr_w = bounds[2] - bounds[0]
-            qr_h = bounds[3] - bounds[1]
-            
-            # Target size for QR
-            size = min(label_height * 0.5, label_width * 0.35)
-            
-            d = Drawing(size, size, transform=[size/qr_w, 0, 0, size/qr_h, 0, 0])
-            d.add(qr_code)
-            
-            renderPDF.draw(d, c, x_pos + label_width - size - 2*mm, y_pos + 2*mm)
-
-            # Update positions
-            count += 1
-            if count % labels_per_row == 0:
-                x_pos = margin_x
-                y_pos -= (label_height + gap_y)
-            else:
-                x_pos += (label_width + gap_x)
-
-            # New page if needed
-            if count % (labels_per_row * rows_per_page) == 0 and count < len(products):
-                c.showPage()
-                x_pos = margin_x
-                y_pos = page_height - margin_y - label_height
+        # Prices
+        c.setFont("Helvetica-Bold", 12)
+        c.setFillColor(black)
+        for (x_pos, y_pos), product in placed:
+            c.drawString(x_pos + 3*mm, y_pos + 5*mm, f"${float(product.price):,.2f}")
 
-        c.save()
-        buffer.seek(0)
-        return buffer
+        # QR codes: dark modules drawn straight onto the canvas, scaled to the target size
+        size = min(label_height * 0.5, label_width * 0.35)
+        for (x_pos, y_pos), product in placed:
+            qr_w, qr_h, modules = qr_futures[LabelGenerator._qr_data(product)].result()
+            c.saveState()
+            c.translate(x_pos + label_width - size - 2*mm, y_pos + 2*mm)
+            c.scale(size / qr_w, size / qr_h)
+            for mx, my, mw, mh in modules:
+                c.rect(mx, my, mw, mh, stroke=0, fill=1)
+            c.restoreState()
+
+    @staticmethod
+    def _qr_data(product):
+        """QR payload for a product: its barcode, falling back to the SKU."""
+        return product.barcode if product.barcode else product.sku
+
+    @staticmethod
+    def _encode_qr(qr_data):
+        """
+        Encodes a QR code once and returns (width, height, dark module rectangles)
+        in widget coordinates, ready to be drawn with a canvas scale.
+        """
+        qr_code = qr.QrCodeWidget(qr_data)
+        x0, y0, x1, y1 = qr_code.getBounds()
+        modules = [
+            (shape.x, shape.y, shape.width, shape.height)
+            for shape in qr_code.draw().contents
+            if shape.fillColor is not None
+        ]
+        return x1 - x0, y1 - y0, modules
@@ -1,15 +1,78 @@
+import asyncio
 import io
+import time
+from collections import OrderedDict
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from datetime import datetime
+from decimal import Decimal
+
+# Filas por tabla en el reporte de ventas
+SALES_TABLE_CHUNK = 1000
+SALES_DATE_FORMAT = "%d/%m/%Y %H:%M"
+
+# PDFs de ventas ya generados (LRU en memoria), por (tenant, nombre, filtros, marca de agua).
+# El TTL acota lo que la marca de agua no ve (ej. un producto renombrado que cambia la búsqueda)
+SALES_PDF_CACHE_SIZE = 64
+SALES_PDF_CACHE_TTL = 300  # segundos
+_sales_pdf_cache: "OrderedDict[tuple, tuple[float, bytes]]" = OrderedDict()
 
 class ReportGenerator:
     @staticmethod
-    def generate_sales_summary_pdf(sales, tenant_name: str, filters: dict):
+    async def generate_sales_summary_pdf_async(sales, tenant_name: str, filters: dict, total_sum=None, data_as_of=None):
+        """Ejecuta generate_sales_summary_pdf en un hilo para no bloquear el event loop"""
+        return await asyncio.to_thread(
+            ReportGenerator.generate_sales_summary_pdf, sales, tenant_name, filters, total_sum, data_as_of
+        )
+
+    @staticmethod
+    async def get_sales_summary_pdf_cached(key: tuple, load_sales, tenant_name: str, filters: dict, data_as_of=None):
+        """
+        Retorna el PDF de ventas desde el caché LRU o lo genera. `key` debe incluir la
+        marca de agua de las ventas filtradas, así un cambio en los datos produce otra
+        clave y la entrada vieja simplemente sale por LRU; además cada entrada vence a los
+        SALES_PDF_CACHE_TTL segundos. `load_sales` es un callable async que retorna
+        (sales, total_sum) y solo se invoca si no hay acierto. `data_as_of` (la última
+        actualización de la marca de agua) se imprime en lugar de la hora de generación,
+        para que los bytes cacheados no muestren una hora vieja.
+        """
+        now = time.monotonic()
+        entry = _sales_pdf_cache.get(key)
+        if entry is not None:
+            expires_at, pdf_bytes = entry
+            if expires_at > now:
+                _sales_pdf_cache.move_to_end(key)
+                return io.BytesIO(pdf_bytes)
+            del _sales_pdf_cache[key]
+
+        sales, total_sum = await load_sales()
+        buffer = await ReportGenerator.generate_sales_summary_pdf_async(
+            sales, tenant_name, filters, total_sum, data_as_of
+        )
+        _sales_pdf_cache[key] = (now + SALES_PDF_CACHE_TTL, buffer.getvalue())
+        while len(_sales_pdf_cache) > SALES_PDF_CACHE_SIZE:
+            _sales_pdf_cache.popitem(last=False)
+        return buffer
+
+    @staticmethod
+    async def generate_purchase_order_pdf_async(purchase, tenant_name: str):
+        """Ejecuta generate_purchase_order_pdf en un hilo para no bloquear el event loop"""
+        return await asyncio.to_thread(ReportGenerator.generate_purchase_order_pdf, purchase, tenant_name)
+
+    @staticmethod
+    async def generate_expenses_pdf_async(expenses, tenant_name: str, filters: dict):
+        """Ejecuta generate_expenses_pdf en un hilo para no bloquear el event loop"""
+        return await asyncio.to_thread(ReportGenerator.generate_expenses_pdf, expenses, tenant_name, filters)
+
+    @staticmethod
+    def generate_sales_summary_pdf(sales, tenant_name: str, filters: dict, total_sum=None, data_as_of=None):
         """
         Genera un reporte PDF resumen de ventas.
+        `sales` son tuplas (id, created_at, seller, payment_method, status, total_amount);
+        si no se recibe `total_sum` (calculado en SQL) se suma aquí. Con `data_as_of` el
+        subtítulo muestra la fecha de los datos en lugar de la hora de generación.
         """
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=letter)
@@ -36,8 +99,11 @@ class ReportGenerator:
             spaceAfter=20,
             textColor=colors.gray
         )
-        date_str = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        elements.append(Paragraph(f"Generado el: {date_str}", subtitle_style))
+        if data_as_of is not None:
+            elements.append(Paragraph(f"Datos al: {data_as_of.strftime('%d/%m/%Y %H:%M:%S')}", subtitle_style))
+        else:
+            date_str = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+            elements.append(Paragraph(f"Generado el: {date_str}", subtitle_style))
 
         # Información de filtros
         filter_text = "Filtros aplicados: "
@@ -55,32 +121,33 @@ class ReportGenerator:
         elements.append(Spacer(1, 12))
 
         # Tabla de Datos
-        data = [["ID", "Fecha", "Vendedor", "Método", "Estado", "Total"]]
-        total_sum = 0
-        
-        for sale in sales:
-            vendedor = sale.user.email.split('@')[0] if sale.user else "N/A"
-            total_sum += float(sale.total_amount)
-            data.append([
-                f"#{sale.id}",
-                sale.created_at.strftime("%d/%m/%Y %H:%M"),
-                vendedor,
-                sale.payment_method.upper(),
-                sale.status.upper(),
-                f"${float(sale.total_amount):,.2f}"
-            ])
+        header = ["ID", "Fecha", "Vendedor", "Método", "Estado", "Total"]
+        rows = [
+            [
+                f"#{sale_id}",
+                created_at.strftime(SALES_DATE_FORMAT),
+                seller or "N/A",
+                method.upper(),
+                sale_status.upper(),
+                f"${amount:,.2f}"
+            ]
+            for sale_id, created_at, seller, method, sale_status, amount in sales
+        ]
+        if total_sum is None:
+            total_sum = sum((sale[5] for sale in sales), Decimal(0))
 
         # Fila de Total
-        data.append(["", "", "", "", "TOTAL:", f"${total_sum:,.2f}"])
+        total_row = ["", "", "", "", "TOTAL:", f"${total_sum:,.2f}"]
 
-        table = Table(data, colWidths=[40, 100, 80, 80, 80, 80])
-        table.setStyle(TableStyle([
+        header_style = [
             ('BACKGROUND', (0, 0), (-1, 0), colors.indigo),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, 0), 10),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ]
+        total_style = [
             ('BACKGROUND', (0, 1), (-1, -2), colors.white),
             ('GRID', (0, 0), (-1, -2), 1, colors.lightgrey),
             ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
@@ -88,9 +155,21 @@ class ReportGenerator:
             ('ALIGN', (-2, -1), (-1, -1), 'RIGHT'),
             ('TEXTCOLOR', (0, -1), (-1, -1), colors.indigo),
             ('LINEABOVE', (0, -1), (-1, -1), 1, colors.indigo),
-        ]))
-        
-        elements.append(table)
+        ]
+        body_style = [
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, colors.lightgrey),
+        ]
+
+        # Tablas de tamaño acotado (el cálculo de alturas de ReportLab crece mal con tablas enormes);
+        # el encabezado se repite en cada salto de página y el total va al final de la última
+        chunks = [rows[i:i + SALES_TABLE_CHUNK] for i in range(0, len(rows), SALES_TABLE_CHUNK)] or [[]]
+        for index, chunk in enumerate(chunks):
+            is_last = index == len(chunks) - 1
+            data = [header] + chunk + ([total_row] if is_last else [])
+            table = Table(data, colWidths=[40, 100, 80, 80, 80, 80], repeatRows=1)
+            table.setStyle(TableStyle(header_style + (total_style if is_last else body_style)))
+            elements.append(table)
         
         # Generar PDF
         doc.build(elements)
@@ -200,8 +279,11 @@ class ReportGenerator:
             spaceAfter=20,
             textColor=colors.gray
         )
-        date_str = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        elements.append(Paragraph(f"Generado el: {date_str}", subtitle_style))
+        if data_as_of is not None:
+            elements.append(Paragraph(f"Datos al: {data_as_of.strftime('%d/%m/%Y %H:%M:%S')}", subtitle_style))
+        else:
+            date_str = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+            elements.append(Paragraph(f"Generado el: {date_str}", subtitle_style))
 
         # Filtros
         filter_parts = []
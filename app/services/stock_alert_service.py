@@ -82,6 +82,78 @@ class StockAlertService:
                 )
                 logger.info(f"Tarea de notificación de stock encolada para {tenant.email}")
 
+    async def trigger_alerts_bulk(
+        self,
+        products: List[Product],
+        tenant_id: int,
+        background_tasks: Optional[BackgroundTasks] = None
+    ):
+        """
+        Versión en lote de check_and_trigger_alerts: una consulta para las alertas activas,
+        un solo flush (ORM) para las nuevas y una sola búsqueda del tenant para notificar.
+        """
+        if not products:
+            return
+        from sqlalchemy import select, and_
+        query = select(StockAlert.product_id, StockAlert.alert_type).where(
+            and_(
+                StockAlert.product_id.in_([product.id for product in products]),
+                StockAlert.tenant_id == tenant_id,
+                StockAlert.status == AlertStatus.ACTIVE
+            )
+        )
+        result = await self.db.execute(query)
+        active = set(result.all())
+        
+        new_alerts = []
+        notify = []
+        for product in products:
+            if product.stock <= 0:
+                if (product.id, AlertType.OUT_OF_STOCK) in active:
+                    continue
+                alert_type, threshold = AlertType.OUT_OF_STOCK, 0
+                message = f"Producto '{product.name}' sin stock"
+            elif product.stock <= product.min_stock:
+                if (product.id, AlertType.LOW_STOCK) in active:
+                    continue
+                alert_type, threshold = AlertType.LOW_STOCK, product.min_stock
+                message = f"Stock bajo para '{product.name}': {product.stock} unidades (mínimo: {product.min_stock})"
+            else:
+                continue
+            new_alerts.append(StockAlert(
+                tenant_id=tenant_id,
+                product_id=product.id,
+                alert_type=alert_type,
+                status=AlertStatus.ACTIVE,
+                current_stock=product.stock,
+                threshold_value=threshold,
+                message=message
+            ))
+            notify.append(product)
+        
+        if not new_alerts:
+            return
+        # Un solo flush: el ORM agrupa los INSERT y after_insert audita cada alerta
+        self.db.add_all(new_alerts)
+        await self.db.flush()
+        
+        if background_tasks:
+            tenant = await self.tenant_repo.get_by_id(tenant_id)
+            if tenant and tenant.email:
+                for product in notify:
+                    body = self.notif_service.get_stock_alert_template(
+                        product.name,
+                        product.stock,
+                        product.min_stock if product.stock > 0 else 0
+                    )
+                    background_tasks.add_task(
+                        self.notif_service.send_email,
+                        tenant.email,
+                        f"⚠️ Alerta de Inventario: {product.name}",
+                        body
+                    )
+                logger.info(f"{len(notify)} notificaciones de stock encoladas para {tenant.email}")
+
     async def resolve_alerts_if_needed(self, product: Product, tenant_id: int):
         """Resuelve alertas si el stock ha mejorado"""
         from sqlalchemy import select, and_
@@ -102,3 +174,31 @@ class StockAlertService:
                 alert.resolve()
                 
         await self.db.flush()
+
+    async def resolve_alerts_bulk(self, products: List[Product], tenant_id: int):
+        """
+        Versión en lote de resolve_alerts_if_needed: una sola consulta para las alertas activas
+        de todos los productos. Las que quedan resueltas pasan por alert.resolve() y un flush,
+        así el ORM agrupa los UPDATE y el listener after_update las audita.
+        """
+        if not products:
+            return
+        from sqlalchemy import select, and_
+        products_by_id = {product.id: product for product in products}
+        query = select(StockAlert).where(
+            and_(
+                StockAlert.product_id.in_(list(products_by_id)),
+                StockAlert.tenant_id == tenant_id,
+                StockAlert.status == AlertStatus.ACTIVE
+            )
+        )
+        result = await self.db.execute(query)
+        
+        for alert in result.scalars().all():
+            product = products_by_id[alert.product_id]
+            if alert.alert_type == AlertType.OUT_OF_STOCK and product.stock > 0:
+                alert.resolve()
+            elif alert.alert_type == AlertType.LOW_STOCK and product.stock > product.min_stock:
+                alert.resolve()
+        
+        await self.db.flush()
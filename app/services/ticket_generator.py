@@ -1,102 +1,420 @@
 import io
+import asyncio
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import NamedTuple, Tuple
+from collections import OrderedDict
+from functools import lru_cache
 from reportlab.lib.pagesizes import letter
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
 from reportlab.lib.colors import black, gray
 from datetime import datetime
+from decimal import Decimal
+
+from ..core.config import settings
+
+# Medidas del ticket precalculadas en puntos (una sola vez al importar)
+_WIDTH = 80 * mm          # Ancho típico de ticket: 80mm
+_HALF = _WIDTH / 2
+_LEFT = 5 * mm
+_RIGHT = _WIDTH - 5 * mm
+# Alto exacto: encabezado (borde superior -> línea base del primer ítem) + un paso por
+# ítem (nombre + cantidad) + pie (separador final -> borde inferior, margen de 10mm)
+_HEADER_H = 53 * mm
+_ITEM_STRIDE = 12 * mm
+_FOOTER_H = 48 * mm
+_STEP4 = 4 * mm
+_STEP5 = 5 * mm
+_STEP6 = 6 * mm
+_STEP8 = 8 * mm
+_STEP10 = 10 * mm
+_STEP15 = 15 * mm
+
+class _TicketLayout(NamedTuple):
+    """Coordenadas (en puntos, desde abajo) de cada elemento para una cantidad de ítems"""
+    height: float
+    name_y: float
+    title_y: float
+    info_line_y: float
+    order_y: float
+    date_y: float
+    columns_y: float
+    header_line_y: float
+    item_ys: Tuple[Tuple[float, float], ...]  # (línea del nombre, línea de cantidad) por ítem
+    total_line_y: float
+    total_y: float
+    payment_y: float
+    thanks_y: float
+    brand_y: float
+
+
+@lru_cache(maxsize=128)
+def _layout(item_count: int) -> _TicketLayout:
+    """
+    Diagramación completa del ticket para `item_count` ítems, calculada una sola vez:
+    el render solo lee coordenadas, sin aritmética por ticket.
+    """
+    height = _HEADER_H + item_count * _ITEM_STRIDE + _FOOTER_H
+    name_y = height - _STEP10
+    title_y = name_y - _STEP8
+    info_line_y = title_y - _STEP5
+    order_y = info_line_y - _STEP6
+    date_y = order_y - _STEP5
+    columns_y = date_y - _STEP5 - _STEP4
+    header_line_y = columns_y - _STEP4
+    first_item_y = header_line_y - _STEP6
+    item_ys = tuple(
+        (y, y - _STEP4)
+        for y in (first_item_y - index * _ITEM_STRIDE for index in range(item_count))
+    )
+    total_line_y = first_item_y - item_count * _ITEM_STRIDE
+    total_y = total_line_y - _STEP10
+    payment_y = total_y - _STEP8
+    thanks_y = payment_y - _STEP15
+    return _TicketLayout(
+        height, name_y, title_y, info_line_y, order_y, date_y, columns_y, header_line_y,
+        item_ys, total_line_y, total_y, payment_y, thanks_y, thanks_y - _STEP5
+    )
+
+
+# Tickets ya generados (LRU en memoria) por hash del contenido impreso: reimpresiones,
+# reenvíos y reintentos de impresora no vuelven a pasar por ReportLab
+TICKET_CACHE_SIZE = 1024
+_ticket_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+
+# Textos fijos del encabezado y pie
+_HEADER_TITLE = "COMPROBANTE DE VENTA"
+_FOOTER_THANKS = "¡Gracias por su compra!"
+_FOOTER_BRAND = "Inventory Administration"
+
+
+def _money(value, _cent=Decimal("0.01")) -> str:
+    """Monto con separador de miles y 2 decimales, en Decimal (sin pasar por float)"""
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return format(value.quantize(_cent), ",")
+
+
+# Mayúsculas memorizadas: el nombre del tenant, los métodos de pago y los nombres de
+# producto se repiten entre tickets, así que cada variante se convierte una sola vez
+_upper = lru_cache(maxsize=4096)(str.upper)
+
+
+@lru_cache(maxsize=256)
+def _centred_x(text: str, font: str, size: float) -> float:
+    """X inicial para centrar un texto fijo en el ticket (el ancho se mide una sola vez)"""
+    return _HALF - 0.5 * stringWidth(text, font, size)
+
+
+@lru_cache(maxsize=4096)
+def _right_x(text: str, font: str, size: float) -> float:
+    """X inicial para alinear un texto al margen derecho (montos repetidos se miden una vez)"""
+    return _RIGHT - stringWidth(text, font, size)
+
+
+# Posiciones de los textos fijos, medidas una sola vez al importar el módulo
+_TITLE_X = _centred_x(_HEADER_TITLE, "Helvetica", 9)
+_THANKS_X = _centred_x(_FOOTER_THANKS, "Helvetica-Oblique", 8)
+_BRAND_X = _centred_x(_FOOTER_BRAND, "Helvetica-Oblique", 8)
+_TOTAL_HEADER_X = _right_x("TOTAL", "Helvetica-Bold", 8)
+
+
+# Pool de procesos para renderizar tickets fuera del event loop (ReportLab es CPU puro);
+# se crea al primer uso con "spawn" para no heredar el estado del servidor. Cada worker
+# web tiene su propio pool, por eso el tamaño sale de settings.ticket_pool_workers
+# (pocos procesos) y no de la cantidad de CPUs
+_pool: ProcessPoolExecutor = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=max(1, settings.ticket_pool_workers),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pool
+
+
+def shutdown_ticket_pool() -> None:
+    """Cierra el pool de procesos de tickets (al apagar la aplicación)"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _ticket_snapshot(sale, items: list) -> SimpleNamespace:
+    """Copia serializable (pickle) de los campos que imprime el ticket, sin objetos ORM"""
+    return SimpleNamespace(
+        id=sale.id,
+        created_at=sale.created_at,
+        total_amount=sale.total_amount,
+        payment_method=sale.payment_method,
+        items=[
+            SimpleNamespace(
+                product=SimpleNamespace(name=item.product.name),
+                quantity=item.quantity,
+                unit_price=item.unit_price,
+                subtotal=item.subtotal
+            )
+            for item in items
+        ]
+    )
+
+
+def _render_snapshot(snapshot: SimpleNamespace, tenant_name: str, engine: str = "reportlab") -> bytes:
+    """Punto de entrada del proceso hijo; `engine` elige ReportLab o fpdf2"""
+    if engine == "fpdf2":
+        from .ticket_generator_fpdf import TicketGeneratorFPDF
+        return TicketGeneratorFPDF.render(snapshot, tenant_name)
+    return TicketGenerator._render_ticket(snapshot, snapshot.items, tenant_name)
+
+
+# ESC/POS para impresoras térmicas de 80mm (fuente A: 48 columnas)
+ESCPOS_COLUMNS = 48
+_ESC_INIT = b"\x1b@"
+_ESC_CODEPAGE_CP850 = b"\x1bt\x02"
+_ESC_ALIGN_LEFT = b"\x1ba\x00"
+_ESC_ALIGN_CENTER = b"\x1ba\x01"
+_ESC_BOLD_ON = b"\x1bE\x01"
+_ESC_BOLD_OFF = b"\x1bE\x00"
+_GS_SIZE_NORMAL = b"\x1d!\x00"
+_GS_SIZE_DOUBLE = b"\x1d!\x11"
+_GS_SIZE_TALL = b"\x1d!\x01"
+_ESC_FEED_3 = b"\x1bd\x03"
+_GS_CUT = b"\x1dVB\x00"
+_DASHED_LINE = "-" * ESCPOS_COLUMNS
+_SOLID_LINE = "=" * ESCPOS_COLUMNS
+
+
+def _escpos_text(text: str) -> bytes:
+    """Línea de texto en la página de códigos CP850 (acentos y ¡ del español)"""
+    return text.encode("cp850", errors="replace") + b"\n"
+
+
+def _escpos_columns(left: str, right: str, width: int = ESCPOS_COLUMNS) -> str:
+    """Texto a la izquierda y a la derecha en una misma línea de `width` columnas"""
+    left = left[:max(width - len(right) - 1, 0)]
+    return left + " " * (width - len(left) - len(right)) + right
+
+
+def _draw_separators(c, dashed_ys: list, solid_y: float = None) -> None:
+    """Separadores horizontales: las punteadas en un único path y la sólida aparte"""
+    path = c.beginPath()
+    for y in dashed_ys:
+        path.moveTo(_LEFT, y)
+        path.lineTo(_RIGHT, y)
+    c.setDash(1, 2)
+    c.drawPath(path, stroke=1, fill=0)
+    c.setDash()
+    if solid_y is not None:
+        c.line(_LEFT, solid_y, _RIGHT, solid_y)
+
+
+def _ticket_key(sale, items: list, tenant_name: str, engine: str = "reportlab") -> bytes:
+    """Hash (blake2b) de todos los campos que aparecen en el ticket y del motor que lo dibuja"""
+    parts = (
+        engine,
+        sale.id,
+        sale.updated_at.isoformat() if sale.updated_at else None,
+        sale.created_at.isoformat(),
+        str(sale.total_amount),
+        sale.payment_method,
+        tuple(
+            (item.product_id, item.product.name, item.quantity, str(item.unit_price), str(item.subtotal))
+            for item in items
+        ),
+        tenant_name,
+    )
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).digest()
+
 
 class TicketGenerator:
     @staticmethod
     def generate_ticket(sale, tenant_name: str):
         """
-        Genera un ticket de venta en PDF estilo recibo de 80mm.
+        Genera un ticket de venta en PDF estilo recibo de 80mm (como BytesIO).
+        Si el mismo contenido ya se generó, retorna el PDF cacheado.
         """
-        # Ancho típico de ticket: 80mm
-        width = 80 * mm
-        # El alto depende de la cantidad de ítems, empezamos con algo base
-        item_count = len(sale.items)
-        height = (100 + (item_count * 15)) * mm
-        
-        buffer = io.BytesIO()
-        c = canvas.Canvas(buffer, pagesize=(width, height))
+        return io.BytesIO(TicketGenerator.generate_ticket_bytes(sale, tenant_name))
+
+    @staticmethod
+    def generate_ticket_bytes(sale, tenant_name: str) -> bytes:
+        """Igual que generate_ticket, pero retorna directamente los bytes del PDF"""
+        # La relación se lee una sola vez (ya viene cargada por SaleRepository.get_by_id)
+        items = list(sale.items)
+        key = _ticket_key(sale, items, tenant_name)
+        pdf_bytes = _ticket_cache.get(key)
+        if pdf_bytes is not None:
+            _ticket_cache.move_to_end(key)
+            return pdf_bytes
+
+        pdf_bytes = TicketGenerator._render_ticket(sale, items, tenant_name)
+        TicketGenerator._remember(key, pdf_bytes)
+        return pdf_bytes
+
+    @staticmethod
+    async def generate_ticket_async(sale, tenant_name: str, engine: str = "reportlab") -> bytes:
+        """
+        Igual que generate_ticket_bytes, pero el render se ejecuta en el pool de procesos
+        para no bloquear el event loop. El caché se consulta en el proceso actual.
+        `engine` ("reportlab" o "fpdf2", ver settings.ticket_pdf_engine) elige el motor.
+        """
+        items = list(sale.items)
+        key = _ticket_key(sale, items, tenant_name, engine)
+        pdf_bytes = _ticket_cache.get(key)
+        if pdf_bytes is not None:
+            _ticket_cache.move_to_end(key)
+            return pdf_bytes
+
+        loop = asyncio.get_running_loop()
+        pdf_bytes = await loop.run_in_executor(
+            _get_pool(), _render_snapshot, _ticket_snapshot(sale, items), tenant_name, engine
+        )
+        TicketGenerator._remember(key, pdf_bytes)
+        return pdf_bytes
+
+    @staticmethod
+    async def generate_tickets_batch(sales, tenant_name: str):
+        """Genera varios tickets (bytes) en paralelo en el pool de procesos; mismo orden que sales"""
+        return await asyncio.gather(
+            *(TicketGenerator.generate_ticket_async(sale, tenant_name) for sale in sales)
+        )
+
+    @staticmethod
+    def generate_ticket_escpos(sale, tenant_name: str) -> bytes:
+        """
+        Genera el ticket como bytes ESC/POS para enviarlo directo a una impresora térmica,
+        sin pasar por PDF. Mismo contenido que generate_ticket.
+        """
+        items = list(sale.items)
+        out = [
+            _ESC_INIT, _ESC_CODEPAGE_CP850,
+            # Header - Empresa
+            _ESC_ALIGN_CENTER, _ESC_BOLD_ON, _GS_SIZE_DOUBLE,
+            _escpos_text(_upper(tenant_name)[:ESCPOS_COLUMNS // 2]),
+            _GS_SIZE_NORMAL, _ESC_BOLD_OFF,
+            _escpos_text(_HEADER_TITLE),
+            # Info Venta
+            _ESC_ALIGN_LEFT,
+            _escpos_text(_DASHED_LINE),
+            _ESC_BOLD_ON, _escpos_text(f"ORDEN: #{sale.id}"), _ESC_BOLD_OFF,
+            _escpos_text(f"FECHA: {sale.created_at.strftime('%d/%m/%Y %H:%M')}"),
+            # Tabla de ítems
+            _ESC_BOLD_ON, _escpos_text(_escpos_columns("PRODUCTO", "TOTAL")), _ESC_BOLD_OFF,
+            _escpos_text(_SOLID_LINE),
+        ]
+        for item in items:
+            out.append(_escpos_text(
+                _escpos_columns(_upper(item.product.name[:25]), f"${_money(item.subtotal)}")
+            ))
+            out.append(_escpos_text(f"  {item.quantity} x ${_money(item.unit_price)}"))
+        out += [
+            # Totales
+            _escpos_text(_DASHED_LINE),
+            _ESC_BOLD_ON, _GS_SIZE_TALL,
+            _escpos_text(_escpos_columns("TOTAL:", f"${_money(sale.total_amount)}")),
+            _GS_SIZE_NORMAL, _ESC_BOLD_OFF,
+            _escpos_text(f"PAGO: {_upper(sale.payment_method)}"),
+            # Footer
+            b"\n", _ESC_ALIGN_CENTER,
+            _escpos_text(_FOOTER_THANKS),
+            _escpos_text(_FOOTER_BRAND),
+            _ESC_FEED_3, _GS_CUT,
+        ]
+        return b"".join(out)
+
+    @staticmethod
+    def _remember(key: bytes, pdf_bytes: bytes) -> None:
+        """Guarda un ticket en el caché LRU"""
+        _ticket_cache[key] = pdf_bytes
+        if len(_ticket_cache) > TICKET_CACHE_SIZE:
+            _ticket_cache.popitem(last=False)
+
+    @staticmethod
+    def _render_ticket(sale, items: list, tenant_name: str) -> bytes:
+        """Dibuja el ticket con ReportLab y retorna los bytes del PDF"""
+        # Coordenadas precalculadas por cantidad de ítems (alto exacto, una sola página)
+        layout = _layout(len(items))
         
-        # Invertimos coordenadas para escribir de arriba hacia abajo
-        curr_y = height - 10 * mm
+        # Sin archivo destino: el PDF se obtiene al final con getpdfdata().
+        # Sin compresión: para un recibo de pocos KB zlib cuesta más CPU de lo que ahorra.
+        # invariant: sin fecha de creación ni ID aleatorio, el mismo ticket da los mismos bytes
+        c = canvas.Canvas(None, pagesize=(_WIDTH, layout.height), pageCompression=0, invariant=1)
+        # Métodos del canvas como locales (LOAD_FAST en lugar de LOAD_ATTR en cada llamada)
+        setFont = c.setFont
+        drawString = c.drawString
         
-        # Header - Empresa
-        c.setFont("Helvetica-Bold", 14)
-        c.drawCentredString(width/2, curr_y, tenant_name.upper())
-        curr_y -= 8 * mm
+        # Header - Empresa (posiciones cacheadas por tenant / texto fijo)
+        header_name = _upper(tenant_name)
+        setFont("Helvetica-Bold", 14)
+        drawString(_centred_x(header_name, "Helvetica-Bold", 14), layout.name_y, header_name)
         
-        c.setFont("Helvetica", 9)
-        c.drawCentredString(width/2, curr_y, "COMPROBANTE DE VENTA")
-        curr_y -= 5 * mm
+        setFont("Helvetica", 9)
+        drawString(_TITLE_X, layout.title_y, _HEADER_TITLE)
         
         # Info Venta
-        c.setDash(1, 2)
-        c.line(5*mm, curr_y, width-5*mm, curr_y)
-        c.setDash()
-        curr_y -= 6 * mm
+        setFont("Helvetica-Bold", 9)
+        drawString(_LEFT, layout.order_y, f"ORDEN: #{sale.id}")
         
-        c.setFont("Helvetica-Bold", 9)
-        c.drawString(5*mm, curr_y, f"ORDEN: #{sale.id}")
-        curr_y -= 5 * mm
-        
-        c.setFont("Helvetica", 8)
-        c.drawString(5*mm, curr_y, f"FECHA: {sale.created_at.strftime('%d/%m/%Y %H:%M')}")
-        curr_y -= 5 * mm
+        setFont("Helvetica", 8)
+        drawString(_LEFT, layout.date_y, f"FECHA: {sale.created_at.strftime('%d/%m/%Y %H:%M')}")
         
         # Tabla de ítems
-        curr_y -= 4 * mm
-        c.setFont("Helvetica-Bold", 8)
-        c.drawString(5*mm, curr_y, "PRODUCTO")
-        c.drawRightString(width-5*mm, curr_y, "TOTAL")
-        curr_y -= 4 * mm
+        setFont("Helvetica-Bold", 8)
+        drawString(_LEFT, layout.columns_y, "PRODUCTO")
+        drawString(_TOTAL_HEADER_X, layout.columns_y, "TOTAL")
+        
+        # Separadores: las líneas punteadas van en un solo path (un solo cambio de dash)
+        _draw_separators(c, [layout.info_line_y, layout.total_line_y], layout.header_line_y)
         
-        c.line(5*mm, curr_y, width-5*mm, curr_y)
-        curr_y -= 6 * mm
+        # Textos de los ítems construidos antes de dibujar, en listas paralelas (una por
+        # columna): todo el acceso a atributos ORM ocurre aquí, fuera de las pasadas de dibujo
+        names = [_upper(item.product.name[:25]) for item in items]
+        subtotals = [f"${_money(item.subtotal)}" for item in items]
+        qty_lines = [f"{item.quantity} x ${_money(item.unit_price)}" for item in items]
         
-        c.setFont("Helvetica", 8)
-        for item in sale.items:
-            # Nombre del producto y cantidad
-            name = item.product.name[:25]
-            qty_price = f"{item.quantity} x ${float(item.unit_price):,.2f}"
+        if items:
+            # Un solo objeto de texto (un bloque BT ... ET) para todos los ítems, en tres
+            # pasadas (nombres, subtotales, cantidades) con un solo setFont por pasada
+            item_ys = layout.item_ys
+            text = c.beginText()
+            text.setFont("Helvetica-Bold", 8)
+            for (y, _), name in zip(item_ys, names):
+                text.setTextOrigin(_LEFT, y)
+                text.textOut(name)
             
-            c.setFont("Helvetica-Bold", 8)
-            c.drawString(5*mm, curr_y, name.upper())
-            c.setFont("Helvetica", 8)
-            c.drawRightString(width-5*mm, curr_y, f"${float(item.subtotal):,.2f}")
-            curr_y -= 4 * mm
-            c.setFont("Helvetica", 7)
-            c.drawString(5*mm, curr_y, qty_price)
-            curr_y -= 8 * mm
+            text.setFont("Helvetica", 8)
+            for (y, _), subtotal in zip(item_ys, subtotals):
+                text.setTextOrigin(_right_x(subtotal, "Helvetica", 8), y)
+                text.textOut(subtotal)
             
-            # Si nos quedamos sin espacio (poco probable para tickets cortos)
-            if curr_y < 15*mm:
-                c.showPage()
-                curr_y = height - 15*mm
+            text.setFont("Helvetica", 7)
+            for (_, qty_y), qty_price in zip(item_ys, qty_lines):
+                text.setTextOrigin(_LEFT, qty_y)
+                text.textOut(qty_price)
+            c.drawText(text)
 
         # Totales
-        c.setDash(1, 2)
-        c.line(5*mm, curr_y, width-5*mm, curr_y)
-        c.setDash()
-        curr_y -= 10 * mm
-        
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(5*mm, curr_y, "TOTAL:")
-        c.drawRightString(width-5*mm, curr_y, f"${float(sale.total_amount):,.2f}")
-        curr_y -= 8 * mm
+        setFont("Helvetica-Bold", 12)
+        drawString(_LEFT, layout.total_y, "TOTAL:")
+        total_text = f"${_money(sale.total_amount)}"
+        drawString(_right_x(total_text, "Helvetica-Bold", 12), layout.total_y, total_text)
         
-        c.setFont("Helvetica", 8)
-        c.drawString(5*mm, curr_y, f"PAGO: {sale.payment_method.upper()}")
-        curr_y -= 15 * mm
+        setFont("Helvetica", 8)
+        drawString(_LEFT, layout.payment_y, f"PAGO: {_upper(sale.payment_method)}")
         
         # Footer
-        c.setFont("Helvetica-Oblique", 8)
-        c.drawCentredString(width/2, curr_y, "¡Gracias por su compra!")
-        curr_y -= 5 * mm
-        c.drawCentredString(width/2, curr_y, "Inventory Administration")
+        setFont("Helvetica-Oblique", 8)
+        drawString(_THANKS_X, layout.thanks_y, _FOOTER_THANKS)
+        drawString(_BRAND_X, layout.brand_y, _FOOTER_BRAND)
         
-        c.save()
-        buffer.seek(0)
-        return buffer
+        # ReportLab serializa el documento completo de una vez; generate_ticket crea el
+        # BytesIO ya con esos bytes (sin copia ni crecimiento incremental del buffer)
+        return c.getpdfdata()
@@ -0,0 +1,129 @@
+import io
+from fpdf import FPDF
+
+from .ticket_generator import (
+    _money, _upper, _HEADER_TITLE, _FOOTER_THANKS, _FOOTER_BRAND
+)
+
+# Medidas en mm (fpdf2 trabaja en mm con el origen arriba a la izquierda)
+_WIDTH = 80
+_LEFT = 5
+_RIGHT = _WIDTH - 5
+# Alto exacto, igual que TicketGenerator: encabezado + un paso por ítem + pie
+_HEADER_H = 53
+_ITEM_STRIDE = 12
+_FOOTER_H = 48
+# Dash de 1pt / hueco de 2pt, igual que el ticket de ReportLab
+_DASH = 0.35
+_GAP = 0.7
+
+# Las fuentes core de fpdf2 (Helvetica) solo cubren Latin-1 y fallan con cualquier otro
+# carácter. Igual que el ticket ESC/POS, se reemplaza la tipografía común por su
+# equivalente ASCII y el resto por "?"
+_LATIN1_FALLBACKS = str.maketrans({
+    "\u2018": "'", "\u2019": "'", "\u201a": "'", "\u201c": '"', "\u201d": '"', "\u201e": '"',
+    "\u2013": "-", "\u2014": "-", "\u2026": "...", "\u20ac": "EUR",
+})
+
+
+def _latin1(text: str) -> str:
+    """Texto imprimible con las fuentes core (Latin-1)"""
+    return text.translate(_LATIN1_FALLBACKS).encode("latin-1", errors="replace").decode("latin-1")
+
+
+class TicketGeneratorFPDF:
+    """
+    Variante del ticket de 80mm con fpdf2 (menos capas por llamada que ReportLab para
+    recibos de solo texto). Mismo contenido y diagramación que TicketGenerator; se elige
+    con settings.ticket_pdf_engine = "fpdf2".
+    """
+
+    @staticmethod
+    def generate_ticket(sale, tenant_name: str):
+        """Genera el ticket en PDF y lo retorna como BytesIO"""
+        return io.BytesIO(TicketGeneratorFPDF.render(sale, tenant_name))
+
+    @staticmethod
+    def render(sale, tenant_name: str) -> bytes:
+        """Dibuja el ticket y retorna los bytes del PDF"""
+        items = list(sale.items)
+        pdf = FPDF(orientation="P", unit="mm", format=(_WIDTH, _HEADER_H + len(items) * _ITEM_STRIDE + _FOOTER_H))
+        pdf.set_auto_page_break(False)
+        pdf.set_compression(False)
+        # Fecha fija (la de la venta): el mismo ticket da siempre los mismos bytes
+        pdf.set_creation_date(sale.created_at)
+        pdf.add_page()
+
+        def centred(y, text):
+            pdf.text((_WIDTH - pdf.get_string_width(text)) / 2, y, text)
+
+        def right(y, text):
+            pdf.text(_RIGHT - pdf.get_string_width(text), y, text)
+
+        def dashed(y):
+            pdf.set_dash_pattern(dash=_DASH, gap=_GAP)
+            pdf.line(_LEFT, y, _RIGHT, y)
+            pdf.set_dash_pattern()
+
+        # y es la línea base medida desde arriba
+        y = 10
+
+        # Header - Empresa
+        pdf.set_font("Helvetica", "B", 14)
+        centred(y, _latin1(_upper(tenant_name)))
+        y += 8
+
+        pdf.set_font("Helvetica", "", 9)
+        centred(y, _HEADER_TITLE)
+        y += 5
+
+        # Info Venta
+        dashed(y)
+        y += 6
+
+        pdf.set_font("Helvetica", "B", 9)
+        pdf.text(_LEFT, y, f"ORDEN: #{sale.id}")
+        y += 5
+
+        pdf.set_font("Helvetica", "", 8)
+        pdf.text(_LEFT, y, f"FECHA: {sale.created_at.strftime('%d/%m/%Y %H:%M')}")
+        y += 9
+
+        # Tabla de ítems
+        pdf.set_font("Helvetica", "B", 8)
+        pdf.text(_LEFT, y, "PRODUCTO")
+        right(y, "TOTAL")
+        y += 4
+
+        pdf.line(_LEFT, y, _RIGHT, y)
+        y += 6
+
+        for item in items:
+            pdf.set_font("Helvetica", "B", 8)
+            pdf.text(_LEFT, y, _latin1(_upper(item.product.name[:25])))
+            pdf.set_font("Helvetica", "", 8)
+            right(y, f"${_money(item.subtotal)}")
+            pdf.set_font("Helvetica", "", 7)
+            pdf.text(_LEFT, y + 4, f"{item.quantity} x ${_money(item.unit_price)}")
+            y += _ITEM_STRIDE
+
+        # Totales
+        dashed(y)
+        y += 10
+
+        pdf.set_font("Helvetica", "B", 12)
+        pdf.text(_LEFT, y, "TOTAL:")
+        right(y, f"${_money(sale.total_amount)}")
+        y += 8
+
+        pdf.set_font("Helvetica", "", 8)
+        pdf.text(_LEFT, y, _latin1(f"PAGO: {_upper(sale.payment_method)}"))
+        y += 15
+
+        # Footer
+        pdf.set_font("Helvetica", "I", 8)
+        centred(y, _FOOTER_THANKS)
+        y += 5
+        centred(y, _FOOTER_BRAND)
+
+        return bytes(pdf.output())
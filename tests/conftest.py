@@ -38,6 +38,11 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
     ) as ac:
         yield ac
 
+@pytest.fixture
+async def db_session() -> AsyncGenerator[AsyncSession, None]:
+    async with TestingSessionLocal() as session:
+        yield session
+
 @pytest.fixture(autouse=True)
 async def setup_db():
     # In a real scenario, we'd run migrations here or create all tables
@@ -0,0 +1,103 @@
+import asyncio
+import uuid
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.audit_listener import setup_audit_listeners
+from app.models import Tenant, Product, InventoryMovement, MovementType
+from app.models.audit_log import AuditLog
+from app.models.base import Base
+from app.models.branch import Branch
+from app.services.inventory_service import InventoryService
+
+
+@pytest.fixture
+async def stock_setup(db_session, monkeypatch):
+    # El cliente de pruebas no ejecuta el lifespan, que es quien registra los listeners
+    setup_audit_listeners(Base)
+
+    # El audit log se escribe en una sesión propia: que use la base de pruebas
+    monkeypatch.setattr(
+        "app.models.base.async_session",
+        lambda: AsyncSession(db_session.bind, expire_on_commit=False)
+    )
+
+    suffix = uuid.uuid4().hex[:8]
+    tenant = Tenant(name=f"Audit {suffix}", subdomain=f"audit-{suffix}")
+    db_session.add(tenant)
+    await db_session.flush()
+
+    branch = Branch(tenant_id=tenant.id, name="Matriz")
+    product = Product(
+        tenant_id=tenant.id, name=f"Producto {suffix}", sku=f"AUD-{suffix}",
+        price=Decimal("10.00"), stock=0, min_stock=0
+    )
+    db_session.add_all([branch, product])
+    await db_session.commit()
+    return tenant, branch, product
+
+
+async def wait_for_audit(db_session, tenant_id: int, entity_type: str, entity_id: int, action: str):
+    """El audit log se inserta en una tarea en segundo plano: esperar a que aparezca"""
+    for _ in range(50):
+        result = await db_session.execute(
+            select(AuditLog).where(
+                AuditLog.tenant_id == tenant_id,
+                AuditLog.entity_type == entity_type,
+                AuditLog.entity_id == entity_id,
+                AuditLog.action == action
+            )
+        )
+        audit = result.scalars().first()
+        if audit is not None:
+            return audit
+        await asyncio.sleep(0.1)
+    return None
+
+
+@pytest.mark.asyncio
+async def test_add_stock_writes_movement_and_audit_log(db_session, stock_setup):
+    tenant, branch, product = stock_setup
+
+    movement = await InventoryService(db_session).add_stock(
+        product_id=product.id, branch_id=branch.id, quantity=5, tenant_id=tenant.id
+    )
+
+    result = await db_session.execute(
+        select(InventoryMovement).where(InventoryMovement.id == movement.id)
+    )
+    stored = result.scalar_one()
+    assert stored.movement_type == MovementType.ENTRY
+    assert (stored.quantity, stored.stock_before, stored.stock_after) == (5, 0, 5)
+
+    assert await wait_for_audit(db_session, tenant.id, "InventoryMovement", movement.id, "CREATE") is not None
+
+
+@pytest.mark.asyncio
+async def test_bulk_stock_writes_movements_and_audit_logs(db_session, stock_setup):
+    tenant, branch, product = stock_setup
+    service = InventoryService(db_session)
+
+    await service.add_stock_bulk(
+        [{"product_id": product.id, "branch_id": branch.id, "quantity": 8}], tenant.id
+    )
+    movements = await service.remove_stock_bulk(
+        [
+            {"product_id": product.id, "branch_id": branch.id, "quantity": 2},
+            {"product_id": product.id, "branch_id": branch.id, "quantity": 1},
+        ],
+        tenant.id
+    )
+
+    assert [m.stock_after for m in movements] == [6, 5]
+    await db_session.refresh(product)
+    assert product.stock == 5
+
+    for movement in movements:
+        assert await wait_for_audit(db_session, tenant.id, "InventoryMovement", movement.id, "CREATE") is not None
+    audit = await wait_for_audit(db_session, tenant.id, "Product", product.id, "UPDATE")
+    assert audit is not None
+    assert "stock" in audit.new_values
@@ -0,0 +1,105 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+
+from app.main import app
+from app.dependencies import get_current_tenant
+from app.models import Tenant, Product, Sale, SaleItem
+from app.services.ticket_generator import TicketGenerator, _render_snapshot, _ticket_snapshot
+from app.services.ticket_generator_fpdf import TicketGeneratorFPDF
+
+NON_LATIN1_NAME = "Café “Premium” — 500g"
+
+
+def make_sale(product_name: str):
+    item = SimpleNamespace(
+        product_id=1, product=SimpleNamespace(name=product_name),
+        quantity=2, unit_price=Decimal("3.50"), subtotal=Decimal("7.00")
+    )
+    return SimpleNamespace(
+        id=7, items=[item], created_at=datetime(2026, 1, 2, 3, 4), updated_at=None,
+        total_amount=Decimal("7.00"), payment_method="cash"
+    )
+
+
+@pytest.mark.parametrize("engine", ["reportlab", "fpdf2"])
+def test_ticket_renders_non_latin1_text(engine):
+    sale = make_sale(NON_LATIN1_NAME)
+
+    pdf = _render_snapshot(_ticket_snapshot(sale, sale.items), "Panadería “Él”", engine)
+
+    assert pdf.startswith(b"%PDF")
+
+
+def test_fpdf_ticket_replaces_typographic_characters():
+    pdf = TicketGeneratorFPDF.render(make_sale(NON_LATIN1_NAME), "Demo")
+
+    # Sin compresión: el texto saneado (Latin-1) aparece tal cual en el contenido
+    assert 'CAFÉ "PREMIUM" - 500G'.encode("latin-1") in pdf
+
+
+def test_ticket_render_is_deterministic():
+    sale = make_sale("Producto")
+
+    assert TicketGenerator._render_ticket(sale, sale.items, "Demo") == \
+        TicketGenerator._render_ticket(sale, sale.items, "Demo")
+
+
+@pytest.fixture
+async def sale_setup(db_session):
+    suffix = uuid.uuid4().hex[:8]
+    tenant = Tenant(name=f"Ticket {suffix}", subdomain=f"ticket-{suffix}")
+    db_session.add(tenant)
+    await db_session.flush()
+
+    product = Product(
+        tenant_id=tenant.id, name=NON_LATIN1_NAME, sku=f"TKT-{suffix}",
+        price=Decimal("3.50"), stock=10
+    )
+    db_session.add(product)
+    await db_session.flush()
+
+    sale = Sale(tenant_id=tenant.id, total_amount=Decimal("7.00"), payment_method="cash")
+    sale.items.append(SaleItem(
+        product_id=product.id, quantity=2, unit_price=Decimal("3.50"), subtotal=Decimal("7.00")
+    ))
+    db_session.add(sale)
+    await db_session.commit()
+
+    app.dependency_overrides[get_current_tenant] = lambda: tenant.id
+    yield sale
+    app.dependency_overrides.pop(get_current_tenant, None)
+
+
+@pytest.mark.asyncio
+async def test_ticket_etag_round_trip(client: AsyncClient, sale_setup):
+    url = f"/api/v1/sales/{sale_setup.id}/ticket"
+
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.content.startswith(b"%PDF")
+    etag = response.headers["etag"]
+
+    cached = await client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    stale = await client.get(url, headers={"If-None-Match": '"otro"'})
+    assert stale.status_code == 200
+    assert stale.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_ticket_etag_weak_and_list_match(client: AsyncClient, sale_setup):
+    url = f"/api/v1/sales/{sale_setup.id}/ticket"
+    etag = (await client.get(url)).headers["etag"]
+
+    for header in (f"W/{etag}", f'"otro", {etag}', "*"):
+        cached = await client.get(url, headers={"If-None-Match": header})
+        assert cached.status_code == 304